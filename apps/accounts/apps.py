@@ -4,4 +4,7 @@ from django.apps import AppConfig
 class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.accounts'
-    verbose_name = '사용자 계정'
\ No newline at end of file
+    verbose_name = '사용자 계정'
+
+    def ready(self):
+        from apps.accounts import signals  # noqa: F401
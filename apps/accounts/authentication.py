@@ -0,0 +1,183 @@
+"""
+JWT 인증
+
+- StatelessJWTAuthentication: 토큰 claim(user_id, username, is_staff)으로 사용자 객체를 만들어 DB 를 조회하지 않는다
+  조회 API 와 관리자 권한(IsAdminUser) 확인에 사용
+- CachedJWTAuthentication: 실제 사용자 행이 필요한 경로용, 조회한 사용자를 짧은 시간 캐시에 둔다 (기본 인증)
+
+비활성화/권한 변경/비밀번호 변경된 사용자는 TokenRevocation 으로 그 시각 이전에 발급된 access 토큰을 거절한다.
+서명 검증을 마친 토큰은 프로세스별 LRU(VerifiedTokenCache)에 만료 시각까지 두어 같은 토큰을 다시 검증하지 않는다.
+(폐기 여부는 캐시와 관계없이 요청마다 확인)
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework_simplejwt.authentication import JWTAuthentication, JWTStatelessUserAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+
+class TokenRevocation:
+    """
+    사용자별 토큰 폐기 시각 (access 토큰 수명 동안만 보관)
+
+    iat 는 초 단위라 폐기 직후 같은 초에 발급된 토큰을 구분할 수 없으므로,
+    발급 시각(ms)을 별도 claim 으로 넣고 폐기 시각(ms)보다 이전인 토큰만 거절한다.
+    """
+
+    KEY = 'accounts:revoked_before:{user_id}'
+    ISSUED_AT_CLAIM = 'iat_ms'
+
+    @classmethod
+    def stamp(cls, token: Token) -> None:
+        """발급하는 access 토큰에 발급 시각(ms) 기록"""
+        token[cls.ISSUED_AT_CLAIM] = int(time.time() * 1000)
+
+    @classmethod
+    def revoke(cls, user_id: int) -> None:
+        """지금까지 발급된 user_id 의 access 토큰 폐기"""
+        cache.set(
+            cls.KEY.format(user_id=user_id),
+            int(time.time() * 1000),
+            int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+        )
+        cache.delete(CachedJWTAuthentication.KEY.format(user_id=user_id))
+
+    @classmethod
+    def revoke_on_commit(cls, user_id: int) -> None:
+        transaction.on_commit(lambda: cls.revoke(user_id))
+
+    @classmethod
+    def is_revoked(cls, token: Token) -> bool:
+        revoked_before = cache.get(cls.KEY.format(user_id=token.get(api_settings.USER_ID_CLAIM)))
+        if revoked_before is None:
+            return False
+        # iat_ms 가 없는 토큰은 iat(초)로, 둘 다 없으면 발급 시각을 알 수 없으므로 거절
+        issued_at = token.get(cls.ISSUED_AT_CLAIM)
+        if issued_at is None:
+            issued_at = token.get('iat', 0) * 1000
+        return issued_at < revoked_before
+
+
+class VerifiedTokenCache:
+    """검증된 access 토큰 LRU (원본 토큰의 해시 → (토큰, 만료 시각))"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: 'OrderedDict[bytes, Tuple[Token, int]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(raw_token: bytes) -> bytes:
+        return hashlib.sha256(raw_token).digest()
+
+    def get(self, raw_token: bytes) -> Optional[Token]:
+        key = self._key(raw_token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                # 만료된 토큰은 다시 검증해 만료 오류를 돌려주도록 제거
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, raw_token: bytes, token: Token) -> None:
+        if self.max_size <= 0 or 'exp' not in token:
+            return
+        key = self._key(raw_token)
+        with self._lock:
+            self._entries[key] = (token, token['exp'])
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_token_cache: Optional[VerifiedTokenCache] = None
+_token_cache_lock = threading.Lock()
+
+
+def get_token_cache() -> VerifiedTokenCache:
+    global _token_cache
+
+    if _token_cache is None:
+        with _token_cache_lock:
+            if _token_cache is None:
+                _token_cache = VerifiedTokenCache(settings.ACCOUNTS_TOKEN_CACHE_SIZE)
+    return _token_cache
+
+
+class VerifiedTokenCacheMixin:
+    """검증된 토큰은 만료 전까지 다시 파싱/서명 검증하지 않음"""
+
+    def get_validated_token(self, raw_token: bytes) -> Token:
+        token_cache = get_token_cache()
+        if token_cache.max_size <= 0:
+            return super().get_validated_token(raw_token)
+
+        token = token_cache.get(raw_token)
+        if token is None:
+            token = super().get_validated_token(raw_token)
+            token_cache.put(raw_token, token)
+        return token
+
+
+class StatelessJWTAuthentication(VerifiedTokenCacheMixin, JWTStatelessUserAuthentication):
+    """토큰 claim 으로 만든 TokenUser 반환 (사용자 테이블 조회 없음)"""
+
+    def get_user(self, validated_token: Token):
+        if TokenRevocation.is_revoked(validated_token):
+            raise AuthenticationFailed("폐기된 토큰입니다.", code='token_revoked')
+        return super().get_user(validated_token)
+
+
+class CachedJWTAuthentication(VerifiedTokenCacheMixin, JWTAuthentication):
+    """사용자 행을 ACCOUNTS_USER_CACHE_SECONDS 동안 캐시 (0 이면 매 요청 조회)"""
+
+    KEY = 'accounts:user:{user_id}'
+
+    def get_user(self, validated_token: Token):
+        if TokenRevocation.is_revoked(validated_token):
+            raise AuthenticationFailed("폐기된 토큰입니다.", code='token_revoked')
+
+        timeout = settings.ACCOUNTS_USER_CACHE_SECONDS
+        if not timeout:
+            return super().get_user(validated_token)
+
+        key = self.KEY.format(user_id=validated_token.get(api_settings.USER_ID_CLAIM))
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache.set(key, user, timeout)
+        return user
@@ -32,6 +32,18 @@ class LoginSerializer(serializers.Serializer):
         return LoginDTO(**self.validated_data)
 
 
+class RefreshTokenSerializer(serializers.Serializer):
+    """토큰 갱신/로그아웃 요청 시리얼라이저"""
+
+    refresh = serializers.CharField(
+        required=True,
+        allow_blank=False,
+        error_messages={
+            'required': 'refresh 토큰을 입력해주세요.',
+            'blank': 'refresh 토큰을 입력해주세요.'
+        }
+    )
+
 
 class UserSerializer(serializers.ModelSerializer):
     """사용자 정보 시리얼라이저"""
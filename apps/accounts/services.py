@@ -1,14 +1,37 @@
-from datetime import timedelta
-from typing import Dict, Optional
+import asyncio
+import logging
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Dict, Optional, Tuple
 
 from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth.models import update_last_login
 from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Case, DateTimeField, Value, When
+from django_redis import get_redis_connection
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from apps.accounts.authentication import TokenRevocation
 from apps.accounts.dto import LoginDTO
+from apps.accounts.tokens import BlacklistedRefreshToken, RefreshTokenBlacklist
 
 User = get_user_model()
 
+logger = logging.getLogger(__name__)
+
+
+# KEYS: 마지막 로그인 해시 / 해시 전체를 꺼내고 비움
+TAKE_ALL_SCRIPT = """
+local entries = redis.call('HGETALL', KEYS[1])
+redis.call('DEL', KEYS[1])
+return entries
+"""
+
 
 class JWTService:
 
@@ -19,14 +42,250 @@ class JWTService:
         access_token = refresh.access_token
         access_token['username'] = user.username
         access_token['is_staff'] = user.is_staff
+        TokenRevocation.stamp(access_token)
 
         return {
             'access': str(access_token),
             'refresh': str(refresh)
         }
 
+    def rotate_refresh_token(self, raw_refresh: str) -> Dict[str, str]:
+        """
+        refresh 토큰을 폐기하고 새 access/refresh 토큰 발급
+
+        폐기 여부는 Redis 에서만 확인하고, 새 access 토큰의 claim(username, is_staff)을 채우기 위해 사용자만 조회한다.
+        이미 쓰인(폐기된) 토큰이나 비활성 사용자의 토큰은 InvalidToken
+        """
+        refresh = self._load_refresh_token(raw_refresh)
+
+        user = User.objects.filter(pk=refresh.payload.get(api_settings.USER_ID_CLAIM), is_active=True).first()
+        if user is None:
+            raise InvalidToken('사용자를 찾을 수 없거나 비활성화된 사용자입니다.')
+
+        # 동시에 같은 토큰으로 갱신하면 먼저 폐기한 요청만 새 토큰을 받음
+        if not refresh.blacklist():
+            raise InvalidToken('폐기된 토큰입니다.')
+
+        return self.create_tokens_for_user(user)
+
+    def revoke_refresh_token(self, raw_refresh: str) -> None:
+        """로그아웃, refresh 토큰 폐기 (이미 폐기된 토큰이어도 성공)"""
+        refresh = self._load_refresh_token(raw_refresh, RefreshToken)
+        RefreshTokenBlacklist().add(refresh.payload[api_settings.JTI_CLAIM], refresh.payload['exp'])
+
+    def _load_refresh_token(self, raw_refresh: str, token_class=BlacklistedRefreshToken) -> RefreshToken:
+        try:
+            return token_class(raw_refresh)
+        except TokenError as e:
+            raise InvalidToken(e.args[0])
+
+
+# KEYS: 제한 키들 / ARGV: 창 길이(ms), 키별 허용 횟수..., 시도 ID
+# 반환: 0 이면 허용(시도 기록), 아니면 다시 시도할 수 있을 때까지 남은 ms
+SLIDING_WINDOW_SCRIPT = """
+local now = redis.call('TIME')
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local window = tonumber(ARGV[1])
+
+for i, key in ipairs(KEYS) do
+    redis.call('ZREMRANGEBYSCORE', key, 0, now_ms - window)
+    if redis.call('ZCARD', key) >= tonumber(ARGV[1 + i]) then
+        local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+        return math.max(1, tonumber(oldest[2]) + window - now_ms)
+    end
+end
+
+for _, key in ipairs(KEYS) do
+    redis.call('ZADD', key, now_ms, ARGV[#ARGV])
+    redis.call('PEXPIRE', key, window)
+end
+return 0
+"""
+
+
+_login_redis = None
+
+
+def get_login_redis():
+    """로그인 시도 제한용 비동기 Redis 클라이언트 (프로세스당 하나, 연결 풀 공유)"""
+    global _login_redis
+    if _login_redis is None:
+        from redis import asyncio as redis_asyncio
+        _login_redis = redis_asyncio.from_url(settings.REDIS_URL)
+    return _login_redis
+
+
+class LoginRateLimiter:
+    """
+    사용자명/IP 별 로그인 시도 횟수 제한 (Redis sorted set 슬라이딩 윈도)
+
+    비밀번호 해시 검증 전에 확인해 무차별 대입 요청에 CPU 를 쓰지 않는다.
+    시도는 검증 전에 기록하고, 로그인에 성공하면 그 시도를 지워 실패한 시도만 제한에 남긴다.
+    (같은 IP 뒤의 여러 사용자가 정상 로그인으로 IP 제한을 채우지 않음)
+    Redis 를 쓸 수 없으면 제한하지 않는다. (로그인 자체는 막지 않음)
+    """
+
+    USERNAME_KEY = 'vehicle_auction:login_attempts:username:{username}'
+    IP_KEY = 'vehicle_auction:login_attempts:ip:{ip}'
+
+    WINDOW_SECONDS = 60
+    USERNAME_LIMIT = 10
+    IP_LIMIT = 30
+
+    # 스크립트는 프로세스에서 한 번만 등록하고 호출할 때 클라이언트를 넘긴다
+    _script = None
+
+    def __init__(self, client=None):
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_login_redis()
+        return self._client
+
+    def _keys(self, username: str, ip: str):
+        return [self.USERNAME_KEY.format(username=username.lower()), self.IP_KEY.format(ip=ip)]
+
+    async def hit(self, username: str, ip: str) -> Tuple[float, str]:
+        """
+        시도 기록, (제한에 걸리면 다시 시도할 수 있을 때까지 남은 초, 허용이면 0), 시도 ID 반환
+        """
+        attempt_id = uuid.uuid4().hex
+        try:
+            if LoginRateLimiter._script is None:
+                LoginRateLimiter._script = self.client.register_script(SLIDING_WINDOW_SCRIPT)
+            retry_after_ms = await LoginRateLimiter._script(
+                keys=self._keys(username, ip),
+                args=[self.WINDOW_SECONDS * 1000, self.USERNAME_LIMIT, self.IP_LIMIT, attempt_id],
+                client=self.client
+            )
+        except Exception:
+            logger.warning("로그인 시도 제한 확인 실패, 제한 없이 진행", exc_info=True)
+            return 0, attempt_id
+        return int(retry_after_ms) / 1000, attempt_id
+
+    async def release(self, username: str, ip: str, attempt_id: str) -> None:
+        """로그인 성공 시 사용자명 기준 시도 기록 삭제, IP 기준에서는 이번 시도만 삭제"""
+        username_key, ip_key = self._keys(username, ip)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.delete(username_key)
+            pipe.zrem(ip_key, attempt_id)
+            await pipe.execute()
+        except Exception:
+            logger.warning("로그인 시도 기록 삭제 실패", exc_info=True)
+
+
+_hash_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_hash_executor() -> ThreadPoolExecutor:
+    """비밀번호 해시 전용 스레드 풀 (동시에 해시하는 수를 LOGIN_HASH_WORKERS 로 제한)"""
+    global _hash_executor
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(
+            max_workers=settings.LOGIN_HASH_WORKERS, thread_name_prefix='login-hash'
+        )
+    return _hash_executor
+
 
 class AccountService:
 
     def authenticate_user(self, login_data: LoginDTO) -> Optional[User]:
         return authenticate(username=login_data.username, password=login_data.password)
+
+    async def authenticate_user_async(self, login_data: LoginDTO) -> Optional[User]:
+        """
+        authenticate_user 의 비동기 버전
+
+        authenticate() 를 해시 전용 스레드 풀에서 실행해 이벤트 루프를 막지 않는다.
+        AUTHENTICATION_BACKENDS 와 user_login_failed 시그널은 동기 로그인과 같이 동작한다.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_hash_executor(), self._authenticate_in_pool, login_data.username, login_data.password
+        )
+
+    def _authenticate_in_pool(self, username: str, password: str) -> Optional[User]:
+        # 풀 스레드는 요청 시작/종료 시그널을 받지 않으므로 끊기거나 오래된 DB 연결을 직접 정리
+        close_old_connections()
+        return authenticate(username=username, password=password)
+
+    def record_login(self, user: User) -> None:
+        """
+        로그인 시각은 모아 두었다가 flush_last_logins 가 한 번에 반영 (로그인 요청에서 UPDATE 하지 않음)
+
+        캐시가 Redis 가 아니면 모아 둘 곳이 없으므로 바로 반영한다.
+        """
+        buffer = LastLoginBuffer()
+        if buffer.is_available():
+            buffer.record(user.id)
+        else:
+            update_last_login(None, user)
+
+
+class LastLoginBuffer:
+    """
+    사용자별 마지막 로그인 시각을 Redis 해시에 모아 두고 주기적으로 묶어서 UPDATE
+
+    같은 사용자가 여러 번 로그인하면 마지막 시각만 남는다.
+    """
+
+    KEY = 'vehicle_auction:last_login'
+
+    BATCH_SIZE = 500
+
+    def __init__(self, client=None):
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_redis_connection('default')
+        return self._client
+
+    def is_available(self) -> bool:
+        """default 캐시가 django_redis 인지 (아니면 get_redis_connection 이 NotImplementedError)"""
+        try:
+            return self.client is not None
+        except NotImplementedError:
+            return False
+
+    def record(self, user_id: int, at: Optional[float] = None) -> None:
+        """로그인 시각 기록 (실패해도 로그인은 막지 않음)"""
+        try:
+            self.client.hset(self.KEY, user_id, at or time.time())
+        except Exception:
+            logger.warning(f"마지막 로그인 기록 실패: user_id={user_id}", exc_info=True)
+
+    def flush(self) -> int:
+        """모인 로그인 시각을 반영, 반영한 사용자 수 반환"""
+        entries = self.client.register_script(TAKE_ALL_SCRIPT)(keys=[self.KEY])
+        if not entries:
+            return 0
+
+        last_logins = {int(user_id): float(at) for user_id, at in zip(entries[0::2], entries[1::2])}
+        try:
+            user_ids = list(last_logins)
+            for start in range(0, len(user_ids), self.BATCH_SIZE):
+                self._update(user_ids[start:start + self.BATCH_SIZE], last_logins)
+        except Exception:
+            # 반영하지 못한 시각을 되돌려 놓음 (그 사이 새로 기록된 시각이 있으면 그대로 둠)
+            pipe = self.client.pipeline(transaction=False)
+            for user_id, at in last_logins.items():
+                pipe.hsetnx(self.KEY, user_id, at)
+            pipe.execute()
+            raise
+        return len(last_logins)
+
+    def _update(self, user_ids, last_logins: Dict[int, float]) -> None:
+        User.objects.filter(id__in=user_ids).update(
+            last_login=Case(
+                *[
+                    When(id=user_id, then=Value(datetime.fromtimestamp(last_logins[user_id], dt_timezone.utc)))
+                    for user_id in user_ids
+                ],
+                output_field=DateTimeField()
+            )
+        )
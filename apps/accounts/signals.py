@@ -0,0 +1,36 @@
+"""
+사용자 비활성화/권한 변경/비밀번호 변경 시 발급된 access 토큰 폐기
+
+StatelessJWTAuthentication 은 사용자 행을 조회하지 않으므로 토큰에 담긴 is_staff 를 그대로 믿는다.
+이런 변경이 커밋되면 그 전에 발급된 토큰을 거절하도록 폐기 시각을 기록한다.
+"""
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from apps.accounts.authentication import TokenRevocation
+
+User = get_user_model()
+
+REVOKING_FIELDS = ('is_active', 'is_staff', 'is_superuser', 'password')
+
+
+@receiver(pre_save, sender=User)
+def detect_revoking_change(sender, instance, raw=False, update_fields=None, **kwargs):
+    instance._revoke_tokens = False
+    if raw or instance.pk is None:
+        return
+    fields = [field for field in REVOKING_FIELDS if update_fields is None or field in update_fields]
+    if not fields:
+        return
+
+    previous = User.objects.filter(pk=instance.pk).values(*fields).first()
+    instance._revoke_tokens = previous is not None and any(
+        previous[field] != getattr(instance, field) for field in fields
+    )
+
+
+@receiver(post_save, sender=User)
+def revoke_tokens_on_user_change(sender, instance, created, raw=False, **kwargs):
+    if getattr(instance, '_revoke_tokens', False):
+        TokenRevocation.revoke_on_commit(instance.pk)
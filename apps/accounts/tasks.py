@@ -0,0 +1,16 @@
+from celery import shared_task
+from celery.utils.log import get_task_logger
+
+logger = get_task_logger(__name__)
+
+
+@shared_task
+def flush_last_logins() -> int:
+    """모아 둔 마지막 로그인 시각을 users 테이블에 반영"""
+
+    from apps.accounts.services import LastLoginBuffer
+
+    flushed = LastLoginBuffer().flush()
+    if flushed:
+        logger.info(f"마지막 로그인 시각 반영: {flushed}명")
+    return flushed
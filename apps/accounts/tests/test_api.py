@@ -1,14 +1,20 @@
+import time
+
 from django.test import TestCase
 from rest_framework.test import APIClient
 from rest_framework import status
 from django.contrib.auth import get_user_model
 
+from apps.accounts.services import LastLoginBuffer
+from apps.common.testing import FakeRedisMixin
+
 User = get_user_model()
 
 
-class TestAuthenticationAPI(TestCase):
+class TestAuthenticationAPI(FakeRedisMixin, TestCase):
     """인증 API 테스트"""
     def setUp(self):
+        self.redis = self.use_fake_redis(LastLoginBuffer)
         self.client = APIClient()
         self.user = User.objects.create_user(
             username='testuser',
@@ -34,6 +40,11 @@ class TestAuthenticationAPI(TestCase):
         self.assertEqual(data['user']['id'], self.user.id)
         self.assertEqual(data['user']['username'], 'testuser')
 
+        # 로그인 시각은 버퍼에만 기록
+        self.assertAlmostEqual(float(self.redis.hget(LastLoginBuffer.KEY, self.user.id)), time.time(), delta=5)
+        self.user.refresh_from_db()
+        self.assertIsNone(self.user.last_login)
+
     def test_login_wrong_password(self):
         response = self.client.post(
             '/api/auth/login/',
@@ -95,10 +106,29 @@ class TestAuthenticationAPI(TestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
 
-class TestProtectedEndpoints(TestCase):
+class TestLastLoginWithoutRedis(TestCase):
+    """default 캐시가 Redis 가 아닐 때(테스트 설정의 LocMemCache 등) 로그인 시각 반영"""
+
+    def test_login_updates_last_login_directly(self):
+        user = User.objects.create_user(username='testuser', password='testpass123')
+
+        with self.assertNoLogs('apps.accounts.services', level='WARNING'):
+            response = APIClient().post(
+                '/api/auth/login/',
+                data={'username': 'testuser', 'password': 'testpass123'},
+                format='json'
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        user.refresh_from_db()
+        self.assertIsNotNone(user.last_login)
+
+
+class TestProtectedEndpoints(FakeRedisMixin, TestCase):
     """인증이 필요한 엔드포인트 테스트"""
 
     def setUp(self):
+        self.use_fake_redis(LastLoginBuffer)
         self.client = APIClient()
         self.user = User.objects.create_user(
             username='testuser',
@@ -144,10 +174,11 @@ class TestProtectedEndpoints(TestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
-class TestLoginResponseFormat(TestCase):
+class TestLoginResponseFormat(FakeRedisMixin, TestCase):
     """로그인 응답 형식 테스트"""
 
     def setUp(self):
+        self.use_fake_redis(LastLoginBuffer)
         self.client = APIClient()
 
     def test_login_response_structure(self):
@@ -0,0 +1,217 @@
+from unittest import mock
+
+from django.test import TestCase, RequestFactory
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from freezegun import freeze_time
+from rest_framework.test import APIClient
+from rest_framework import status
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.accounts.authentication import (
+    CachedJWTAuthentication, StatelessJWTAuthentication, VerifiedTokenCache, get_token_cache
+)
+from apps.accounts.services import JWTService
+from apps.vehicles.models import Brand, CarType, Model, Vehicle
+from apps.auctions.models import Auction, AuctionHistory
+
+User = get_user_model()
+
+
+class JWTAuthenticationTestCase(TestCase):
+    """토큰 claim 기반 인증/사용자 캐시/토큰 폐기 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.staff = User.objects.create_user(username='auth_staff', password='adminpass', is_staff=True)
+        self.factory = RequestFactory()
+
+    def _request(self, user):
+        access = JWTService().create_tokens_for_user(user)['access']
+        return self.factory.get('/', HTTP_AUTHORIZATION=f'Bearer {access}')
+
+    def _revoke_by_saving(self, **fields):
+        for field, value in fields.items():
+            setattr(self.staff, field, value)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.staff.save()
+
+    def test_stateless_builds_user_from_claims(self):
+        request = self._request(self.staff)
+
+        with self.assertNumQueries(0):
+            user, _ = StatelessJWTAuthentication().authenticate(request)
+
+        self.assertIsInstance(user, TokenUser)
+        self.assertEqual((user.id, user.username, user.is_staff), (self.staff.id, 'auth_staff', True))
+
+    def test_deactivation_revokes_issued_tokens(self):
+        request = self._request(self.staff)
+
+        self._revoke_by_saving(is_active=False)
+
+        with self.assertRaises(AuthenticationFailed):
+            StatelessJWTAuthentication().authenticate(request)
+
+    def test_staff_demotion_revokes_issued_tokens(self):
+        request = self._request(self.staff)
+
+        self._revoke_by_saving(is_staff=False)
+
+        with self.assertRaises(AuthenticationFailed):
+            StatelessJWTAuthentication().authenticate(request)
+
+    def test_token_issued_right_after_revocation_is_accepted(self):
+        with freeze_time('2026-01-01 12:00:00.100'):
+            old_request = self._request(self.staff)
+        with freeze_time('2026-01-01 12:00:00.200'):
+            self._revoke_by_saving(is_staff=False)
+
+        # 폐기와 같은 초에 새로 발급한 토큰은 유효
+        with freeze_time('2026-01-01 12:00:00.900'):
+            new_request = self._request(self.staff)
+            user, _ = StatelessJWTAuthentication().authenticate(new_request)
+            self.assertEqual(user.id, self.staff.id)
+
+            with self.assertRaises(AuthenticationFailed):
+                StatelessJWTAuthentication().authenticate(old_request)
+
+    def test_unrelated_change_keeps_tokens(self):
+        request = self._request(self.staff)
+
+        self._revoke_by_saving(email='staff@example.com')
+
+        user, _ = StatelessJWTAuthentication().authenticate(request)
+        self.assertEqual(user.id, self.staff.id)
+
+    def test_cached_authentication_loads_user_once(self):
+        request = self._request(self.staff)
+
+        with self.assertNumQueries(1):
+            CachedJWTAuthentication().authenticate(request)
+        with self.assertNumQueries(0):
+            user, _ = CachedJWTAuthentication().authenticate(request)
+
+        self.assertIsInstance(user, User)
+        self.assertEqual(user.id, self.staff.id)
+
+    def test_revocation_clears_cached_user(self):
+        request = self._request(self.staff)
+        CachedJWTAuthentication().authenticate(request)
+
+        self._revoke_by_saving(is_active=False)
+
+        with self.assertRaises(AuthenticationFailed):
+            CachedJWTAuthentication().authenticate(request)
+
+    def test_admin_endpoint_with_stateless_user(self):
+        brand = Brand.objects.create(name='현대')
+        car_type = CarType.objects.create(brand=brand, name='SUV')
+        model = Model.objects.create(car_type=car_type, name='팰리세이드')
+        vehicle = Vehicle.objects.create(
+            year=2022,
+            first_registration_date='2022-03-01',
+            model=model,
+            color='블랙',
+            fuel_type=Vehicle.FuelType.GASOLINE,
+            transmission=Vehicle.Transmission.AUTO,
+            mileage=10000,
+            region='서울'
+        )
+        Auction.objects.create(vehicle=vehicle, status=Auction.Status.PENDING)
+        client = APIClient()
+        access = JWTService().create_tokens_for_user(self.staff)['access']
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+
+        response = client.post(f'/api/auctions/{vehicle.id}/approve/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            AuctionHistory.objects.get(vehicle=vehicle).user_id, self.staff.id
+        )
+
+    def test_admin_endpoint_rejects_non_staff_claims(self):
+        user = User.objects.create_user(username='auth_user', password='userpass')
+        client = APIClient()
+        access = JWTService().create_tokens_for_user(user)['access']
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+
+        response = client.post('/api/auctions/bulk-approve/', {'vehicle_ids': [1]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class VerifiedTokenCacheTestCase(TestCase):
+    """검증된 토큰 LRU 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        get_token_cache().clear()
+        self.addCleanup(cache.clear)
+        self.addCleanup(get_token_cache().clear)
+        self.staff = User.objects.create_user(username='token_cache_staff', password='adminpass', is_staff=True)
+        self.factory = RequestFactory()
+
+    def _request(self, access):
+        return self.factory.get('/', HTTP_AUTHORIZATION=f'Bearer {access}')
+
+    def test_verifies_same_token_once(self):
+        access = JWTService().create_tokens_for_user(self.staff)['access']
+
+        with mock.patch.object(AccessToken, 'verify', autospec=True, side_effect=AccessToken.verify) as verify:
+            for _ in range(3):
+                StatelessJWTAuthentication().authenticate(self._request(access))
+
+        self.assertEqual(verify.call_count, 1)
+        self.assertEqual(get_token_cache().stats()['hits'], 2)
+        self.assertEqual(get_token_cache().stats()['misses'], 1)
+
+    def test_expired_token_is_verified_again(self):
+        with freeze_time('2026-01-01 12:00:00'):
+            access = JWTService().create_tokens_for_user(self.staff)['access']
+            StatelessJWTAuthentication().authenticate(self._request(access))
+
+        # access 토큰 수명(30분) 경과
+        with freeze_time('2026-01-01 12:31:00'):
+            with self.assertRaises(InvalidToken):
+                StatelessJWTAuthentication().authenticate(self._request(access))
+
+        self.assertEqual(get_token_cache().stats()['size'], 0)
+
+    def test_least_recently_used_token_is_evicted(self):
+        token_cache = VerifiedTokenCache(max_size=2)
+        tokens = [AccessToken.for_user(self.staff) for _ in range(3)]
+
+        token_cache.put(b'a', tokens[0])
+        token_cache.put(b'b', tokens[1])
+        token_cache.get(b'a')
+        token_cache.put(b'c', tokens[2])
+
+        self.assertIsNone(token_cache.get(b'b'))
+        self.assertIs(token_cache.get(b'a'), tokens[0])
+        self.assertEqual(token_cache.stats()['evictions'], 1)
+
+    def test_revocation_applies_to_cached_token(self):
+        access = JWTService().create_tokens_for_user(self.staff)['access']
+        StatelessJWTAuthentication().authenticate(self._request(access))
+
+        self.staff.is_staff = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.staff.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            StatelessJWTAuthentication().authenticate(self._request(access))
+
+    def test_stats_endpoint(self):
+        client = APIClient()
+        access = JWTService().create_tokens_for_user(self.staff)['access']
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+
+        client.get('/api/auth/token-cache/')
+        response = client.get('/api/auth/token-cache/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data['hits'], response.data['misses']), (1, 1))
@@ -0,0 +1,133 @@
+from unittest import mock
+
+from django.test import TransactionTestCase
+from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth.signals import user_login_failed
+
+from apps.accounts import services
+from apps.accounts.services import LastLoginBuffer, LoginRateLimiter
+from apps.common.testing import FakeRedisMixin
+
+User = get_user_model()
+
+
+class AsyncLoginTestCase(FakeRedisMixin, TransactionTestCase):
+    """
+    비동기 로그인/시도 횟수 제한 테스트
+
+    authenticate() 가 해시 스레드 풀의 다른 DB 연결에서 실행되므로 커밋된 데이터로 테스트한다.
+    """
+
+    def setUp(self):
+        self.use_fake_redis(LastLoginBuffer)
+        self.redis = self.use_fake_async_redis(LoginRateLimiter)
+        self.user = User.objects.create_user(username='async_user', password='testpass123')
+
+    async def _login(self, password='testpass123', username='async_user', ip='10.0.0.1'):
+        return await self.async_client.post(
+            '/api/auth/login/async/',
+            {'username': username, 'password': password},
+            content_type='application/json',
+            headers={'X-Forwarded-For': ip}
+        )
+
+    async def _age_attempts(self, seconds):
+        """기록된 시도를 모두 seconds 초 전으로 옮김"""
+        async for key in self.redis.scan_iter('vehicle_auction:login_attempts:*'):
+            attempts = await self.redis.zrange(key, 0, -1, withscores=True)
+            await self.redis.zadd(key, {member: score - seconds * 1000 for member, score in attempts})
+
+    async def test_login_success(self):
+        response = await self._login()
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertIn('access', data)
+        self.assertIn('refresh', data)
+        self.assertEqual(data['user']['id'], self.user.id)
+        # 성공 시 사용자명 기준 시도 기록 삭제
+        self.assertFalse(await self.redis.exists(LoginRateLimiter.USERNAME_KEY.format(username='async_user')))
+
+    async def test_login_wrong_password(self):
+        response = await self._login(password='wrongpassword')
+
+        self.assertEqual(response.status_code, 401)
+        self.assertNotIn('access', response.json())
+
+    async def test_login_failure_goes_through_auth_backends(self):
+        failures = []
+
+        def receiver(sender, credentials, **kwargs):
+            failures.append(credentials['username'])
+
+        user_login_failed.connect(receiver)
+        self.addCleanup(user_login_failed.disconnect, receiver)
+
+        response = await self._login(password='wrongpassword')
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(failures, ['async_user'])
+
+    async def test_login_invalid_body(self):
+        response = await self.async_client.post(
+            '/api/auth/login/async/', 'not json', content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    async def test_username_limit_rejects_before_hashing(self):
+        for _ in range(LoginRateLimiter.USERNAME_LIMIT):
+            await self._login(password='wrongpassword')
+
+        with mock.patch.object(services, 'authenticate', side_effect=authenticate) as hasher:
+            # 다른 IP, 대소문자가 다른 사용자명이어도 같은 사용자로 제한
+            response = await self._login(username='ASYNC_USER', ip='10.0.0.2')
+
+        self.assertEqual(response.status_code, 429)
+        self.assertIn(int(response['Retry-After']), range(1, LoginRateLimiter.WINDOW_SECONDS + 1))
+        hasher.assert_not_called()
+
+    async def test_ip_limit(self):
+        for index in range(LoginRateLimiter.IP_LIMIT):
+            await self._login(username=f'unknown_{index}')
+
+        response = await self._login()
+        self.assertEqual(response.status_code, 429)
+
+        # 창이 지나면 다시 허용
+        await self._age_attempts(LoginRateLimiter.WINDOW_SECONDS)
+        response = await self._login()
+        self.assertEqual(response.status_code, 200)
+
+    def test_limiter_shares_client(self):
+        with mock.patch.object(services, '_login_redis', None), \
+                mock.patch('redis.asyncio.from_url') as from_url:
+            clients = {services.get_login_redis() for _ in range(3)}
+
+        self.assertEqual(len(clients), 1)
+        from_url.assert_called_once()
+
+    async def test_successful_logins_do_not_count_toward_ip_limit(self):
+        # 같은 프록시/NAT 뒤의 여러 사용자가 정상 로그인
+        for _ in range(LoginRateLimiter.IP_LIMIT + 1):
+            response = await self._login()
+            self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(await self.redis.zcard(LoginRateLimiter.IP_KEY.format(ip='10.0.0.1')), 0)
+
+    async def test_ip_limit_is_per_forwarded_client(self):
+        for index in range(LoginRateLimiter.IP_LIMIT):
+            await self._login(username=f'unknown_{index}')
+
+        self.assertEqual((await self._login()).status_code, 429)
+        self.assertEqual((await self._login(ip='10.0.0.2')).status_code, 200)
+
+    async def test_limiter_fails_open(self):
+        broken = mock.Mock()
+        broken.register_script.side_effect = ConnectionError
+
+        with mock.patch.object(LoginRateLimiter, 'client', broken):
+            with self.assertLogs('apps.accounts.services', level='WARNING'):
+                response = await self._login()
+
+        self.assertEqual(response.status_code, 200)
@@ -1,4 +1,4 @@
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone as dt_timezone
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.utils import timezone
@@ -7,6 +7,7 @@ import jwt
 from django.conf import settings
 
 from apps.accounts.dto import LoginDTO
+from apps.common.testing import FakeRedisMixin
 
 User = get_user_model()
 
@@ -153,4 +154,73 @@ class TestAccountService(TestCase):
         account_service = AccountService()
         user = account_service.authenticate_user(LoginDTO('nonexistent', 'anypass'))
 
-        self.assertIsNone(user)
\ No newline at end of file
+        self.assertIsNone(user)
+
+
+class TestLastLoginBuffer(FakeRedisMixin, TestCase):
+    """마지막 로그인 시각 일괄 반영 테스트"""
+
+    def setUp(self):
+        from apps.accounts.services import LastLoginBuffer
+
+        self.redis = self.use_fake_redis(LastLoginBuffer)
+
+        self.users = [User.objects.create_user(username=f'login{i}', password='pass123') for i in range(3)]
+
+    def test_login_does_not_update_users(self):
+        from apps.accounts.services import LastLoginBuffer
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from rest_framework.test import APIClient
+
+        with CaptureQueriesContext(connection) as queries:
+            response = APIClient().post(
+                '/api/auth/login/', {'username': 'login0', 'password': 'pass123'}, format='json'
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse([query for query in queries if query['sql'].startswith('UPDATE')])
+        self.assertTrue(self.redis.hexists(LastLoginBuffer.KEY, self.users[0].id))
+
+    def test_flush_updates_in_one_statement(self):
+        from apps.accounts.services import LastLoginBuffer
+
+        buffer = LastLoginBuffer()
+        with freeze_time("2024-01-01 09:00:00"):
+            buffer.record(self.users[0].id)
+            buffer.record(self.users[1].id)
+        with freeze_time("2024-01-01 09:05:00"):
+            buffer.record(self.users[0].id)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(buffer.flush(), 2)
+
+        self.users[0].refresh_from_db()
+        self.users[1].refresh_from_db()
+        self.users[2].refresh_from_db()
+        self.assertEqual(self.users[0].last_login, datetime(2024, 1, 1, 9, 5, tzinfo=dt_timezone.utc))
+        self.assertEqual(self.users[1].last_login, datetime(2024, 1, 1, 9, 0, tzinfo=dt_timezone.utc))
+        self.assertIsNone(self.users[2].last_login)
+        self.assertEqual(self.redis.hgetall(LastLoginBuffer.KEY), {})
+
+    def test_failed_flush_keeps_newer_logins(self):
+        from unittest import mock
+        from apps.accounts.services import LastLoginBuffer
+
+        buffer = LastLoginBuffer()
+        buffer.record(self.users[0].id, at=100.0)
+        buffer.record(self.users[1].id, at=100.0)
+
+        def fail(user_ids, last_logins):
+            # 반영 도중 다시 로그인
+            buffer.record(self.users[0].id, at=200.0)
+            raise ConnectionError
+
+        with mock.patch.object(buffer, '_update', side_effect=fail):
+            with self.assertRaises(ConnectionError):
+                buffer.flush()
+
+        self.assertEqual(self.redis.hgetall(LastLoginBuffer.KEY), {
+            str(self.users[0].id).encode(): b'200.0',
+            str(self.users[1].id).encode(): b'100.0',
+        })
@@ -0,0 +1,125 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+from freezegun import freeze_time
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.accounts.services import JWTService
+from apps.accounts.tokens import RefreshTokenBlacklist
+from apps.common.testing import FakeRedisMixin
+
+User = get_user_model()
+
+
+class RefreshTokenAPITestCase(FakeRedisMixin, TestCase):
+    """토큰 갱신/로그아웃 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.redis = self.use_fake_redis(RefreshTokenBlacklist)
+
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='refresh_user', password='testpass123')
+        self.refresh = JWTService().create_tokens_for_user(self.user)['refresh']
+
+    def _post(self, path, refresh):
+        return self.client.post(path, {'refresh': refresh}, format='json')
+
+    def test_refresh_rotates_token(self):
+        response = self._post('/api/auth/refresh/', self.refresh)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('access', response.data)
+        self.assertNotEqual(response.data['refresh'], self.refresh)
+
+        # 이전 refresh 토큰은 다시 쓸 수 없고, 새 토큰으로는 갱신 가능
+        self.assertEqual(self._post('/api/auth/refresh/', self.refresh).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(
+            self._post('/api/auth/refresh/', response.data['refresh']).status_code, status.HTTP_200_OK
+        )
+
+    def _keys(self, raw_refresh):
+        token = RefreshToken(raw_refresh)
+        return RefreshTokenBlacklist()._keys(token['jti'], token['exp'])
+
+    def test_blacklist_ttl_is_remaining_lifetime(self):
+        self._post('/api/auth/refresh/', self.refresh)
+
+        jti_key, filter_key = self._keys(self.refresh)
+        self.assertAlmostEqual(self.redis.ttl(jti_key), 7 * 24 * 3600, delta=5)
+        # 만료일 비트맵은 그 날 만료되는 토큰이 모두 만료된 뒤 삭제
+        self.assertGreaterEqual(self.redis.ttl(filter_key), self.redis.ttl(jti_key))
+        self.assertLessEqual(self.redis.ttl(filter_key), 8 * 24 * 3600)
+
+    def test_filter_answers_unrevoked_token(self):
+        self._post('/api/auth/logout/', JWTService().create_tokens_for_user(self.user)['refresh'])
+
+        token = RefreshToken(self.refresh)
+        _, filter_key = self._keys(self.refresh)
+        positions = RefreshTokenBlacklist()._positions(token['jti'])
+        # 폐기되지 않은 토큰의 비트 중 하나 이상이 비어 있어 jti 키까지 조회하지 않음
+        self.assertIn(0, [self.redis.getbit(filter_key, position) for position in positions])
+
+        with self.assertNumQueries(1):
+            response = self._post('/api/auth/refresh/', self.refresh)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_filter_false_positive_falls_through_to_key(self):
+        token = RefreshToken(self.refresh)
+        _, filter_key = self._keys(self.refresh)
+        for position in RefreshTokenBlacklist()._positions(token['jti']):
+            self.redis.setbit(filter_key, position, 1)
+
+        self.assertFalse(RefreshTokenBlacklist().contains(token['jti'], token['exp']))
+        self.assertEqual(self._post('/api/auth/refresh/', self.refresh).status_code, status.HTTP_200_OK)
+
+    def test_logout_revokes_refresh_token(self):
+        response = self._post('/api/auth/logout/', self.refresh)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self._post('/api/auth/refresh/', self.refresh).status_code, status.HTTP_401_UNAUTHORIZED)
+        # 이미 폐기된 토큰으로 로그아웃해도 성공
+        self.assertEqual(self._post('/api/auth/logout/', self.refresh).status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_refresh_and_logout_with_expired_access_token_header(self):
+        with freeze_time(timezone.now() - timedelta(hours=1)):
+            expired_access = JWTService().create_tokens_for_user(self.user)['access']
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {expired_access}')
+
+        response = self._post('/api/auth/refresh/', self.refresh)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self._post('/api/auth/logout/', response.data['refresh'])
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_refresh_rejects_inactive_user(self):
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        response = self._post('/api/auth/refresh/', self.refresh)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_refresh_rejects_access_token(self):
+        access = JWTService().create_tokens_for_user(self.user)['access']
+
+        response = self._post('/api/auth/refresh/', access)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_refresh_unavailable_without_redis(self):
+        broken = mock.Mock()
+        broken.register_script.side_effect = ConnectionError
+
+        with mock.patch.object(RefreshTokenBlacklist, 'client', broken):
+            with self.assertLogs('apps.accounts.tokens', level='WARNING'):
+                response = self._post('/api/auth/refresh/', self.refresh)
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
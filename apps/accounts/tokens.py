@@ -0,0 +1,129 @@
+"""
+Refresh 토큰 블랙리스트 (Redis)
+
+simplejwt 의 token_blacklist 앱(MySQL 테이블) 대신 Redis 에 폐기된 refresh 토큰의 jti 를 둔다.
+
+- jti 키는 토큰의 남은 수명만큼만 보관해 만료되면 저절로 지워진다
+- 만료일(exp) 별 Bloom filter 비트맵을 앞에 두어, 폐기되지 않은 토큰은 비트 몇 개만 확인하고 jti 키를 조회하지 않는다
+  비트맵도 그 날 만료되는 토큰이 모두 만료된 뒤 지워진다
+- 폐기 등록은 SET NX 로 한 번만 성공하므로, 같은 refresh 토큰으로 동시에 갱신해도 한 요청만 새 토큰을 받는다
+"""
+import hashlib
+import logging
+import time
+from typing import List
+
+from django_redis import get_redis_connection
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+logger = logging.getLogger(__name__)
+
+
+# KEYS: jti 키, 만료일 비트맵 / ARGV: jti 키 TTL(초), 비트맵 만료 시각(epoch), 비트 위치...
+# 반환: 1 이면 새로 폐기, 0 이면 이미 폐기된 토큰
+BLACKLIST_SCRIPT = """
+if not redis.call('SET', KEYS[1], 1, 'EX', ARGV[1], 'NX') then
+    return 0
+end
+for i = 3, #ARGV do
+    redis.call('SETBIT', KEYS[2], ARGV[i], 1)
+end
+redis.call('EXPIREAT', KEYS[2], ARGV[2])
+return 1
+"""
+
+# KEYS: jti 키, 만료일 비트맵 / ARGV: 비트 위치...
+# 비트가 하나라도 비어 있으면 폐기되지 않은 토큰 (jti 키 조회 생략)
+CHECK_SCRIPT = """
+for i = 1, #ARGV do
+    if redis.call('GETBIT', KEYS[2], ARGV[i]) == 0 then
+        return 0
+    end
+end
+return redis.call('EXISTS', KEYS[1])
+"""
+
+
+class BlacklistUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = '토큰 상태를 확인할 수 없습니다. 잠시 후 다시 시도해주세요.'
+    default_code = 'blacklist_unavailable'
+
+
+class RefreshTokenBlacklist:
+    """폐기된 refresh 토큰 jti 목록 (Redis 를 쓸 수 없으면 토큰을 받지 않음)"""
+
+    JTI_KEY = 'vehicle_auction:refresh_blacklist:jti:{jti}'
+    FILTER_KEY = 'vehicle_auction:refresh_blacklist:filter:{day}'
+
+    # 만료일별 비트맵 크기(1MB)와 해시 수, 하루 약 80만 건 폐기까지 오탐률 약 1%
+    FILTER_BITS = 2 ** 23
+    FILTER_HASHES = 7
+
+    def __init__(self, client=None):
+        self._client = client
+        self._scripts = {}
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_redis_connection('default')
+        return self._client
+
+    def _script(self, source: str):
+        if source not in self._scripts:
+            self._scripts[source] = self.client.register_script(source)
+        return self._scripts[source]
+
+    def _positions(self, jti: str) -> List[int]:
+        digest = hashlib.blake2b(jti.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'big')
+        second = int.from_bytes(digest[8:], 'big') | 1
+        return [(first + i * second) % self.FILTER_BITS for i in range(self.FILTER_HASHES)]
+
+    def _keys(self, jti: str, exp: int) -> List[str]:
+        return [self.JTI_KEY.format(jti=jti), self.FILTER_KEY.format(day=exp // 86400)]
+
+    def add(self, jti: str, exp: int) -> bool:
+        """jti 를 exp 까지 폐기, 이미 폐기된 토큰이면 False"""
+        ttl = max(1, exp - int(time.time()))
+        filter_expire_at = (exp // 86400 + 1) * 86400
+        try:
+            added = self._script(BLACKLIST_SCRIPT)(
+                keys=self._keys(jti, exp),
+                args=[ttl, filter_expire_at, *self._positions(jti)]
+            )
+        except Exception:
+            logger.warning(f"refresh 토큰 폐기 실패: jti={jti}", exc_info=True)
+            raise BlacklistUnavailable()
+        return bool(added)
+
+    def contains(self, jti: str, exp: int) -> bool:
+        try:
+            found = self._script(CHECK_SCRIPT)(keys=self._keys(jti, exp), args=self._positions(jti))
+        except Exception:
+            logger.warning(f"refresh 토큰 폐기 여부 확인 실패: jti={jti}", exc_info=True)
+            raise BlacklistUnavailable()
+        return bool(found)
+
+
+class BlacklistedRefreshToken(RefreshToken):
+    """검증 시 Redis 블랙리스트를 확인하는 refresh 토큰 (simplejwt BlacklistMixin 과 같은 사용법)"""
+
+    blacklist_store_class = RefreshTokenBlacklist
+
+    def verify(self, *args, **kwargs) -> None:
+        super().verify(*args, **kwargs)
+        self.check_blacklist()
+
+    def check_blacklist(self) -> None:
+        if self.blacklist_store_class().contains(self.payload[api_settings.JTI_CLAIM], self.payload['exp']):
+            raise TokenError('폐기된 토큰입니다.')
+
+    def blacklist(self) -> bool:
+        """이 토큰을 폐기, 이미 폐기된 토큰이면 False"""
+        return self.blacklist_store_class().add(self.payload[api_settings.JTI_CLAIM], self.payload['exp'])
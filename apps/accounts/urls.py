@@ -1,9 +1,14 @@
 from django.urls import path
-from apps.accounts.views import LoginView
+from apps.accounts.views import AsyncLoginView, LoginView, LogoutView, TokenCacheStatsView, TokenRefreshView
 
 app_name = 'accounts'
 
 urlpatterns = [
     # JWT 로그인 엔드포인트 (클래스 기반 뷰)
     path('login/', LoginView.as_view(), name='login'),
+    # 비동기 로그인 (ASGI, 시도 횟수 제한)
+    path('login/async/', AsyncLoginView.as_view(), name='login-async'),
+    path('refresh/', TokenRefreshView.as_view(), name='token-refresh'),
+    path('logout/', LogoutView.as_view(), name='logout'),
+    path('token-cache/', TokenCacheStatsView.as_view(), name='token-cache-stats'),
 ]
\ No newline at end of file
@@ -1,10 +1,19 @@
+import json
+import math
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.views import View
 from rest_framework import status
 from rest_framework.views import APIView
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework.response import Response
+from rest_framework.throttling import BaseThrottle
+from rest_framework_simplejwt.settings import api_settings
 
-from apps.accounts.serializers import LoginSerializer, UserSerializer
-from apps.accounts.services import JWTService, AccountService
+from apps.accounts.authentication import StatelessJWTAuthentication, get_token_cache
+from apps.accounts.serializers import LoginSerializer, RefreshTokenSerializer, UserSerializer
+from apps.accounts.services import JWTService, AccountService, LoginRateLimiter
 
 
 class LoginView(APIView):
@@ -38,6 +47,7 @@ class LoginView(APIView):
 
 
         tokens = self.jwt_service.create_tokens_for_user(user)
+        self.account_service.record_login(user)
 
         user_serializer = UserSerializer(user)
 
@@ -45,4 +55,132 @@ class LoginView(APIView):
             'access': tokens['access'],
             'refresh': tokens['refresh'],
             'user': user_serializer.data
-        }, status=status.HTTP_200_OK)
\ No newline at end of file
+        }, status=status.HTTP_200_OK)
+
+
+class RefreshTokenView(APIView):
+    """
+    refresh 토큰을 본문으로 받는 API 공통 (simplejwt TokenViewBase 와 동일)
+
+    access 토큰이 만료된 뒤에 호출되므로 Authorization 헤더는 검사하지 않고,
+    잘못된 refresh 토큰은 WWW-Authenticate 헤더와 함께 401 로 돌려준다.
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    www_authenticate_realm = 'api'
+
+    def get_authenticate_header(self, request):
+        return f'{api_settings.AUTH_HEADER_TYPES[0]} realm="{self.www_authenticate_realm}"'
+
+
+class TokenRefreshView(RefreshTokenView):
+    """refresh 토큰으로 새 access/refresh 토큰 발급, 사용한 refresh 토큰은 폐기"""
+
+    def __init__(self):
+        super().__init__()
+        self.jwt_service = JWTService()
+
+    def post(self, request):
+        serializer = RefreshTokenSerializer(data=request.data)
+
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        tokens = self.jwt_service.rotate_refresh_token(serializer.validated_data['refresh'])
+        return Response(tokens, status=status.HTTP_200_OK)
+
+
+class LogoutView(RefreshTokenView):
+    """refresh 토큰 폐기 (access 토큰은 만료 시각까지 유효)"""
+
+    def __init__(self):
+        super().__init__()
+        self.jwt_service = JWTService()
+
+    def post(self, request):
+        serializer = RefreshTokenSerializer(data=request.data)
+
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        self.jwt_service.revoke_refresh_token(serializer.validated_data['refresh'])
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class AsyncLoginView(View):
+    """
+    LoginView 의 비동기 버전 (ASGI 서버 필요, config/asgi.py)
+
+    사용자명/IP 별 시도 횟수를 먼저 확인해 초과하면 비밀번호 해시 없이 429 로 거절한다.
+    해시 검증은 크기가 제한된 스레드 풀에서 실행되어 이벤트 루프와 다른 요청을 막지 않는다.
+    """
+
+    INVALID_CREDENTIALS_MESSAGE = '아이디 또는 비밀번호가 올바르지 않습니다.'
+    RATE_LIMITED_MESSAGE = '로그인 시도가 너무 많습니다. 잠시 후 다시 시도해주세요.'
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # 세션이 아닌 토큰을 발급하므로 APIView 와 같이 CSRF 검사 제외
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True
+        return view
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.jwt_service = JWTService()
+        self.account_service = AccountService()
+        # 비동기 Redis 클라이언트와 스크립트는 요청마다 만들지 않고 프로세스에서 공유 (get_login_redis)
+        self.rate_limiter = LoginRateLimiter()
+
+    async def post(self, request):
+        try:
+            data = json.loads(request.body or b'{}')
+        except ValueError:
+            return JsonResponse({'detail': '요청 본문이 올바른 JSON 이 아닙니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = LoginSerializer(data=data)
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        login_data = serializer.to_dto()
+
+        # 클라이언트 IP 는 DRF throttle 과 같이 X-Forwarded-For/NUM_PROXIES 기준 (프록시 뒤에서 모두 같은 IP 가 되지 않음)
+        ip = BaseThrottle().get_ident(request)
+        retry_after, attempt_id = await self.rate_limiter.hit(login_data.username, ip)
+        if retry_after:
+            response = JsonResponse(
+                {'detail': self.RATE_LIMITED_MESSAGE},
+                status=status.HTTP_429_TOO_MANY_REQUESTS
+            )
+            response['Retry-After'] = str(math.ceil(retry_after))
+            return response
+
+        user = await self.account_service.authenticate_user_async(login_data)
+        if not user:
+            return JsonResponse(
+                {'detail': self.INVALID_CREDENTIALS_MESSAGE},
+                status=status.HTTP_401_UNAUTHORIZED
+            )
+
+        body = await sync_to_async(self._issue)(user)
+        await self.rate_limiter.release(login_data.username, ip, attempt_id)
+        return JsonResponse(body, status=status.HTTP_200_OK)
+
+    def _issue(self, user):
+        tokens = self.jwt_service.create_tokens_for_user(user)
+        self.account_service.record_login(user)
+        return {
+            'access': tokens['access'],
+            'refresh': tokens['refresh'],
+            'user': UserSerializer(user).data
+        }
+
+
+class TokenCacheStatsView(APIView):
+    """검증된 토큰 캐시 적중/미적중 수 (요청을 처리한 프로세스 기준, 관리자)"""
+
+    authentication_classes = [StatelessJWTAuthentication]
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(get_token_cache().stats(), status=status.HTTP_200_OK)
@@ -0,0 +1,482 @@
+"""
+입찰 처리
+
+입찰 수락 여부(진행 중, 종료 시각 전, 현재가보다 높은 금액)는 Redis Lua 스크립트에서 원자적으로 판단하고,
+수락된 입찰은 Redis stream 에 쌓아 두었다가 run_bid_writer 가 묶어서 MySQL 에 저장한다.
+입찰 요청 경로에서는 DB 를 조회/잠그지 않는다. (경매 상태를 Redis 에 처음 올릴 때만 조회)
+
+- 경매 상태: vehicle_auction:bids:{vehicle_id} 해시 (auction_id, end_ms, price, seq, mode, increment)
+- 비공개 최고가 경매: 입찰자별 최고가를 sorted set(ladder)에 두어 등록과 현재 낙찰가 계산이 O(log n)
+  낙찰가 = min(두 번째로 높은 최고가 + 입찰 단위, 가장 높은 최고가), 같은 최고가는 먼저 제시한 입찰자 우선
+- 시각은 Redis TIME 기준이라 앱 서버 시계 차이와 무관하다
+- 입찰 상태는 유일한 원본이므로 캐시와 분리된 noeviction Redis(AUCTION_REDIS_URL)에 둔다
+- 저장은 (auction, sequence) 유니크 제약으로 같은 입찰을 다시 저장해도 한 번만 들어간다
+  같은 순번에 다른 입찰이 오면(상태 유실 후 재적재 등) 버리지 않고 오류로 남기고 충돌 stream 에 보관한다
+- stream 은 길이로 자르지 않고 저장 후 XACK/XDEL 한 입찰만 지우므로, 기록기가 밀려도 저장 전 입찰이 사라지지 않는다
+"""
+import logging
+import os
+import socket
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import redis
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from redis.exceptions import ResponseError
+
+from apps.auctions.models import Auction, Bid
+
+logger = logging.getLogger(__name__)
+
+
+# 결과 코드: 1 수락, 0 미적재, -1 종료, -2 금액 부족, -3 입찰 방식 다름
+
+# KEYS: 경매 상태 해시, 입찰 stream / ARGV: user_id, amount
+# 반환: {결과 코드, 현재가, 순번}
+PLACE_BID_SCRIPT = """
+local state = redis.call('HMGET', KEYS[1], 'auction_id', 'end_ms', 'price', 'mode')
+if not state[1] then
+    return {0, 0, 0}
+end
+if state[4] ~= 'OPEN' then
+    return {-3, 0, 0}
+end
+
+local now = redis.call('TIME')
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local price = tonumber(state[3])
+if now_ms >= tonumber(state[2]) then
+    return {-1, price, 0}
+end
+
+local amount = tonumber(ARGV[2])
+if amount <= price then
+    return {-2, price, 0}
+end
+
+local seq = redis.call('HINCRBY', KEYS[1], 'seq', 1)
+redis.call('HSET', KEYS[1], 'price', ARGV[2], 'leader', ARGV[1])
+redis.call('XADD', KEYS[2], '*',
+    'auction_id', state[1], 'user_id', ARGV[1], 'amount', ARGV[2], 'seq', seq, 'ts', now_ms)
+return {1, amount, seq}
+"""
+
+# ladder 에서 현재 낙찰가 계산 (가장 높은 최고가, 두 번째 최고가 + 단위 중 작은 값)
+CLEARING_PRICE_LUA = """
+local function clearing_price(ladder, increment)
+    local top = redis.call('ZREVRANGE', ladder, 0, 1, 'WITHSCORES')
+    if #top == 0 then
+        return 0
+    end
+    local second = 0
+    if top[4] then
+        second = tonumber(top[4])
+    end
+    return math.min(second + increment, tonumber(top[2]))
+end
+"""
+
+# KEYS: 경매 상태 해시, ladder, 입찰자별 ladder 멤버 해시, 입찰 stream / ARGV: user_id, ceiling
+# 반환: {결과 코드, 현재 낙찰가, 순번}
+PLACE_OFFER_SCRIPT = CLEARING_PRICE_LUA + """
+local state = redis.call('HMGET', KEYS[1], 'auction_id', 'end_ms', 'mode', 'increment')
+if not state[1] then
+    return {0, 0, 0}
+end
+if state[3] ~= 'SEALED' then
+    return {-3, 0, 0}
+end
+local increment = tonumber(state[4])
+
+local now = redis.call('TIME')
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+if now_ms >= tonumber(state[2]) then
+    return {-1, clearing_price(KEYS[2], increment), 0}
+end
+
+-- 입찰자는 자신의 최고가를 올리기만 할 수 있음
+local ceiling = tonumber(ARGV[2])
+local previous = redis.call('HGET', KEYS[3], ARGV[1])
+if previous then
+    if ceiling <= tonumber(redis.call('ZSCORE', KEYS[2], previous)) then
+        return {-2, clearing_price(KEYS[2], increment), 0}
+    end
+    redis.call('ZREM', KEYS[2], previous)
+end
+
+local seq = redis.call('HINCRBY', KEYS[1], 'seq', 1)
+-- 같은 최고가는 멤버 역순 정렬에서 먼저 제시한(순번이 작은) 입찰자가 앞서도록 순번을 뒤집어 붙임
+local member = string.format('%012d:%s', 999999999999 - seq, ARGV[1])
+redis.call('ZADD', KEYS[2], ceiling, member)
+redis.call('HSET', KEYS[3], ARGV[1], member)
+redis.call('XADD', KEYS[4], '*',
+    'auction_id', state[1], 'user_id', ARGV[1], 'amount', ARGV[2], 'seq', seq, 'ts', now_ms, 'sealed', 1)
+return {1, clearing_price(KEYS[2], increment), seq}
+"""
+
+# KEYS: 경매 상태 해시, ladder, 입찰자별 ladder 멤버 해시
+# ARGV: auction_id, end_ms, price, seq, 만료 시각(ms), mode, increment, (ceiling, seq, user_id)...
+LOAD_AUCTION_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'auction_id', ARGV[1], 'end_ms', ARGV[2], 'price', ARGV[3], 'seq', ARGV[4],
+    'mode', ARGV[6], 'increment', ARGV[7])
+redis.call('DEL', KEYS[2], KEYS[3])
+for i = 8, #ARGV, 3 do
+    local member = string.format('%012d:%s', 999999999999 - tonumber(ARGV[i + 1]), ARGV[i + 2])
+    redis.call('ZADD', KEYS[2], ARGV[i], member)
+    redis.call('HSET', KEYS[3], ARGV[i + 2], member)
+end
+for _, key in ipairs(KEYS) do
+    redis.call('PEXPIREAT', key, ARGV[5])
+end
+return 1
+"""
+
+
+_auction_redis: Optional[redis.Redis] = None
+
+
+def get_auction_redis() -> redis.Redis:
+    """입찰 상태용 Redis 클라이언트 (프로세스당 하나, 연결 풀 공유)"""
+    global _auction_redis
+    if _auction_redis is None:
+        _auction_redis = redis.Redis.from_url(settings.AUCTION_REDIS_URL)
+    return _auction_redis
+
+
+def clearing_price(ceilings: List[int], increment: int) -> int:
+    """높은 순 최고가 목록 → 낙찰가 (CLEARING_PRICE_LUA 와 같은 규칙)"""
+    if not ceilings:
+        return 0
+    second = ceilings[1] if len(ceilings) > 1 else 0
+    return min(second + increment, ceilings[0])
+
+
+class PlacedBid(NamedTuple):
+    vehicle_id: int
+    amount: int
+    sequence: int
+
+
+class PlacedOffer(NamedTuple):
+    vehicle_id: int
+    ceiling: int
+    sequence: int
+    clearing_price: int
+
+
+class BidEngine:
+    STATE_KEY = 'vehicle_auction:bids:{vehicle_id}'
+    LADDER_KEY = 'vehicle_auction:offers:{vehicle_id}'
+    MEMBERS_KEY = 'vehicle_auction:offers:{vehicle_id}:members'
+    STREAM_KEY = 'vehicle_auction:bids:pending'
+    CONFLICT_STREAM_KEY = 'vehicle_auction:bids:conflicts'
+    GROUP = 'bid-writer'
+
+    STATE_TTL_AFTER_END = timedelta(days=1)
+    CLOSED_STATE_TTL = timedelta(minutes=1)  # 진행 중이 아닌 경매는 잠깐만 기억
+
+    BATCH_SIZE = 1000
+    BLOCK_MILLISECONDS = 1000
+    CLAIM_IDLE_MILLISECONDS = 60000  # 죽은 기록기가 가져간 입찰을 넘겨받는 기준
+
+    CLOSED_MESSAGE = "진행 중인 경매에만 입찰할 수 있습니다"
+    TOO_LOW_MESSAGE = "현재가보다 높은 금액으로 입찰해야 합니다"
+    OFFER_TOO_LOW_MESSAGE = "이전에 제시한 최고가보다 높은 금액이어야 합니다"
+    WRONG_MODE_MESSAGE = "입찰 방식이 다른 경매입니다"
+
+    def __init__(self, client=None, consumer: Optional[str] = None):
+        self._client = client
+        self._scripts = {}
+        self.consumer = consumer or f'{socket.gethostname()}-{os.getpid()}'
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_auction_redis()
+        return self._client
+
+    def _script(self, source: str):
+        if source not in self._scripts:
+            self._scripts[source] = self.client.register_script(source)
+        return self._scripts[source]
+
+    def place(self, vehicle_id: int, user_id: int, amount: int) -> PlacedBid:
+        """입찰, 거절되면 ValidationError (params 에 current_price)"""
+        state_key = self.STATE_KEY.format(vehicle_id=vehicle_id)
+        args = [user_id, amount]
+
+        code, price, sequence = self._script(PLACE_BID_SCRIPT)(keys=[state_key, self.STREAM_KEY], args=args)
+        if code == 0:
+            # 경매 상태가 Redis 에 없으면 DB 에서 한 번 올리고 다시 시도
+            self.load(vehicle_id)
+            code, price, sequence = self._script(PLACE_BID_SCRIPT)(keys=[state_key, self.STREAM_KEY], args=args)
+
+        if code == 1:
+            return PlacedBid(vehicle_id, int(price), int(sequence))
+        self._reject(code, self.TOO_LOW_MESSAGE, price)
+
+    def place_offer(self, vehicle_id: int, user_id: int, ceiling: int) -> PlacedOffer:
+        """비공개 경매 최고가 제시, 거절되면 ValidationError (params 에 current_price = 현재 낙찰가)"""
+        keys = [
+            self.STATE_KEY.format(vehicle_id=vehicle_id),
+            self.LADDER_KEY.format(vehicle_id=vehicle_id),
+            self.MEMBERS_KEY.format(vehicle_id=vehicle_id),
+            self.STREAM_KEY,
+        ]
+        args = [user_id, ceiling]
+
+        code, price, sequence = self._script(PLACE_OFFER_SCRIPT)(keys=keys, args=args)
+        if code == 0:
+            self.load(vehicle_id)
+            code, price, sequence = self._script(PLACE_OFFER_SCRIPT)(keys=keys, args=args)
+
+        if code == 1:
+            return PlacedOffer(vehicle_id, ceiling, int(sequence), int(price))
+        self._reject(code, self.OFFER_TOO_LOW_MESSAGE, price)
+
+    def _reject(self, code: int, too_low_message: str, price) -> None:
+        params = {'current_price': int(price)}
+        if code == -2:
+            raise ValidationError(too_low_message, code='too_low', params=params)
+        if code == -3:
+            raise ValidationError(self.WRONG_MODE_MESSAGE, code='wrong_mode', params=params)
+        raise ValidationError(self.CLOSED_MESSAGE, code='closed', params=params)
+
+    def load(self, vehicle_id: int) -> None:
+        """DB 의 경매 상태를 Redis 에 적재 (이미 있으면 그대로 둠)"""
+        auction = Auction.objects.filter(vehicle_id=vehicle_id).values(
+            'id', 'status', 'end_time', 'current_price', 'bid_count', 'mode'
+        ).first()
+
+        now = timezone.now()
+        ladder = []
+        if auction and auction['status'] == Auction.Status.AUCTION_ACTIVE and auction['end_time']:
+            end_time = auction['end_time']
+            expire_at = end_time + self.STATE_TTL_AFTER_END
+            if auction['mode'] == Auction.Mode.SEALED:
+                ladder = self._ladder_from_db(auction['id'])
+        else:
+            # 없는 차량/진행 중이 아닌 경매도 잠깐 기록해 반복 조회를 막음 (end_ms=0 이라 항상 거절)
+            auction = auction or {'id': 0, 'current_price': 0, 'bid_count': 0, 'mode': Auction.Mode.OPEN}
+            end_time = datetime.fromtimestamp(0, dt_timezone.utc)
+            expire_at = now + self.CLOSED_STATE_TTL
+
+        self._script(LOAD_AUCTION_SCRIPT)(
+            keys=[
+                self.STATE_KEY.format(vehicle_id=vehicle_id),
+                self.LADDER_KEY.format(vehicle_id=vehicle_id),
+                self.MEMBERS_KEY.format(vehicle_id=vehicle_id),
+            ],
+            args=[
+                auction['id'],
+                self._to_ms(end_time),
+                auction['current_price'],
+                auction['bid_count'],
+                self._to_ms(expire_at),
+                auction['mode'],
+                Auction.BID_INCREMENT,
+                *[value for offer in ladder for value in offer],
+            ]
+        )
+
+    def _ladder_from_db(self, auction_id: int) -> List[Tuple[int, int, int]]:
+        """저장된 제시 내역 → 입찰자별 최신 (최고가, 순번, user_id)"""
+        latest = {}
+        for user_id, amount, sequence in Bid.objects.filter(auction_id=auction_id).order_by(
+            'sequence'
+        ).values_list('user_id', 'amount', 'sequence'):
+            latest[user_id] = (amount, sequence, user_id)
+        return list(latest.values())
+
+    def settle(self, auctions: Dict[int, int]) -> Dict[int, Tuple[Optional[int], int]]:
+        """
+        종료된 비공개 경매 {경매 ID: 차량 ID} → {경매 ID: (낙찰자 ID, 낙찰가)}
+
+        ladder 상위 2개만 읽어 한 번에 계산하고, Redis 를 쓸 수 없거나 ladder 가 없으면 저장된 제시 내역으로 계산한다.
+        """
+        tops = {}
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for vehicle_id in auctions.values():
+                pipe.exists(self.STATE_KEY.format(vehicle_id=vehicle_id))
+                pipe.zrevrange(self.LADDER_KEY.format(vehicle_id=vehicle_id), 0, 1, withscores=True)
+            replies = pipe.execute()
+            for index, auction_id in enumerate(auctions):
+                loaded, top = replies[index * 2], replies[index * 2 + 1]
+                if loaded:
+                    tops[auction_id] = [
+                        (int(member.split(b':')[1]), int(score)) for member, score in top
+                    ]
+        except Exception:
+            logger.warning("비공개 경매 ladder 조회 실패, 저장된 내역으로 정산", exc_info=True)
+
+        for auction_id in auctions:
+            if auction_id not in tops:
+                ladder = sorted(self._ladder_from_db(auction_id), key=lambda offer: (-offer[0], offer[1]))
+                tops[auction_id] = [(user_id, amount) for amount, _, user_id in ladder[:2]]
+
+        return {
+            auction_id: (
+                top[0][0] if top else None,
+                clearing_price([amount for _, amount in top], Auction.BID_INCREMENT)
+            )
+            for auction_id, top in tops.items()
+        }
+
+    def forget_on_commit(self, vehicle_ids: Iterable[int]) -> None:
+        """
+        커밋 후 경매 상태를 Redis 에서 제거 (다음 입찰 때 DB 에서 다시 적재)
+
+        승인 전에 입찰 시도로 '진행 중 아님' 상태가 적재돼 있어도 승인 직후부터 입찰할 수 있게 한다.
+        """
+        keys = [self.STATE_KEY.format(vehicle_id=vehicle_id) for vehicle_id in vehicle_ids]
+        transaction.on_commit(lambda: self._delete(keys))
+
+    def _delete(self, keys: List[str]) -> None:
+        if not keys:
+            return
+        try:
+            self.client.delete(*keys)
+        except Exception:
+            logger.warning(f"입찰 상태 제거 실패: {keys[:10]}", exc_info=True)
+
+    def ensure_group(self) -> None:
+        try:
+            self.client.xgroup_create(self.STREAM_KEY, self.GROUP, id='0', mkstream=True)
+        except ResponseError as e:
+            if 'BUSYGROUP' not in str(e):
+                raise
+
+    def flush(self, block_ms: Optional[int] = None) -> int:
+        """
+        수락된 입찰 한 배치를 DB 에 저장, 저장한 입찰 수 반환
+
+        다른 기록기가 가져간 뒤 오래 처리하지 못한 입찰을 먼저 넘겨받고, 없으면 새 입찰을 읽는다.
+        저장 후 XACK 하므로 저장 도중 죽으면 다시 처리된다.
+        순번이 충돌한 입찰은 충돌 stream 으로 옮긴 뒤 XACK 해 기록기가 멈추지 않게 한다.
+        """
+        entries = self._claim_stale() or self._read_new(block_ms)
+        if not entries:
+            return 0
+
+        conflicts = self._persist(entries)
+
+        entry_ids = [entry_id for entry_id, _ in entries]
+        pipe = self.client.pipeline()
+        for _, fields in conflicts:
+            pipe.xadd(self.CONFLICT_STREAM_KEY, fields)
+        pipe.xack(self.STREAM_KEY, self.GROUP, *entry_ids)
+        pipe.xdel(self.STREAM_KEY, *entry_ids)
+        pipe.execute()
+        return len(entries)
+
+    def run(self) -> None:
+        self.ensure_group()
+        logger.info(f"입찰 기록기 시작: {self.consumer}")
+        while True:
+            try:
+                self.flush(block_ms=self.BLOCK_MILLISECONDS)
+            except Exception:
+                logger.warning("입찰 저장 실패, 재시도", exc_info=True)
+                time.sleep(self.BLOCK_MILLISECONDS / 1000)
+
+    def _claim_stale(self) -> List[Tuple[bytes, Dict[bytes, bytes]]]:
+        result = self.client.xautoclaim(
+            self.STREAM_KEY, self.GROUP, self.consumer,
+            min_idle_time=self.CLAIM_IDLE_MILLISECONDS, start_id='0-0', count=self.BATCH_SIZE
+        )
+        return [entry for entry in result[1] if entry[1]]
+
+    def _read_new(self, block_ms: Optional[int]) -> List[Tuple[bytes, Dict[bytes, bytes]]]:
+        response = self.client.xreadgroup(
+            self.GROUP, self.consumer, {self.STREAM_KEY: '>'}, count=self.BATCH_SIZE, block=block_ms
+        )
+        if not response:
+            return []
+        return response[0][1]
+
+    @transaction.atomic
+    def _persist(self, entries: List[Tuple[bytes, Dict[bytes, bytes]]]) -> List[Tuple[bytes, Dict[bytes, bytes]]]:
+        """
+        입찰 저장, 저장하지 못한 순번 충돌 입찰 목록 반환
+
+        이미 같은 내용으로 저장된 입찰(XACK 전에 죽어 다시 처리)은 건너뛰고,
+        같은 순번에 다른 입찰이 있으면 충돌로 돌려준다.
+        """
+        bids = {}
+        conflicts = []
+        for entry in entries:
+            fields = entry[1]
+            bid = Bid(
+                auction_id=int(fields[b'auction_id']),
+                user_id=int(fields[b'user_id']),
+                amount=int(fields[b'amount']),
+                sequence=int(fields[b'seq']),
+                created_at=datetime.fromtimestamp(int(fields[b'ts']) / 1000, dt_timezone.utc)
+            )
+            key = (bid.auction_id, bid.sequence)
+            if key in bids:
+                if (bids[key].user_id, bids[key].amount) != (bid.user_id, bid.amount):
+                    conflicts.append(entry)
+                continue
+            bids[key] = bid
+
+        stored = {
+            (auction_id, sequence): (user_id, amount)
+            for auction_id, sequence, user_id, amount in Bid.objects.filter(
+                auction_id__in={auction_id for auction_id, _ in bids},
+                sequence__in={sequence for _, sequence in bids}
+            ).values_list('auction_id', 'sequence', 'user_id', 'amount')
+        }
+
+        new_bids = []
+        for key, bid in bids.items():
+            if key not in stored:
+                new_bids.append(bid)
+            elif stored[key] != (bid.user_id, bid.amount):
+                conflicts.append(next(entry for entry in entries if self._entry_key(entry) == key))
+
+        if conflicts:
+            logger.error(
+                f"입찰 순번 충돌 {len(conflicts)}건, {self.CONFLICT_STREAM_KEY} 에 보관: "
+                f"{[self._entry_key(entry) for entry in conflicts[:10]]}"
+            )
+
+        Bid.objects.bulk_create(new_bids)
+
+        # 배치당 경매별 UPDATE 1회 (입찰 수는 순번, 현재가는 가장 늦은 입찰가)
+        # 비공개 경매의 제시 금액은 현재가가 아니므로 입찰 수만 반영 (낙찰가는 종료 시 정산)
+        latest: Dict[int, Tuple[int, int]] = defaultdict(lambda: (0, 0))
+        sealed = set()
+        for entry_id, fields in entries:
+            if (entry_id, fields) in conflicts:
+                continue
+            auction_id = int(fields[b'auction_id'])
+            latest[auction_id] = max(latest[auction_id], (int(fields[b'seq']), int(fields[b'amount'])))
+            if b'sealed' in fields:
+                sealed.add(auction_id)
+
+        for auction_id, (sequence, amount) in latest.items():
+            fields = {'bid_count': Greatest(F('bid_count'), sequence)}
+            if auction_id not in sealed:
+                fields['current_price'] = Greatest(F('current_price'), amount)
+            Auction.objects.filter(id=auction_id).update(**fields)
+
+        return conflicts
+
+    @staticmethod
+    def _entry_key(entry: Tuple[bytes, Dict[bytes, bytes]]) -> Tuple[int, int]:
+        return int(entry[1][b'auction_id']), int(entry[1][b'seq'])
+
+    def _to_ms(self, value: datetime) -> int:
+        return int(value.timestamp() * 1000)
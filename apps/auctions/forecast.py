@@ -0,0 +1,200 @@
+"""
+경매 종료 예정 분포 (분/시간 단위 히스토그램)
+
+진행 중인 경매 수를 종료 시각의 분/시간 구간별로 Redis 해시에 세어 둔다.
+승인 시 +1, 종료 시 -1 로 커밋 후 갱신하므로 조회 시 경매 테이블을 읽지 않는다.
+승인이 몰린 시간대의 48시간 뒤 종료가 몰리는 구간을 미리 보고 워커를 늘리는 데 쓴다.
+
+- 구간 키는 epoch 기준 분/시간 번호, 값은 그 구간에 종료될(또는 종료 시각이 지났는데 아직 진행 중인) 경매 수
+- Redis 갱신 실패, 커밋과 재계산 사이의 경합 등으로 생긴 오차는 주기적인 rebuild 로 보정
+"""
+import logging
+from collections import Counter
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+from apps.auctions.models import Auction
+
+logger = logging.getLogger(__name__)
+
+
+# KEYS: 분 해시, 시간 해시 / ARGV: (분 구간, 시간 구간, 증감)...
+# 0 이하가 된 구간은 지워 해시에는 남은 경매가 있는 구간만 둔다
+APPLY_DELTAS_SCRIPT = """
+for i = 1, #ARGV, 3 do
+    if redis.call('HINCRBY', KEYS[1], ARGV[i], ARGV[i + 2]) <= 0 then
+        redis.call('HDEL', KEYS[1], ARGV[i])
+    end
+    if redis.call('HINCRBY', KEYS[2], ARGV[i + 1], ARGV[i + 2]) <= 0 then
+        redis.call('HDEL', KEYS[2], ARGV[i + 1])
+    end
+end
+return 1
+"""
+
+# KEYS: 분 해시, 시간 해시 / ARGV: 분 구간 수, (분 구간, 수)..., (시간 구간, 수)...
+REPLACE_SCRIPT = """
+redis.call('DEL', KEYS[1], KEYS[2])
+local minutes = tonumber(ARGV[1])
+for i = 2, 1 + minutes * 2, 2 do
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+for i = 2 + minutes * 2, #ARGV, 2 do
+    redis.call('HSET', KEYS[2], ARGV[i], ARGV[i + 1])
+end
+return 1
+"""
+
+
+class ExpiryForecast:
+    MINUTE_KEY = 'vehicle_auction:expiry_forecast:minute'
+    HOUR_KEY = 'vehicle_auction:expiry_forecast:hour'
+
+    BATCH_SIZE = 2000
+
+    # 지표로 내보내는 예정 종료 구간
+    METRIC_WINDOWS = (
+        ('5m', timedelta(minutes=5)),
+        ('15m', timedelta(minutes=15)),
+        ('1h', timedelta(hours=1)),
+        ('6h', timedelta(hours=6)),
+        ('24h', timedelta(hours=24)),
+        ('48h', timedelta(hours=48)),
+    )
+
+    def __init__(self, client=None):
+        self._client = client
+        self._scripts = {}
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_redis_connection('default')
+        return self._client
+
+    def _script(self, source: str):
+        if source not in self._scripts:
+            self._scripts[source] = self.client.register_script(source)
+        return self._scripts[source]
+
+    @staticmethod
+    def minute_bucket(value: datetime) -> int:
+        return int(value.timestamp() // 60)
+
+    @staticmethod
+    def hour_bucket(value: datetime) -> int:
+        return int(value.timestamp() // 3600)
+
+    def record_on_commit(self, end_times: Iterable[datetime]) -> None:
+        """승인된 경매의 종료 시각을 커밋 후 반영"""
+        self._apply_on_commit(end_times, 1)
+
+    def discard_on_commit(self, end_times: Iterable[datetime]) -> None:
+        """종료된 경매의 종료 시각을 커밋 후 제외"""
+        self._apply_on_commit(end_times, -1)
+
+    def _apply_on_commit(self, end_times: Iterable[datetime], sign: int) -> None:
+        deltas = Counter(
+            (self.minute_bucket(end_time), self.hour_bucket(end_time)) for end_time in end_times if end_time
+        )
+        if deltas:
+            transaction.on_commit(lambda: self._apply(deltas, sign))
+
+    def _apply(self, deltas: Counter, sign: int) -> None:
+        """구간별 증감 반영 (실패해도 다음 rebuild 에서 보정되므로 예외를 올리지 않음)"""
+        args = []
+        for (minute, hour), count in deltas.items():
+            args.extend([minute, hour, count * sign])
+        try:
+            self._script(APPLY_DELTAS_SCRIPT)(keys=[self.MINUTE_KEY, self.HOUR_KEY], args=args)
+        except Exception:
+            logger.warning(f"경매 종료 예정 분포 갱신 실패: {len(deltas)}개 구간", exc_info=True)
+
+    def rebuild(self) -> int:
+        """진행 중인 경매로 분포를 다시 계산해 교체, 집계한 경매 수 반환"""
+        minutes, hours = self._count_from_db()
+        args = [len(minutes)]
+        for counts in (minutes, hours):
+            for bucket, count in counts.items():
+                args.extend([bucket, count])
+        self._script(REPLACE_SCRIPT)(keys=[self.MINUTE_KEY, self.HOUR_KEY], args=args)
+        return sum(minutes.values())
+
+    def _count_from_db(self) -> Tuple[Counter, Counter]:
+        minutes, hours = Counter(), Counter()
+        for end_time in Auction.objects.filter(
+            status=Auction.Status.AUCTION_ACTIVE,
+            end_time__isnull=False
+        ).values_list('end_time', flat=True).iterator(chunk_size=self.BATCH_SIZE):
+            minutes[self.minute_bucket(end_time)] += 1
+            hours[self.hour_bucket(end_time)] += 1
+        return minutes, hours
+
+    def _read(self) -> Tuple[Dict[int, int], Dict[int, int]]:
+        """(분 구간별 수, 시간 구간별 수), Redis 를 쓸 수 없으면 DB 에서 계산"""
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.hgetall(self.MINUTE_KEY)
+            pipe.hgetall(self.HOUR_KEY)
+            minutes, hours = pipe.execute()
+            return (
+                {int(bucket): int(count) for bucket, count in minutes.items()},
+                {int(bucket): int(count) for bucket, count in hours.items()},
+            )
+        except Exception:
+            logger.warning("경매 종료 예정 분포 조회 실패, DB 에서 계산", exc_info=True)
+            minutes, hours = self._count_from_db()
+            return dict(minutes), dict(hours)
+
+    def snapshot(self, minutes: int = 60, hours: int = 48, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        현재 분부터 minutes 분, 현재 시간부터 hours 시간 동안의 종료 예정 분포
+
+        종료 시각이 지났는데 아직 진행 중인 경매는 overdue 로 따로 센다. (빈 구간은 생략)
+        """
+        now = now or timezone.now()
+        minute_counts, hour_counts = self._read()
+        current_minute = self.minute_bucket(now)
+        current_hour = self.hour_bucket(now)
+
+        per_minute = self._window(minute_counts, current_minute, current_minute + minutes, 60)
+        per_hour = self._window(hour_counts, current_hour, current_hour + hours, 3600)
+        peak = max(per_minute, key=lambda bucket: bucket['count'], default=None)
+
+        return {
+            'generated_at': now,
+            'overdue': sum(count for bucket, count in minute_counts.items() if bucket < current_minute),
+            'per_minute': per_minute,
+            'per_hour': per_hour,
+            'peak_minute': peak,
+        }
+
+    def metrics(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """구간별 예정 종료 수와 향후 1시간/24시간의 분당 최대 종료 수"""
+        now = now or timezone.now()
+        minute_counts, _ = self._read()
+        current_minute = self.minute_bucket(now)
+
+        def upcoming(window: timedelta) -> List[int]:
+            stop = current_minute + int(window.total_seconds() // 60)
+            return [count for bucket, count in minute_counts.items() if current_minute <= bucket < stop]
+
+        return {
+            'overdue': sum(count for bucket, count in minute_counts.items() if bucket < current_minute),
+            'upcoming': {label: sum(upcoming(window)) for label, window in self.METRIC_WINDOWS},
+            'peak_per_minute': {
+                '1h': max(upcoming(timedelta(hours=1)), default=0),
+                '24h': max(upcoming(timedelta(hours=24)), default=0),
+            },
+        }
+
+    def _window(self, counts: Dict[int, int], start: int, stop: int, seconds: int) -> List[Dict[str, Any]]:
+        return [
+            {'start': timezone.localtime(datetime.fromtimestamp(bucket * seconds, dt_timezone.utc)), 'count': counts[bucket]}
+            for bucket in sorted(counts)
+            if start <= bucket < stop
+        ]
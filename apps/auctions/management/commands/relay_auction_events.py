@@ -0,0 +1,35 @@
+import signal
+import sys
+
+from django.core.management.base import BaseCommand
+
+from apps.auctions.outbox import AuctionEventOutbox
+
+
+class Command(BaseCommand):
+    help = '미발행 경매 이벤트(auction_events)를 Redis stream 으로 발행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='미발행 이벤트를 한 번만 발행하고 종료합니다.'
+        )
+
+    def handle(self, *args, **options):
+        outbox = AuctionEventOutbox()
+
+        if options['once']:
+            relayed = outbox.relay_pending()
+            self.stdout.write(self.style.SUCCESS(f'경매 이벤트 {relayed}개 발행'))
+            return
+
+        # 발행 도중 종료돼도 published_at 기록 전이라 재시작 후 다시 발행됨
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+        self.stdout.write('경매 이벤트 relay 시작')
+        try:
+            outbox.run()
+        except (KeyboardInterrupt, SystemExit):
+            pass
+        self.stdout.write(self.style.SUCCESS('경매 이벤트 relay 종료'))
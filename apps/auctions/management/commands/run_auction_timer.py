@@ -0,0 +1,21 @@
+import signal
+import sys
+
+from django.core.management.base import BaseCommand
+
+from apps.auctions.timer import AuctionTimer
+
+
+class Command(BaseCommand):
+    help = '경매 종료 시각에 맞춰 경매를 종료하는 타이머를 실행합니다.'
+
+    def handle(self, *args, **options):
+        # 처리 도중 종료돼도 Redis 에서 제거 전이라 재시작 후 다시 처리됨
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+        self.stdout.write('경매 종료 타이머 시작')
+        try:
+            AuctionTimer().run()
+        except (KeyboardInterrupt, SystemExit):
+            pass
+        self.stdout.write(self.style.SUCCESS('경매 종료 타이머 종료'))
@@ -0,0 +1,21 @@
+import signal
+import sys
+
+from django.core.management.base import BaseCommand
+
+from apps.auctions.bids import BidEngine
+
+
+class Command(BaseCommand):
+    help = 'Redis 에서 수락된 입찰을 묶어서 DB(bids)에 저장합니다. (여러 개 실행 가능)'
+
+    def handle(self, *args, **options):
+        # 저장 도중 종료돼도 XACK 전이라 다른 기록기가 넘겨받거나 재시작 후 다시 저장됨
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+        self.stdout.write('입찰 기록기 시작')
+        try:
+            BidEngine().run()
+        except (KeyboardInterrupt, SystemExit):
+            pass
+        self.stdout.write(self.style.SUCCESS('입찰 기록기 종료'))
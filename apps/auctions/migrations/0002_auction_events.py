@@ -0,0 +1,61 @@
+# Generated by Django 4.2 on 2026-10-17 04:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("auctions", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AuctionEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "event_type",
+                    models.CharField(
+                        choices=[
+                            ("VEHICLE_CREATED", "차량등록"),
+                            ("AUCTION_APPROVED", "경매승인"),
+                            ("AUCTION_ENDED", "경매종료"),
+                            ("TRANSACTION_COMPLETED", "거래완료"),
+                        ],
+                        max_length=30,
+                        verbose_name="이벤트 타입",
+                    ),
+                ),
+                ("vehicle_id", models.BigIntegerField(verbose_name="차량 ID")),
+                (
+                    "payload",
+                    models.JSONField(blank=True, default=dict, verbose_name="내용"),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "published_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="발행시간"),
+                ),
+            ],
+            options={
+                "verbose_name": "경매 이벤트",
+                "verbose_name_plural": "경매 이벤트 목록",
+                "db_table": "auction_events",
+                "ordering": ["id"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="auctionevent",
+            index=models.Index(
+                fields=["published_at", "id"], name="auction_eve_publish_963ff2_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 4.2 on 2026-10-17 04:33
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("auctions", "0002_auction_events"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="auction",
+            name="bid_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="입찰 수"),
+        ),
+        migrations.AddField(
+            model_name="auction",
+            name="current_price",
+            field=models.PositiveBigIntegerField(default=0, verbose_name="현재가"),
+        ),
+        migrations.CreateModel(
+            name="Bid",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("amount", models.PositiveBigIntegerField(verbose_name="입찰가")),
+                ("sequence", models.PositiveIntegerField(verbose_name="경매 내 입찰 순번")),
+                ("created_at", models.DateTimeField(verbose_name="입찰시간")),
+                (
+                    "auction",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="bids",
+                        to="auctions.auction",
+                        verbose_name="경매",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="bids",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="입찰자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "입찰",
+                "verbose_name_plural": "입찰 목록",
+                "db_table": "bids",
+                "ordering": ["auction", "-sequence"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="bid",
+            constraint=models.UniqueConstraint(
+                fields=("auction", "sequence"), name="unique_bid_sequence"
+            ),
+        ),
+    ]
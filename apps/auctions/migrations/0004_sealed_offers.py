@@ -0,0 +1,42 @@
+# Generated by Django 4.2 on 2026-10-17 04:38
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("auctions", "0003_bids"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="auction",
+            name="mode",
+            field=models.CharField(
+                choices=[("OPEN", "공개 입찰"), ("SEALED", "비공개 최고가 제시")],
+                default="OPEN",
+                max_length=10,
+                verbose_name="입찰 방식",
+            ),
+        ),
+        migrations.AddField(
+            model_name="auction",
+            name="winner",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="won_auctions",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="낙찰자",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="bid",
+            name="amount",
+            field=models.PositiveBigIntegerField(verbose_name="입찰가(비공개 경매는 최고가)"),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2 on 2026-10-17 05:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("auctions", "0004_sealed_offers"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="auctionevent",
+            name="claimed_until",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="발행 선점 만료시간"
+            ),
+        ),
+    ]
@@ -13,6 +13,16 @@ class Auction(models.Model):
         AUCTION_ENDED = 'AUCTION_ENDED', '경매종료'
         TRANSACTION_COMPLETE = 'TRANSACTION_COMPLETE', '거래완료'
 
+    class Mode(models.TextChoices):
+        OPEN = 'OPEN', '공개 입찰'
+        SEALED = 'SEALED', '비공개 최고가 제시'
+
+    DURATION = timezone.timedelta(hours=48)
+    BID_INCREMENT = 100000  # 비공개 경매 낙찰가 = 두 번째로 높은 최고가 + 입찰 단위 (원)
+
+    APPROVE_ERROR_MESSAGE = "승인대기 상태만 경매 승인 가능합니다"
+    COMPLETE_ERROR_MESSAGE = "경매종료 상태만 거래완료 가능합니다"
+
     vehicle = models.OneToOneField(
         'vehicles.Vehicle',
         on_delete=models.PROTECT,
@@ -29,6 +39,26 @@ class Auction(models.Model):
     end_time = models.DateTimeField(null=True, blank=True, verbose_name='경매종료시간')
     completed_at = models.DateTimeField(null=True, blank=True, verbose_name='거래완료시간')
 
+    mode = models.CharField(
+        max_length=10,
+        choices=Mode.choices,
+        default=Mode.OPEN,
+        verbose_name='입찰 방식'
+    )
+
+    # 입찰 기록기(run_bid_writer)가 저장한 입찰 기준 (실시간 값은 Redis)
+    # 비공개 경매는 종료 시 낙찰가/낙찰자로 확정
+    current_price = models.PositiveBigIntegerField(default=0, verbose_name='현재가')
+    bid_count = models.PositiveIntegerField(default=0, verbose_name='입찰 수')
+    winner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='won_auctions',
+        verbose_name='낙찰자'
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -47,17 +77,17 @@ class Auction(models.Model):
     def approve(self):
         """경매 승인"""
         if self.status != self.Status.PENDING:
-            raise ValidationError("승인대기 상태만 경매 승인 가능합니다")
+            raise ValidationError(self.APPROVE_ERROR_MESSAGE)
 
         self.status = self.Status.AUCTION_ACTIVE
         self.start_time = timezone.now()
-        self.end_time = timezone.now() + timezone.timedelta(hours=48)
+        self.end_time = self.start_time + self.DURATION
         self.save()
 
     def complete(self):
         """거래 완료 처리"""
         if self.status != self.Status.AUCTION_ENDED:
-            raise ValidationError("경매종료 상태만 거래완료 가능합니다")
+            raise ValidationError(self.COMPLETE_ERROR_MESSAGE)
 
         self.status = self.Status.TRANSACTION_COMPLETE
         self.completed_at = timezone.now()
@@ -108,4 +138,80 @@ class AuctionHistory(models.Model):
         ordering = ['-created_at']
 
     def __str__(self):
-        return f"{self.vehicle} - {self.action_type}"
\ No newline at end of file
+        return f"{self.vehicle} - {self.action_type}"
+
+
+class Bid(models.Model):
+    """
+    입찰 (Redis 에서 수락된 입찰을 run_bid_writer 가 묶어서 저장)
+
+    비공개 경매에서는 amount 가 입찰자가 제시한 최고가이며 공개하지 않는다.
+    """
+
+    auction = models.ForeignKey(
+        Auction,
+        on_delete=models.CASCADE,
+        related_name='bids',
+        verbose_name='경매'
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='bids',
+        verbose_name='입찰자'
+    )
+    amount = models.PositiveBigIntegerField(verbose_name='입찰가(비공개 경매는 최고가)')
+    sequence = models.PositiveIntegerField(verbose_name='경매 내 입찰 순번')
+    created_at = models.DateTimeField(verbose_name='입찰시간')
+
+    class Meta:
+        db_table = 'bids'
+        verbose_name = '입찰'
+        verbose_name_plural = '입찰 목록'
+        ordering = ['auction', '-sequence']
+        constraints = [
+            # 같은 입찰을 다시 저장해도 중복되지 않도록
+            models.UniqueConstraint(fields=['auction', 'sequence'], name='unique_bid_sequence'),
+        ]
+
+    def __str__(self):
+        return f"{self.auction} - {self.amount}"
+
+
+class AuctionEvent(models.Model):
+    """
+    경매/차량 상태 변경 이벤트 (transactional outbox)
+
+    상태 변경과 같은 트랜잭션에서 기록하고, relay_auction_events 가 Redis stream 으로 발행한다.
+    """
+
+    class EventType(models.TextChoices):
+        VEHICLE_CREATED = 'VEHICLE_CREATED', '차량등록'
+        AUCTION_APPROVED = 'AUCTION_APPROVED', '경매승인'
+        AUCTION_ENDED = 'AUCTION_ENDED', '경매종료'
+        TRANSACTION_COMPLETED = 'TRANSACTION_COMPLETED', '거래완료'
+
+    event_type = models.CharField(
+        max_length=30,
+        choices=EventType.choices,
+        verbose_name='이벤트 타입'
+    )
+    # 차량이 삭제돼도 발행 전 이벤트는 남아야 하므로 FK 로 두지 않음
+    vehicle_id = models.BigIntegerField(verbose_name='차량 ID')
+    payload = models.JSONField(default=dict, blank=True, verbose_name='내용')
+    created_at = models.DateTimeField(auto_now_add=True)
+    published_at = models.DateTimeField(null=True, blank=True, verbose_name='발행시간')
+    # relay 가 발행 중인 배치 표시, 이 시각까지 다른 relay 는 발행하지 않음 (relay 가 죽으면 지난 뒤 다시 발행)
+    claimed_until = models.DateTimeField(null=True, blank=True, verbose_name='발행 선점 만료시간')
+
+    class Meta:
+        db_table = 'auction_events'
+        verbose_name = '경매 이벤트'
+        verbose_name_plural = '경매 이벤트 목록'
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['published_at', 'id']),
+        ]
+
+    def __str__(self):
+        return f"{self.event_type} - {self.vehicle_id}"
@@ -0,0 +1,148 @@
+"""
+경매 이벤트 outbox
+
+상태 변경 트랜잭션 안에서 auction_events 에 이벤트를 기록하고(AuctionEventOutbox.record),
+별도 프로세스(relay_auction_events)가 미발행 이벤트를 id 순으로 묶어 Redis stream 에 발행한다.
+상태 전이 이벤트는 실시간 구독(apps.auctions.stream)을 위해 pub/sub 채널에도 함께 보낸다.
+
+- 이벤트는 상태 변경과 함께 커밋/롤백되므로 유실되거나 롤백된 변경이 발행되지 않는다
+- 배치를 짧은 트랜잭션에서 선점(claimed_until)하고 트랜잭션 밖에서 발행한 뒤 published_at 을 기록한다
+  발행 중에는 행 잠금을 잡지 않으며, 그 사이에 죽으면 선점이 만료된 뒤 다시 발행된다 (at-least-once)
+  구독 측은 event_id 로 중복을 거른다
+"""
+import json
+import logging
+import time
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.db import transaction
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+from apps.auctions.models import AuctionEvent
+from apps.auctions.stream import AuctionStatusBroker, to_status_message
+
+logger = logging.getLogger(__name__)
+
+
+class AuctionEventOutbox:
+    STREAM_KEY = 'vehicle_auction:auction_events'
+    STREAM_MAXLEN = 100000  # 대략적인 최대 길이 (MAXLEN ~)
+
+    BATCH_SIZE = 500
+    CLAIM_TIMEOUT = timedelta(seconds=30)
+    POLL_INTERVAL_SECONDS = 0.5
+    RETENTION = timedelta(days=7)
+    PURGE_INTERVAL_SECONDS = 3600
+
+    def __init__(self, client=None):
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_redis_connection('default')
+        return self._client
+
+    @staticmethod
+    def record(event_type: str, vehicle_ids: Iterable[int], payload: Optional[Dict[str, Any]] = None) -> None:
+        """현재 트랜잭션에 이벤트 기록 (차량마다 한 건)"""
+        AuctionEvent.objects.bulk_create([
+            AuctionEvent(event_type=event_type, vehicle_id=vehicle_id, payload=payload or {})
+            for vehicle_id in vehicle_ids
+        ])
+
+    def relay_batch(self) -> int:
+        """
+        미발행 이벤트 한 배치를 발행, 발행한 수 반환
+
+        배치를 선점한 relay 만 발행하므로 여러 relay 가 떠 있어도 id 순서가 유지된다.
+        Redis 발행이 실패하면 선점을 풀어 다음 실행에서 다시 발행한다.
+        """
+        events = self._claim_batch()
+        if not events:
+            return 0
+        event_ids = [event.id for event in events]
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for event in events:
+                pipe.xadd(self.STREAM_KEY, self._to_fields(event), maxlen=self.STREAM_MAXLEN, approximate=True)
+
+            # 실시간 상태 구독용 (배치당 PUBLISH 1회)
+            messages = [message for message in map(to_status_message, events) if message]
+            if messages:
+                pipe.publish(AuctionStatusBroker.CHANNEL, json.dumps(messages))
+            pipe.execute()
+        except Exception:
+            AuctionEvent.objects.filter(id__in=event_ids).update(claimed_until=None)
+            raise
+
+        AuctionEvent.objects.filter(id__in=event_ids).update(published_at=timezone.now(), claimed_until=None)
+        return len(events)
+
+    @transaction.atomic
+    def _claim_batch(self) -> List[AuctionEvent]:
+        """
+        미발행 이벤트 한 배치를 선점 (다른 relay 가 선점 중이면 빈 목록)
+
+        SKIP LOCKED 로 건너뛰면 뒤쪽 배치가 먼저 발행될 수 있으므로, 선점하는 동안만 잠깐 잠그고 선점 여부로 판단한다.
+        """
+        now = timezone.now()
+        events = list(
+            AuctionEvent.objects.select_for_update().filter(
+                published_at__isnull=True
+            ).order_by('id')[:self.BATCH_SIZE]
+        )
+        if not events or any(event.claimed_until and event.claimed_until > now for event in events):
+            return []
+
+        AuctionEvent.objects.filter(id__in=[event.id for event in events]).update(
+            claimed_until=now + self.CLAIM_TIMEOUT
+        )
+        return events
+
+    def relay_pending(self) -> int:
+        """미발행 이벤트가 없을 때까지 발행"""
+        relayed = 0
+        while True:
+            count = self.relay_batch()
+            relayed += count
+            if count < self.BATCH_SIZE:
+                return relayed
+
+    def purge_published(self) -> int:
+        """보관 기간이 지난 발행 완료 이벤트 삭제"""
+        deleted, _ = AuctionEvent.objects.filter(
+            published_at__lt=timezone.now() - self.RETENTION
+        ).delete()
+        return deleted
+
+    def run(self) -> None:
+        logger.info("경매 이벤트 relay 시작")
+        last_purged = 0.0
+        while True:
+            try:
+                if time.monotonic() - last_purged >= self.PURGE_INTERVAL_SECONDS:
+                    self.purge_published()
+                    last_purged = time.monotonic()
+
+                relayed = self.relay_pending()
+            except Exception:
+                logger.warning("경매 이벤트 발행/정리 실패, 잠시 후 재시도", exc_info=True)
+                relayed = 0
+
+            if relayed:
+                logger.info(f"경매 이벤트 {relayed}개 발행")
+            else:
+                time.sleep(self.POLL_INTERVAL_SECONDS)
+
+    def _to_fields(self, event: AuctionEvent) -> Dict[str, str]:
+        return {
+            'event_id': str(event.id),
+            'event_type': event.event_type,
+            'vehicle_id': str(event.vehicle_id),
+            'payload': json.dumps(event.payload, ensure_ascii=False),
+            'created_at': event.created_at.isoformat(),
+        }
@@ -0,0 +1,46 @@
+from rest_framework import serializers
+
+from apps.auctions.models import Auction
+
+
+class AuctionApproveSerializer(serializers.Serializer):
+    """경매 승인 요청 (입찰 방식 생략 시 공개 입찰)"""
+
+    mode = serializers.ChoiceField(choices=Auction.Mode.choices, default=Auction.Mode.OPEN)
+
+
+class BulkAuctionActionSerializer(serializers.Serializer):
+    """경매 일괄 승인/거래완료 요청"""
+
+    MAX_SIZE = 1000
+
+    vehicle_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=MAX_SIZE
+    )
+
+
+class BulkAuctionApproveSerializer(BulkAuctionActionSerializer):
+    """경매 일괄 승인 요청"""
+
+    mode = serializers.ChoiceField(choices=Auction.Mode.choices, default=Auction.Mode.OPEN)
+
+
+class BidCreateSerializer(serializers.Serializer):
+    """입찰 요청"""
+
+    amount = serializers.IntegerField(min_value=1)
+
+
+class OfferCreateSerializer(serializers.Serializer):
+    """비공개 경매 최고가 제시 요청"""
+
+    ceiling = serializers.IntegerField(min_value=1)
+
+
+class ExpiryForecastQuerySerializer(serializers.Serializer):
+    """종료 예정 분포 조회 범위"""
+
+    minutes = serializers.IntegerField(min_value=1, max_value=24 * 60, default=60)
+    hours = serializers.IntegerField(min_value=1, max_value=72, default=48)
@@ -1,11 +1,18 @@
-from typing import Dict, Any, Optional, List
+import time
+from typing import Dict, Any, Optional, List, Tuple
 from django.db import transaction
+from django.db.models import Case, IntegerField, Value, When
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
 
 from apps.vehicles.models import Vehicle
-from apps.auctions.models import Auction, AuctionHistory
+from apps.vehicles.services import VehicleListingService
+from apps.auctions.models import Auction, AuctionHistory, AuctionEvent
+from apps.auctions.outbox import AuctionEventOutbox
+from apps.auctions.timer import AuctionTimer
+from apps.auctions.forecast import ExpiryForecast
+from apps.auctions.bids import BidEngine
 from rest_framework.exceptions import NotFound
 
 User = get_user_model()
@@ -13,68 +20,346 @@ User = get_user_model()
 
 class AuctionService:
 
+    EXPIRY_BATCH_SIZE = 500
+
+    # 일괄 처리 결과
+    RESULT_OK = 'ok'
+    RESULT_NOT_FOUND = 'not_found'
+    RESULT_INVALID_STATUS = 'invalid_status'
+
+    def __init__(self):
+        self._system_user: Optional[User] = None
+
     @transaction.atomic
-    def approve_auction(self, vehicle_id: int, user: User) -> Vehicle:
+    def approve_auction(self, vehicle_id: int, user: User, mode: str = Auction.Mode.OPEN) -> Vehicle:
+        """
+        경매 승인 (mode 로 공개 입찰/비공개 최고가 제시 방식 선택)
 
-        vehicle = Vehicle.objects.select_related('auction').select_for_update().get(id=vehicle_id)
-        auction = vehicle.auction
+        승인대기 상태일 때만 바뀌는 조건부 UPDATE 한 번으로 전이한다. (행을 미리 잠그지 않음)
+        동시에 승인하면 먼저 커밋한 쪽만 성공하고 나머지는 상태 오류로 끝난다.
+        """
+        now = timezone.now()
+        end_time = now + Auction.DURATION
 
-        auction.approve()
+        self._transition(
+            vehicle_id,
+            Auction.Status.PENDING,
+            Auction.APPROVE_ERROR_MESSAGE,
+            status=Auction.Status.AUCTION_ACTIVE,
+            mode=mode,
+            start_time=now,
+            end_time=end_time,
+            updated_at=now
+        )
 
         AuctionHistory.objects.create(
-            vehicle=vehicle,
-            user=user,
+            vehicle_id=vehicle_id,
+            user_id=user.id,
             action_type=AuctionHistory.ActionType.AUCTION_START
         )
+        AuctionEventOutbox.record(
+            AuctionEvent.EventType.AUCTION_APPROVED, [vehicle_id], {'end_time': end_time.isoformat()}
+        )
+
+        # QuerySet.update() 는 시그널이 없으므로 목록 테이블에 직접 반영 (승인 시 목록에 노출)
+        VehicleListingService().sync_vehicles([vehicle_id])
+
+        vehicle = self._get_vehicle(vehicle_id)
+
+        # 커밋 후 종료 타이머에 등록 (롤백되면 등록하지 않음)
+        AuctionTimer().schedule_on_commit({vehicle.auction.id: end_time})
+        ExpiryForecast().record_on_commit([end_time])
+        BidEngine().forget_on_commit([vehicle_id])
 
         return vehicle
 
     @transaction.atomic
     def complete_transaction(self, vehicle_id: int, user: User) -> Vehicle:
+        """거래 완료 (경매종료 상태일 때만 바뀌는 조건부 UPDATE)"""
+        now = timezone.now()
 
-        vehicle = Vehicle.objects.select_related('auction').select_for_update().get(id=vehicle_id)
-        auction = vehicle.auction
-
-        auction.complete()
+        self._transition(
+            vehicle_id,
+            Auction.Status.AUCTION_ENDED,
+            Auction.COMPLETE_ERROR_MESSAGE,
+            status=Auction.Status.TRANSACTION_COMPLETE,
+            completed_at=now,
+            updated_at=now
+        )
 
         AuctionHistory.objects.create(
-            vehicle=vehicle,
-            user=user,
+            vehicle_id=vehicle_id,
+            user_id=user.id,
             action_type=AuctionHistory.ActionType.TRANSACTION_COMPLETE
         )
+        AuctionEventOutbox.record(AuctionEvent.EventType.TRANSACTION_COMPLETED, [vehicle_id])
 
-        return vehicle
+        VehicleListingService().update_status([vehicle_id], status=Auction.Status.TRANSACTION_COMPLETE)
+
+        return self._get_vehicle(vehicle_id)
+
+    def _transition(self, vehicle_id: int, from_status: str, error_message: str, **fields) -> None:
+        """from_status 인 경매만 fields 로 변경, 변경된 행이 없으면 원인에 맞는 예외"""
+        updated = Auction.objects.filter(
+            vehicle_id=vehicle_id,
+            status=from_status
+        ).update(**fields)
+        if updated:
+            return
 
-    def check_and_end_expired_auctions(self) -> Dict[str, int]:
-        """만료된 경매 자동 종료"""
+        if not Vehicle.objects.filter(id=vehicle_id).exists():
+            raise Vehicle.DoesNotExist("Vehicle matching query does not exist.")
+        raise ValidationError(error_message)
+
+    def _get_vehicle(self, vehicle_id: int) -> Vehicle:
+        return Vehicle.objects.select_related('auction').get(id=vehicle_id)
+
+    @transaction.atomic
+    def bulk_approve(
+        self, vehicle_ids: List[int], user: User, mode: str = Auction.Mode.OPEN
+    ) -> Dict[int, str]:
+        """여러 차량 경매 일괄 승인, {차량 ID: 처리 결과} 반환"""
         now = timezone.now()
+        end_time = now + Auction.DURATION
 
-        # 종료 시간이 지난 경매진행 경매 조회
-        expired_auctions = Auction.objects.filter(
+        results, transitioned = self._bulk_transition(
+            vehicle_ids,
+            Auction.Status.PENDING,
+            AuctionHistory.ActionType.AUCTION_START,
+            user,
             status=Auction.Status.AUCTION_ACTIVE,
-            end_time__lte=now
-        ).select_related('vehicle').select_for_update()
+            mode=mode,
+            start_time=now,
+            end_time=end_time,
+            updated_at=now
+        )
+        if transitioned:
+            AuctionEventOutbox.record(
+                AuctionEvent.EventType.AUCTION_APPROVED, transitioned.values(), {'end_time': end_time.isoformat()}
+            )
+            VehicleListingService().sync_vehicles(transitioned.values())
+            AuctionTimer().schedule_on_commit({auction_id: end_time for auction_id in transitioned})
+            ExpiryForecast().record_on_commit([end_time] * len(transitioned))
+            BidEngine().forget_on_commit(transitioned.values())
+
+        return results
+
+    @transaction.atomic
+    def bulk_complete(self, vehicle_ids: List[int], user: User) -> Dict[int, str]:
+        """여러 차량 일괄 거래 완료, {차량 ID: 처리 결과} 반환"""
+        now = timezone.now()
+
+        results, transitioned = self._bulk_transition(
+            vehicle_ids,
+            Auction.Status.AUCTION_ENDED,
+            AuctionHistory.ActionType.TRANSACTION_COMPLETE,
+            user,
+            status=Auction.Status.TRANSACTION_COMPLETE,
+            completed_at=now,
+            updated_at=now
+        )
+        if transitioned:
+            AuctionEventOutbox.record(AuctionEvent.EventType.TRANSACTION_COMPLETED, transitioned.values())
+            VehicleListingService().update_status(
+                transitioned.values(), status=Auction.Status.TRANSACTION_COMPLETE
+            )
+
+        return results
+
+    def _bulk_transition(
+        self,
+        vehicle_ids: List[int],
+        from_status: str,
+        action_type: str,
+        user: User,
+        **fields
+    ) -> Tuple[Dict[int, str], Dict[int, int]]:
+        """
+        from_status 인 경매만 잠근 뒤 한 번에 변경하고 이력을 bulk_create
+
+        (차량별 결과, 전이된 {경매 ID: 차량 ID}) 반환
+        """
+        vehicle_ids = list(dict.fromkeys(vehicle_ids))
+
+        transitioned = dict(
+            Auction.objects.select_for_update().filter(
+                vehicle_id__in=vehicle_ids,
+                status=from_status
+            ).order_by('id').values_list('id', 'vehicle_id')
+        )
+        if transitioned:
+            Auction.objects.filter(id__in=transitioned).update(**fields)
+            AuctionHistory.objects.bulk_create([
+                AuctionHistory(vehicle_id=vehicle_id, user_id=user.id, action_type=action_type)
+                for vehicle_id in transitioned.values()
+            ])
+
+        succeeded = set(transitioned.values())
+        remaining = [vehicle_id for vehicle_id in vehicle_ids if vehicle_id not in succeeded]
+        existing = set(
+            Auction.objects.filter(vehicle_id__in=remaining).values_list('vehicle_id', flat=True)
+        ) if remaining else set()
+
+        results = {}
+        for vehicle_id in vehicle_ids:
+            if vehicle_id in succeeded:
+                results[vehicle_id] = self.RESULT_OK
+            elif vehicle_id in existing:
+                results[vehicle_id] = self.RESULT_INVALID_STATUS
+            else:
+                results[vehicle_id] = self.RESULT_NOT_FOUND
+        return results, transitioned
+
+    def check_and_end_expired_auctions(self, batch_size: Optional[int] = None) -> Dict[str, Any]:
+        """
+        만료된 경매 자동 종료
+
+        배치마다 짧은 트랜잭션에서 만료 경매를 FOR UPDATE SKIP LOCKED 로 batch_size 개 선점해 종료한다.
+        여러 워커가 동시에 실행해도 서로 다른 경매를 가져가므로 대기 없이 나눠 처리하고,
+        도중에 죽은 워커의 배치는 롤백되어 다른 워커가 다시 가져간다.
+        """
+        batch_size = batch_size or self.EXPIRY_BATCH_SIZE
+        started = time.monotonic()
+        now = timezone.now()
+
+        # 시스템 사용자는 실행마다 한 번만 조회
+        system_user = self.get_system_user()
 
         ended_count = 0
+        batch_timings = []
+
+        while True:
+            batch_started = time.monotonic()
+            claimed, ended = self._claim_and_end_batch(now, batch_size, system_user)
+            if not claimed:
+                break
+            batch_timings.append((time.monotonic() - batch_started) * 1000)
+            ended_count += ended
+
+            # 선점했는데 하나도 종료하지 못했다면 같은 행을 반복 선점하지 않도록 중단
+            if not ended:
+                break
+
+        return {
+            'ended_count': ended_count,
+            'batch_count': len(batch_timings),
+            'max_batch_ms': round(max(batch_timings), 1) if batch_timings else 0.0,
+            'elapsed_ms': round((time.monotonic() - started) * 1000, 1),
+        }
+
+    @transaction.atomic
+    def _claim_and_end_batch(self, now, batch_size: int, system_user: User) -> Tuple[int, int]:
+        """만료 경매 배치 하나 선점 후 종료, (선점 수, 종료 수) 반환"""
+        # (status, end_time) 인덱스 순서대로 읽어 LIMIT 만큼만 잠그고, 다른 워커가 잠근 행은 건너뜀
+        candidates = list(
+            Auction.objects.select_for_update(skip_locked=True).filter(
+                status=Auction.Status.AUCTION_ACTIVE,
+                end_time__lte=now
+            ).order_by('end_time', 'id').values_list('id', 'vehicle_id', 'end_time')[:batch_size]
+        )
+        if not candidates:
+            return 0, 0
+
+        return len(candidates), self._end_auction_batch(candidates, now, system_user)
+
+    def end_auctions(self, auction_ids: List[int]) -> int:
+        """
+        지정한 경매 중 종료 시각이 지난 진행 중 경매만 종료 (종료 타이머용)
+
+        이미 종료됐거나 종료 시각이 연장된 경매는 건너뛰므로 같은 ID 로 여러 번 호출해도 안전하다.
+        """
+        system_user = self.get_system_user()
+        now = timezone.now()
 
         with transaction.atomic():
-            for auction in expired_auctions:
-                # 상태를 경매종료로 변경
-                auction.status = Auction.Status.AUCTION_ENDED
-                auction.save()
-
-                # 히스토리 생성 (시스템 사용자로)
-                system_user, _ = User.objects.get_or_create(
-                    username='system',
-                    defaults={'is_active': False}
-                )
-
-                AuctionHistory.objects.create(
-                    vehicle=auction.vehicle,
-                    user=system_user,
-                    action_type=AuctionHistory.ActionType.AUCTION_END
-                )
-
-                ended_count += 1
-
-        return {'ended_count': ended_count}
\ No newline at end of file
+            # 주기 점검 워커가 선점 중인 경매는 건너뜀 (그쪽에서 종료)
+            candidates = list(
+                Auction.objects.select_for_update(skip_locked=True).filter(
+                    id__in=auction_ids,
+                    status=Auction.Status.AUCTION_ACTIVE,
+                    end_time__lte=now
+                ).order_by('id').values_list('id', 'vehicle_id', 'end_time')
+            )
+            if not candidates:
+                return 0
+
+            return self._end_auction_batch(candidates, now, system_user)
+
+    @transaction.atomic(savepoint=False)
+    def _end_auction_batch(self, candidates: List[Tuple[int, int, Any]], now, system_user: User) -> int:
+        """배치 하나 종료 (candidates: (경매 ID, 차량 ID, 종료 시각)), 실제로 종료한 경매 수 반환"""
+        auction_ids = [auction_id for auction_id, _, _ in candidates]
+
+        # 조회 이후 다른 경로에서 상태가 바뀐 경매는 건너뜀
+        updated = Auction.objects.filter(
+            id__in=auction_ids,
+            status=Auction.Status.AUCTION_ACTIVE,
+            end_time__lte=now
+        ).update(
+            status=Auction.Status.AUCTION_ENDED,
+            updated_at=now
+        )
+        if not updated:
+            return 0
+
+        if updated == len(candidates):
+            ended = [(vehicle_id, end_time) for _, vehicle_id, end_time in candidates]
+        else:
+            # 일부만 종료된 경우 이번 UPDATE 가 남긴 updated_at 으로 대상 식별
+            ended = list(
+                Auction.objects.filter(
+                    id__in=auction_ids,
+                    status=Auction.Status.AUCTION_ENDED,
+                    updated_at=now
+                ).values_list('vehicle_id', 'end_time')
+            )
+        vehicle_ids = [vehicle_id for vehicle_id, _ in ended]
+
+        AuctionHistory.objects.bulk_create([
+            AuctionHistory(
+                vehicle_id=vehicle_id,
+                user=system_user,
+                action_type=AuctionHistory.ActionType.AUCTION_END
+            )
+            for vehicle_id in vehicle_ids
+        ])
+        AuctionEventOutbox.record(AuctionEvent.EventType.AUCTION_ENDED, vehicle_ids)
+        self._settle_sealed(vehicle_ids)
+        ExpiryForecast().discard_on_commit([end_time for _, end_time in ended])
+
+        # QuerySet.update() 는 시그널이 없으므로 목록 테이블에 직접 반영 (공개 여부는 그대로)
+        VehicleListingService().update_status(vehicle_ids, status=Auction.Status.AUCTION_ENDED)
+
+        return len(vehicle_ids)
+
+    def _settle_sealed(self, vehicle_ids: List[int]) -> None:
+        """종료된 비공개 경매의 낙찰자/낙찰가를 ladder 에서 계산해 UPDATE 한 번으로 기록"""
+        sealed = dict(
+            Auction.objects.filter(
+                vehicle_id__in=vehicle_ids,
+                mode=Auction.Mode.SEALED
+            ).values_list('id', 'vehicle_id')
+        )
+        if not sealed:
+            return
+
+        settlements = BidEngine().settle(sealed)
+        Auction.objects.filter(id__in=settlements).update(
+            winner_id=Case(
+                *[When(id=auction_id, then=Value(winner_id)) for auction_id, (winner_id, _) in settlements.items()],
+                output_field=IntegerField()
+            ),
+            current_price=Case(
+                *[When(id=auction_id, then=Value(price)) for auction_id, (_, price) in settlements.items()],
+                output_field=IntegerField()
+            )
+        )
+
+    def get_system_user(self) -> User:
+        """자동 처리 이력에 기록할 시스템 사용자 (인스턴스 단위로 한 번만 조회)"""
+        if self._system_user is None:
+            self._system_user, _ = User.objects.get_or_create(
+                username='system',
+                defaults={'is_active': False}
+            )
+        return self._system_user
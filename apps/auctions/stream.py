@@ -0,0 +1,158 @@
+"""
+경매 상태 실시간 전송 (Server-Sent Events)
+
+경매 이벤트 relay 가 발행한 이벤트 배치를 Redis pub/sub 채널로도 보내고,
+ASGI 프로세스마다 구독 1개(AuctionStatusBroker)로 받아 해당 차량을 구독 중인 연결에 나눠 준다.
+클라이언트는 받은 end_time 으로 남은 시간을 직접 계산한다.
+
+- 브라우저 EventSource 는 헤더를 보낼 수 없으므로, access 토큰으로 발급받은 짧은 서명 토큰(?token=)으로도 연결할 수 있다
+- 초기 상태는 pub/sub 구독이 확인된 뒤에 읽어 그 사이 변경을 놓치지 않는다
+- 연결이 읽지 못해 큐가 차면 밀린 메시지 대신 RESYNC 하나를 넣어 현재 상태를 다시 보내게 한다
+"""
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from django.conf import settings
+from django.core import signing
+
+from apps.auctions.models import Auction, AuctionEvent
+
+logger = logging.getLogger(__name__)
+
+
+STATUS_BY_EVENT_TYPE = {
+    AuctionEvent.EventType.AUCTION_APPROVED: Auction.Status.AUCTION_ACTIVE,
+    AuctionEvent.EventType.AUCTION_ENDED: Auction.Status.AUCTION_ENDED,
+    AuctionEvent.EventType.TRANSACTION_COMPLETED: Auction.Status.TRANSACTION_COMPLETE,
+}
+
+
+STREAM_TOKEN_SALT = 'vehicle_auction.auction_status_stream'
+STREAM_TOKEN_SECONDS = 60
+
+# 큐가 넘친 연결에 넣는 표시 (받으면 현재 상태를 다시 보냄)
+RESYNC = object()
+
+
+def issue_stream_token(user_id: int) -> str:
+    """SSE 연결용 서명 토큰 (STREAM_TOKEN_SECONDS 안에 연결해야 함)"""
+    return signing.dumps({'user_id': user_id}, salt=STREAM_TOKEN_SALT)
+
+
+def verify_stream_token(token: str) -> Optional[int]:
+    """유효하면 user_id, 만료/위조면 None"""
+    try:
+        return signing.loads(token, salt=STREAM_TOKEN_SALT, max_age=STREAM_TOKEN_SECONDS)['user_id']
+    except (signing.BadSignature, KeyError, TypeError):
+        return None
+
+
+def to_status_message(event: AuctionEvent) -> Optional[Dict[str, Any]]:
+    """이벤트 → 클라이언트 전송 메시지 (목록에 노출되지 않는 차량 등록은 None)"""
+    status = STATUS_BY_EVENT_TYPE.get(event.event_type)
+    if status is None:
+        return None
+
+    message = {'event_id': event.id, 'vehicle_id': event.vehicle_id, 'status': status}
+    if 'end_time' in event.payload:
+        message['end_time'] = event.payload['end_time']
+    return message
+
+
+class AuctionStatusBroker:
+    """프로세스 단위 pub/sub 구독을 차량별 구독 큐로 분배"""
+
+    CHANNEL = 'vehicle_auction:auction_status'
+
+    QUEUE_SIZE = 100
+    RECONNECT_SECONDS = 1.0
+    SUBSCRIBE_TIMEOUT_SECONDS = 5.0
+
+    def __init__(self):
+        self._queues: Dict[int, Set[asyncio.Queue]] = {}
+        self._listener: Optional[asyncio.Task] = None
+        self._subscribed = asyncio.Event()
+
+    def subscribe(self, vehicle_ids: Iterable[int]) -> asyncio.Queue:
+        self._ensure_listener()
+        queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        for vehicle_id in vehicle_ids:
+            self._queues.setdefault(vehicle_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue, vehicle_ids: Iterable[int]) -> None:
+        for vehicle_id in vehicle_ids:
+            queues = self._queues.get(vehicle_id)
+            if queues is None:
+                continue
+            queues.discard(queue)
+            if not queues:
+                del self._queues[vehicle_id]
+
+    def dispatch(self, messages: List[Dict[str, Any]]) -> None:
+        for message in messages:
+            for queue in self._queues.get(message['vehicle_id'], ()):
+                try:
+                    queue.put_nowait(message)
+                except asyncio.QueueFull:
+                    logger.warning(f"경매 상태 구독 큐가 가득 참, 다시 동기화: vehicle_id={message['vehicle_id']}")
+                    self._resync(queue)
+
+    def _resync(self, queue: asyncio.Queue) -> None:
+        # 밀린 메시지를 버리고 RESYNC 하나만 남김 (상태 변경을 조용히 잃지 않음)
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(RESYNC)
+
+    async def wait_subscribed(self) -> bool:
+        """pub/sub 구독이 확인될 때까지 대기, 시간 안에 확인되지 않으면 False"""
+        self._ensure_listener()
+        try:
+            await asyncio.wait_for(self._subscribed.wait(), timeout=self.SUBSCRIBE_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def _ensure_listener(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.get_running_loop().create_task(self._listen())
+
+    async def _listen(self) -> None:
+        from redis import asyncio as redis_asyncio
+
+        reconnecting = False
+        while True:
+            client = redis_asyncio.from_url(settings.REDIS_URL)
+            try:
+                async with client.pubsub() as pubsub:
+                    await pubsub.subscribe(self.CHANNEL)
+                    async for message in pubsub.listen():
+                        if message['type'] == 'subscribe':
+                            self._subscribed.set()
+                            if reconnecting:
+                                # 끊긴 동안 발행된 메시지는 받지 못했으므로 모든 연결을 다시 동기화
+                                for queue in {queue for queues in self._queues.values() for queue in queues}:
+                                    self._resync(queue)
+                        elif message['type'] == 'message':
+                            self.dispatch(json.loads(message['data']))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("경매 상태 구독 끊김, 재연결", exc_info=True)
+                await asyncio.sleep(self.RECONNECT_SECONDS)
+            finally:
+                self._subscribed.clear()
+                reconnecting = True
+                await client.close()
+
+
+_broker: Optional[AuctionStatusBroker] = None
+
+
+def get_broker() -> AuctionStatusBroker:
+    global _broker
+    if _broker is None:
+        _broker = AuctionStatusBroker()
+    return _broker
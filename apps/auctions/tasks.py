@@ -15,6 +15,20 @@ def check_expired_auctions() -> Dict[str, int]:
     service = AuctionService()
     result = service.check_and_end_expired_auctions()
 
-    logger.info(f"경매 만료 확인 완료: {result['ended_count']}개 경매 종료")
+    logger.info(
+        f"경매 만료 확인 완료: {result['ended_count']}개 경매 종료 "
+        f"(배치 {result['batch_count']}개, 최대 {result['max_batch_ms']}ms, 전체 {result['elapsed_ms']}ms)"
+    )
 
-    return result
+    return {'ended_count': result['ended_count']}
+
+
+@shared_task
+def rebuild_expiry_forecast() -> int:
+    """경매 종료 예정 분포를 DB 기준으로 다시 계산 (증감 누락 보정)"""
+
+    from apps.auctions.forecast import ExpiryForecast
+
+    counted = ExpiryForecast().rebuild()
+    logger.info(f"경매 종료 예정 분포 재계산: 진행 중 경매 {counted}개")
+    return counted
@@ -1,4 +1,6 @@
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.core.exceptions import ValidationError
@@ -7,7 +9,7 @@ from rest_framework import status
 from datetime import timedelta
 from unittest.mock import patch, MagicMock
 
-from apps.vehicles.models import Brand, CarType, Model, Vehicle
+from apps.vehicles.models import Brand, CarType, Model, Vehicle, VehicleListing
 from apps.auctions.models import Auction, AuctionHistory
 from apps.auctions.services import AuctionService
 
@@ -253,4 +255,117 @@ class CeleryTaskTestCase(TestCase):
 
         self.assertEqual(expired_vehicle.auction.status, Auction.Status.AUCTION_ENDED)
         self.assertEqual(active_vehicle.auction.status, Auction.Status.AUCTION_ACTIVE)
-        self.assertEqual(result, {'ended_count': 1})
\ No newline at end of file
+        self.assertEqual(result, {'ended_count': 1})
+
+
+class BulkAuctionActionTestCase(TestCase):
+    """경매 일괄 승인/거래완료 API 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.admin_user = User.objects.create_user(
+            username='test_admin_bulk',
+            password='adminpass',
+            is_staff=True
+        )
+        self.regular_user = User.objects.create_user(
+            username='test_user_bulk',
+            password='userpass'
+        )
+
+        self.brand = Brand.objects.create(name='현대')
+        self.car_type = CarType.objects.create(brand=self.brand, name='SUV')
+        self.model = Model.objects.create(car_type=self.car_type, name='팰리세이드')
+
+    def _create_vehicle(self, auction_status=Auction.Status.PENDING):
+        vehicle = Vehicle.objects.create(
+            year=2022,
+            first_registration_date=timezone.now().date(),
+            model=self.model,
+            color='블랙',
+            fuel_type=Vehicle.FuelType.GASOLINE,
+            transmission=Vehicle.Transmission.AUTO,
+            mileage=10000,
+            region='서울'
+        )
+        Auction.objects.create(vehicle=vehicle, status=auction_status)
+        return vehicle
+
+    def test_bulk_approve(self):
+        self.client.force_authenticate(user=self.admin_user)
+        pending = [self._create_vehicle() for _ in range(3)]
+        active = self._create_vehicle(Auction.Status.AUCTION_ACTIVE)
+        vehicle_ids = [vehicle.id for vehicle in pending] + [active.id, 9999]
+
+        response = self.client.post('/api/auctions/bulk-approve/', {'vehicle_ids': vehicle_ids}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {
+            'count': 3,
+            'results': {
+                **{str(vehicle.id): 'ok' for vehicle in pending},
+                str(active.id): 'invalid_status',
+                '9999': 'not_found',
+            }
+        })
+        self.assertEqual(
+            Auction.objects.filter(status=Auction.Status.AUCTION_ACTIVE, end_time__isnull=False).count(), 3
+        )
+        self.assertEqual(
+            AuctionHistory.objects.filter(action_type=AuctionHistory.ActionType.AUCTION_START).count(), 3
+        )
+        self.assertEqual(
+            set(VehicleListing.objects.values_list('vehicle_id', flat=True)),
+            {vehicle.id for vehicle in pending} | {active.id}
+        )
+
+    def test_bulk_approve_query_count_is_constant(self):
+        self.client.force_authenticate(user=self.admin_user)
+
+        def count_queries(size):
+            vehicle_ids = [self._create_vehicle().id for _ in range(size)]
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(
+                    '/api/auctions/bulk-approve/', {'vehicle_ids': vehicle_ids}, format='json'
+                )
+            self.assertEqual(response.data['count'], size)
+            return len(queries.captured_queries)
+
+        self.assertEqual(count_queries(2), count_queries(10))
+
+    def test_bulk_complete(self):
+        self.client.force_authenticate(user=self.admin_user)
+        ended = self._create_vehicle(Auction.Status.AUCTION_ENDED)
+        pending = self._create_vehicle()
+
+        response = self.client.post(
+            '/api/auctions/bulk-complete/', {'vehicle_ids': [ended.id, pending.id]}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(response.json()['results'], {str(ended.id): 'ok', str(pending.id): 'invalid_status'})
+        ended.auction.refresh_from_db()
+        self.assertEqual(ended.auction.status, Auction.Status.TRANSACTION_COMPLETE)
+        self.assertIsNotNone(ended.auction.completed_at)
+        self.assertTrue(
+            AuctionHistory.objects.filter(
+                vehicle=ended,
+                action_type=AuctionHistory.ActionType.TRANSACTION_COMPLETE
+            ).exists()
+        )
+
+    def test_bulk_requires_admin(self):
+        self.client.force_authenticate(user=self.regular_user)
+        vehicle = self._create_vehicle()
+
+        response = self.client.post('/api/auctions/bulk-approve/', {'vehicle_ids': [vehicle.id]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_bulk_invalid_payload(self):
+        self.client.force_authenticate(user=self.admin_user)
+
+        for payload in ({}, {'vehicle_ids': []}, {'vehicle_ids': ['abc']}):
+            response = self.client.post('/api/auctions/bulk-approve/', payload, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,212 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.core.exceptions import ValidationError
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from apps.common.testing import FakeRedisMixin
+from apps.vehicles.models import Brand, CarType, Model, Vehicle
+from apps.auctions.bids import BidEngine
+from apps.auctions.models import Auction, Bid
+
+User = get_user_model()
+
+
+class BidEngineTestCase(FakeRedisMixin, TestCase):
+    """입찰 엔진 테스트"""
+
+    def setUp(self):
+        self.redis = self.use_fake_redis()
+        self.engine = BidEngine(client=self.redis, consumer='test')
+        self.engine.ensure_group()
+        self.user = User.objects.create_user(username='bidder', password='userpass')
+        self.other = User.objects.create_user(username='bidder2', password='userpass')
+
+        brand = Brand.objects.create(name='현대')
+        car_type = CarType.objects.create(brand=brand, name='SUV')
+        self.model = Model.objects.create(car_type=car_type, name='팰리세이드')
+        self.vehicle = self._create_vehicle(Auction.Status.AUCTION_ACTIVE)
+
+    def _create_vehicle(self, auction_status):
+        vehicle = Vehicle.objects.create(
+            year=2022,
+            first_registration_date=timezone.now().date(),
+            model=self.model,
+            color='블랙',
+            fuel_type=Vehicle.FuelType.GASOLINE,
+            transmission=Vehicle.Transmission.AUTO,
+            mileage=10000,
+            region='서울'
+        )
+        Auction.objects.create(
+            vehicle=vehicle,
+            status=auction_status,
+            start_time=timezone.now(),
+            end_time=timezone.now() + timedelta(hours=48)
+        )
+        return vehicle
+
+    def test_place_loads_state_once(self):
+        with self.assertNumQueries(1):
+            first = self.engine.place(self.vehicle.id, self.user.id, 1000000)
+        with self.assertNumQueries(0):
+            second = self.engine.place(self.vehicle.id, self.other.id, 1100000)
+
+        self.assertEqual((first.amount, first.sequence), (1000000, 1))
+        self.assertEqual((second.amount, second.sequence), (1100000, 2))
+
+    def test_reject_not_higher_than_current_price(self):
+        self.engine.place(self.vehicle.id, self.user.id, 1000000)
+
+        with self.assertRaises(ValidationError) as ctx:
+            self.engine.place(self.vehicle.id, self.other.id, 1000000)
+
+        self.assertEqual(ctx.exception.code, 'too_low')
+        self.assertEqual(ctx.exception.params, {'current_price': 1000000})
+
+    def test_reject_after_end_time(self):
+        self.engine.place(self.vehicle.id, self.user.id, 1000000)
+        self.redis.hset(
+            BidEngine.STATE_KEY.format(vehicle_id=self.vehicle.id),
+            'end_ms', int((timezone.now() - timedelta(seconds=1)).timestamp() * 1000)
+        )
+
+        with self.assertRaises(ValidationError) as ctx:
+            self.engine.place(self.vehicle.id, self.other.id, 2000000)
+
+        self.assertEqual(ctx.exception.code, 'closed')
+
+    def test_reject_inactive_auction_until_approved(self):
+        pending = self._create_vehicle(Auction.Status.PENDING)
+
+        with self.assertRaises(ValidationError):
+            self.engine.place(pending.id, self.user.id, 1000000)
+        # 거절 상태를 기억해 DB 를 다시 조회하지 않음
+        with self.assertNumQueries(0):
+            with self.assertRaises(ValidationError):
+                self.engine.place(pending.id, self.user.id, 1000000)
+
+        Auction.objects.filter(vehicle=pending).update(status=Auction.Status.AUCTION_ACTIVE)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.engine.forget_on_commit([pending.id])
+
+        self.assertEqual(self.engine.place(pending.id, self.user.id, 1000000).sequence, 1)
+
+    def test_flush_persists_batch_idempotently(self):
+        for amount in (1000000, 1100000, 1200000):
+            self.engine.place(self.vehicle.id, self.user.id, amount)
+        entries = self.redis.xrange(BidEngine.STREAM_KEY)
+
+        self.assertEqual(self.engine.flush(), 3)
+        # 저장 후 XACK 전에 죽어 같은 입찰을 다시 저장하는 경우
+        self.engine._persist(entries)
+
+        self.assertEqual(
+            list(Bid.objects.order_by('sequence').values_list('sequence', 'amount', 'user_id')),
+            [(1, 1000000, self.user.id), (2, 1100000, self.user.id), (3, 1200000, self.user.id)]
+        )
+        auction = Auction.objects.get(vehicle=self.vehicle)
+        self.assertEqual((auction.current_price, auction.bid_count), (1200000, 3))
+        self.assertEqual(self.redis.xlen(BidEngine.STREAM_KEY), 0)
+        self.assertEqual(self.engine.flush(), 0)
+
+    def test_unflushed_bids_stay_in_stream(self):
+        for amount in range(1000000, 1500000, 100000):
+            self.engine.place(self.vehicle.id, self.user.id, amount)
+
+        # 기록기가 밀려 한 배치만 저장한 경우 나머지는 stream 에 남아 있음
+        with mock.patch.object(BidEngine, 'BATCH_SIZE', 2):
+            self.assertEqual(self.engine.flush(), 2)
+        self.assertEqual(self.redis.xlen(BidEngine.STREAM_KEY), 3)
+
+        self.assertEqual(self.engine.flush(), 3)
+        self.assertEqual(Bid.objects.count(), 5)
+
+    def test_reload_continues_from_persisted_state(self):
+        self.engine.place(self.vehicle.id, self.user.id, 1000000)
+        self.engine.flush()
+        self.redis.delete(BidEngine.STATE_KEY.format(vehicle_id=self.vehicle.id))
+
+        with self.assertRaises(ValidationError):
+            self.engine.place(self.vehicle.id, self.other.id, 900000)
+        self.assertEqual(self.engine.place(self.vehicle.id, self.other.id, 1100000).sequence, 2)
+
+    def test_sequence_conflict_is_kept_not_dropped(self):
+        self.engine.place(self.vehicle.id, self.user.id, 1000000)
+        self.engine.flush()
+        self.engine.place(self.vehicle.id, self.user.id, 1100000)
+        # 저장 전 입찰이 있는 상태에서 경매 상태가 사라져 DB 기준으로 다시 적재되면 순번 2 가 다시 쓰임
+        self.redis.delete(BidEngine.STATE_KEY.format(vehicle_id=self.vehicle.id))
+        self.assertEqual(self.engine.place(self.vehicle.id, self.other.id, 1050000).sequence, 2)
+
+        with self.assertLogs('apps.auctions.bids', level='ERROR'):
+            self.assertEqual(self.engine.flush(), 2)
+
+        self.assertEqual(
+            list(Bid.objects.order_by('sequence').values_list('sequence', 'amount')),
+            [(1, 1000000), (2, 1100000)]
+        )
+        conflicts = self.redis.xrange(BidEngine.CONFLICT_STREAM_KEY)
+        self.assertEqual(len(conflicts), 1)
+        self.assertEqual(conflicts[0][1][b'amount'], b'1050000')
+        self.assertEqual(self.redis.xlen(BidEngine.STREAM_KEY), 0)
+
+
+class BidAPITestCase(FakeRedisMixin, TestCase):
+    """입찰 API 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='bidder_api', password='userpass')
+        self.client.force_authenticate(user=self.user)
+
+        brand = Brand.objects.create(name='현대')
+        car_type = CarType.objects.create(brand=brand, name='SUV')
+        model = Model.objects.create(car_type=car_type, name='팰리세이드')
+        self.vehicle = Vehicle.objects.create(
+            year=2022,
+            first_registration_date=timezone.now().date(),
+            model=model,
+            color='블랙',
+            fuel_type=Vehicle.FuelType.GASOLINE,
+            transmission=Vehicle.Transmission.AUTO,
+            mileage=10000,
+            region='서울'
+        )
+        Auction.objects.create(
+            vehicle=self.vehicle,
+            status=Auction.Status.AUCTION_ACTIVE,
+            start_time=timezone.now(),
+            end_time=timezone.now() + timedelta(hours=48)
+        )
+        self.use_fake_redis(BidEngine)
+
+    def test_place_bid(self):
+        response = self.client.post(f'/api/auctions/{self.vehicle.id}/bids/', {'amount': 1000000}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data, {'vehicle_id': self.vehicle.id, 'amount': 1000000, 'sequence': 1})
+
+    def test_place_bid_too_low(self):
+        self.client.post(f'/api/auctions/{self.vehicle.id}/bids/', {'amount': 1000000}, format='json')
+
+        response = self.client.post(f'/api/auctions/{self.vehicle.id}/bids/', {'amount': 900000}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data['code'], 'too_low')
+        self.assertEqual(response.data['current_price'], 1000000)
+
+    def test_place_bid_unknown_vehicle(self):
+        response = self.client.post('/api/auctions/9999/bids/', {'amount': 1000000}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['code'], 'closed')
+
+    def test_place_bid_invalid_amount(self):
+        response = self.client.post(f'/api/auctions/{self.vehicle.id}/bids/', {'amount': 0}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
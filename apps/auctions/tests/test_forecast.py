@@ -0,0 +1,151 @@
+from collections import Counter
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from apps.common.testing import FakeRedisMixin
+from apps.vehicles.models import Brand, CarType, Model, Vehicle
+from apps.auctions.forecast import ExpiryForecast
+from apps.auctions.models import Auction
+from apps.auctions.services import AuctionService
+
+User = get_user_model()
+
+
+class ExpiryForecastTestCase(FakeRedisMixin, TestCase):
+    """경매 종료 예정 분포 테스트"""
+
+    def setUp(self):
+        self.redis = self.use_fake_redis(ExpiryForecast)
+
+        self.admin_user = User.objects.create_user(username='forecast_admin', password='adminpass', is_staff=True)
+        brand = Brand.objects.create(name='현대')
+        car_type = CarType.objects.create(brand=brand, name='SUV')
+        self.model = Model.objects.create(car_type=car_type, name='팰리세이드')
+        self.service = AuctionService()
+
+    def _create_vehicle(self, auction_status=Auction.Status.PENDING, end_time=None):
+        vehicle = Vehicle.objects.create(
+            year=2022,
+            first_registration_date=timezone.now().date(),
+            model=self.model,
+            color='블랙',
+            fuel_type=Vehicle.FuelType.GASOLINE,
+            transmission=Vehicle.Transmission.AUTO,
+            mileage=10000,
+            region='서울'
+        )
+        Auction.objects.create(vehicle=vehicle, status=auction_status, end_time=end_time)
+        return vehicle
+
+    def _approve(self, count):
+        vehicles = [self._create_vehicle() for _ in range(count)]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.bulk_approve([vehicle.id for vehicle in vehicles], self.admin_user)
+        return vehicles
+
+    def test_approve_counts_upcoming_expiry(self):
+        self._approve(3)
+        vehicle = self._create_vehicle()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.approve_auction(vehicle.id, self.admin_user)
+
+        # 48시간 뒤 종료이므로 끝 구간까지 포함해 조회
+        snapshot = ExpiryForecast().snapshot(minutes=48 * 60 + 2, hours=49)
+
+        self.assertEqual(sum(bucket['count'] for bucket in snapshot['per_minute']), 4)
+        self.assertEqual(sum(bucket['count'] for bucket in snapshot['per_hour']), 4)
+        self.assertGreaterEqual(snapshot['peak_minute']['count'], 3)
+        self.assertEqual(snapshot['overdue'], 0)
+
+    def test_expiry_removes_ended_auctions(self):
+        self._approve(2)
+        Auction.objects.update(end_time=timezone.now() - timedelta(minutes=5))
+        ExpiryForecast().rebuild()
+        self.assertEqual(ExpiryForecast().snapshot()['overdue'], 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.check_and_end_expired_auctions()
+
+        self.assertEqual(self.redis.hgetall(ExpiryForecast.MINUTE_KEY), {})
+        self.assertEqual(self.redis.hgetall(ExpiryForecast.HOUR_KEY), {})
+
+    def test_rebuild_matches_active_auctions(self):
+        now = timezone.now()
+        self._create_vehicle(Auction.Status.AUCTION_ACTIVE, now + timedelta(minutes=10))
+        self._create_vehicle(Auction.Status.AUCTION_ACTIVE, now + timedelta(minutes=10))
+        self._create_vehicle(Auction.Status.AUCTION_ACTIVE, now + timedelta(hours=5))
+        self._create_vehicle(Auction.Status.AUCTION_ENDED, now + timedelta(minutes=10))
+
+        self.assertEqual(ExpiryForecast().rebuild(), 3)
+
+        metrics = ExpiryForecast().metrics(now=now)
+        self.assertEqual(metrics['upcoming']['15m'], 2)
+        self.assertEqual(metrics['upcoming']['24h'], 3)
+        self.assertEqual(metrics['peak_per_minute']['1h'], 2)
+
+    def test_read_falls_back_to_database(self):
+        self._create_vehicle(Auction.Status.AUCTION_ACTIVE, timezone.now() + timedelta(minutes=10))
+        broken = mock.Mock()
+        broken.pipeline.side_effect = ConnectionError
+
+        with mock.patch.object(ExpiryForecast, 'client', broken):
+            with self.assertLogs('apps.auctions.forecast', level='WARNING'):
+                snapshot = ExpiryForecast().snapshot()
+
+        self.assertEqual([bucket['count'] for bucket in snapshot['per_minute']], [1])
+
+
+class ExpiryForecastAPITestCase(FakeRedisMixin, TestCase):
+    """경매 종료 예정 분포 API 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.use_fake_redis(ExpiryForecast)
+
+        self.admin_user = User.objects.create_user(username='forecast_api_admin', password='adminpass', is_staff=True)
+        self.user = User.objects.create_user(username='forecast_api_user', password='userpass')
+        end_time = timezone.now() + timedelta(minutes=3)
+        ExpiryForecast()._apply(
+            Counter({(ExpiryForecast.minute_bucket(end_time), ExpiryForecast.hour_bucket(end_time)): 2}), 1
+        )
+
+    def test_forecast_requires_staff(self):
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get('/api/auctions/expiry-forecast/')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_forecast(self):
+        self.client.force_authenticate(user=self.admin_user)
+
+        response = self.client.get('/api/auctions/expiry-forecast/', {'minutes': 10, 'hours': 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([bucket['count'] for bucket in response.data['per_minute']], [2])
+        self.assertEqual(response.data['peak_minute']['count'], 2)
+
+    def test_forecast_rejects_invalid_range(self):
+        self.client.force_authenticate(user=self.admin_user)
+
+        response = self.client.get('/api/auctions/expiry-forecast/', {'hours': 0})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_metrics(self):
+        self.client.force_authenticate(user=self.admin_user)
+
+        response = self.client.get('/api/auctions/expiry-forecast/metrics/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        body = response.content.decode()
+        self.assertIn('auction_expiring_auctions{window="5m"} 2', body)
+        self.assertIn('auction_expiring_peak_per_minute{window="1h"} 2', body)
+        self.assertIn('auction_overdue_auctions 0', body)
@@ -0,0 +1,229 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.core.exceptions import ValidationError
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from apps.common.testing import FakeRedisMixin
+from apps.vehicles.models import Brand, CarType, Model, Vehicle
+from apps.auctions.bids import BidEngine
+from apps.auctions.models import Auction, Bid
+from apps.auctions.services import AuctionService
+
+User = get_user_model()
+
+INCREMENT = Auction.BID_INCREMENT
+
+
+class SealedOfferTestCase(FakeRedisMixin, TestCase):
+    """비공개 최고가 경매 테스트"""
+
+    def setUp(self):
+        self.redis = self.use_fake_redis()
+        self.engine = BidEngine(client=self.redis, consumer='test')
+        self.engine.ensure_group()
+        self.admin_user = User.objects.create_user(username='sealed_admin', password='adminpass', is_staff=True)
+        self.users = [
+            User.objects.create_user(username=f'sealed_bidder{i}', password='userpass') for i in range(3)
+        ]
+
+        brand = Brand.objects.create(name='현대')
+        car_type = CarType.objects.create(brand=brand, name='SUV')
+        self.model = Model.objects.create(car_type=car_type, name='팰리세이드')
+        self.vehicle = self._create_vehicle(Auction.Mode.SEALED)
+
+    def _create_vehicle(self, mode):
+        vehicle = Vehicle.objects.create(
+            year=2022,
+            first_registration_date=timezone.now().date(),
+            model=self.model,
+            color='블랙',
+            fuel_type=Vehicle.FuelType.GASOLINE,
+            transmission=Vehicle.Transmission.AUTO,
+            mileage=10000,
+            region='서울'
+        )
+        Auction.objects.create(
+            vehicle=vehicle,
+            status=Auction.Status.AUCTION_ACTIVE,
+            mode=mode,
+            start_time=timezone.now(),
+            end_time=timezone.now() + timedelta(hours=48)
+        )
+        return vehicle
+
+    def _offer(self, user, ceiling):
+        return self.engine.place_offer(self.vehicle.id, user.id, ceiling)
+
+    def _evict_state(self):
+        self.redis.delete(
+            BidEngine.STATE_KEY.format(vehicle_id=self.vehicle.id),
+            BidEngine.LADDER_KEY.format(vehicle_id=self.vehicle.id),
+            BidEngine.MEMBERS_KEY.format(vehicle_id=self.vehicle.id),
+        )
+
+    def _end(self):
+        Auction.objects.update(end_time=timezone.now() - timedelta(seconds=1))
+        with mock.patch.object(BidEngine, 'client', self.redis):
+            AuctionService().check_and_end_expired_auctions()
+        return Auction.objects.get(vehicle=self.vehicle)
+
+    def test_clearing_price_is_second_ceiling_plus_increment(self):
+        self.assertEqual(self._offer(self.users[0], 10000000).clearing_price, INCREMENT)
+        self.assertEqual(self._offer(self.users[1], 15000000).clearing_price, 10000000 + INCREMENT)
+        self.assertEqual(self._offer(self.users[2], 12000000).clearing_price, 12000000 + INCREMENT)
+
+    def test_clearing_price_capped_at_highest_ceiling(self):
+        self._offer(self.users[0], 10000000)
+
+        self.assertEqual(self._offer(self.users[1], 10050000).clearing_price, 10050000)
+
+    def test_raising_ceiling_replaces_previous_offer(self):
+        self._offer(self.users[0], 10000000)
+        self._offer(self.users[1], 12000000)
+
+        with self.assertRaises(ValidationError) as ctx:
+            self._offer(self.users[0], 9000000)
+        self.assertEqual(ctx.exception.code, 'too_low')
+
+        # 자기 이전 최고가는 두 번째 최고가로 남지 않음
+        self.assertEqual(self._offer(self.users[0], 13000000).clearing_price, 12000000 + INCREMENT)
+        self.assertEqual(self.redis.zcard(BidEngine.LADDER_KEY.format(vehicle_id=self.vehicle.id)), 2)
+
+    def test_modes_do_not_mix(self):
+        open_vehicle = self._create_vehicle(Auction.Mode.OPEN)
+
+        with self.assertRaises(ValidationError) as ctx:
+            self.engine.place(self.vehicle.id, self.users[0].id, 10000000)
+        self.assertEqual(ctx.exception.code, 'wrong_mode')
+
+        with self.assertRaises(ValidationError) as ctx:
+            self.engine.place_offer(open_vehicle.id, self.users[0].id, 10000000)
+        self.assertEqual(ctx.exception.code, 'wrong_mode')
+
+    def test_flush_keeps_current_price_hidden(self):
+        self._offer(self.users[0], 10000000)
+        self._offer(self.users[1], 12000000)
+
+        self.assertEqual(self.engine.flush(), 2)
+
+        auction = Auction.objects.get(vehicle=self.vehicle)
+        self.assertEqual((auction.current_price, auction.bid_count), (0, 2))
+        self.assertEqual(Bid.objects.filter(auction=auction).count(), 2)
+
+    def test_expiry_settles_from_ladder(self):
+        self._offer(self.users[0], 10000000)
+        self._offer(self.users[1], 15000000)
+        self._offer(self.users[2], 15000000)
+
+        auction = self._end()
+
+        # 같은 최고가는 먼저 제시한 입찰자가 낙찰
+        self.assertEqual(auction.status, Auction.Status.AUCTION_ENDED)
+        self.assertEqual(auction.winner_id, self.users[1].id)
+        self.assertEqual(auction.current_price, 15000000)
+
+    def test_expiry_settles_from_persisted_offers_without_ladder(self):
+        self._offer(self.users[0], 10000000)
+        self._offer(self.users[1], 12000000)
+        self._offer(self.users[0], 14000000)
+        self.engine.flush()
+        self._evict_state()
+
+        auction = self._end()
+
+        self.assertEqual(auction.winner_id, self.users[0].id)
+        self.assertEqual(auction.current_price, 12000000 + INCREMENT)
+
+    def test_expiry_without_offers_has_no_winner(self):
+        open_vehicle = self._create_vehicle(Auction.Mode.OPEN)
+        Auction.objects.filter(vehicle=open_vehicle).update(current_price=5000000)
+
+        auction = self._end()
+
+        self.assertIsNone(auction.winner_id)
+        self.assertEqual(auction.current_price, 0)
+        # 공개 입찰 경매의 현재가는 그대로
+        open_auction = Auction.objects.get(vehicle=open_vehicle)
+        self.assertEqual(open_auction.status, Auction.Status.AUCTION_ENDED)
+        self.assertEqual(open_auction.current_price, 5000000)
+
+    def test_reload_rebuilds_ladder_from_persisted_offers(self):
+        self._offer(self.users[0], 10000000)
+        self._offer(self.users[1], 12000000)
+        self.engine.flush()
+        self._evict_state()
+
+        offer = self._offer(self.users[2], 11000000)
+
+        self.assertEqual((offer.sequence, offer.clearing_price), (3, 11000000 + INCREMENT))
+
+
+class SealedOfferAPITestCase(FakeRedisMixin, TestCase):
+    """비공개 최고가 경매 API 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.admin_user = User.objects.create_user(username='sealed_api_admin', password='adminpass', is_staff=True)
+        self.user = User.objects.create_user(username='sealed_api_user', password='userpass')
+
+        brand = Brand.objects.create(name='현대')
+        car_type = CarType.objects.create(brand=brand, name='SUV')
+        model = Model.objects.create(car_type=car_type, name='팰리세이드')
+        self.vehicle = Vehicle.objects.create(
+            year=2022,
+            first_registration_date=timezone.now().date(),
+            model=model,
+            color='블랙',
+            fuel_type=Vehicle.FuelType.GASOLINE,
+            transmission=Vehicle.Transmission.AUTO,
+            mileage=10000,
+            region='서울'
+        )
+        Auction.objects.create(vehicle=self.vehicle, status=Auction.Status.PENDING)
+
+        self.use_fake_redis(BidEngine)
+
+    def test_approve_sealed_then_offer(self):
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.post(
+            f'/api/auctions/{self.vehicle.id}/approve/', {'mode': Auction.Mode.SEALED}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Auction.objects.get(vehicle=self.vehicle).mode, Auction.Mode.SEALED)
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            f'/api/auctions/{self.vehicle.id}/offers/', {'ceiling': 10000000}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data, {
+            'vehicle_id': self.vehicle.id, 'ceiling': 10000000, 'sequence': 1, 'clearing_price': INCREMENT
+        })
+
+    def test_bulk_approve_with_mode(self):
+        self.client.force_authenticate(user=self.admin_user)
+
+        response = self.client.post(
+            '/api/auctions/bulk-approve/',
+            {'vehicle_ids': [self.vehicle.id], 'mode': Auction.Mode.SEALED},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Auction.objects.get(vehicle=self.vehicle).mode, Auction.Mode.SEALED)
+
+    def test_approve_rejects_unknown_mode(self):
+        self.client.force_authenticate(user=self.admin_user)
+
+        response = self.client.post(
+            f'/api/auctions/{self.vehicle.id}/approve/', {'mode': 'DUTCH'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Auction.objects.get(vehicle=self.vehicle).status, Auction.Status.PENDING)
@@ -0,0 +1,144 @@
+import json
+from datetime import date, timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.core.exceptions import ValidationError
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from apps.common.testing import FakeRedisMixin
+from apps.vehicles.dto import VehicleCreateDTO
+from apps.vehicles.models import Brand, CarType, Model, Vehicle
+from apps.vehicles.services import VehicleService
+from apps.auctions.models import Auction, AuctionEvent
+from apps.auctions.outbox import AuctionEventOutbox
+from apps.auctions.services import AuctionService
+
+User = get_user_model()
+
+
+class AuctionEventOutboxTestCase(FakeRedisMixin, TestCase):
+    """경매 이벤트 outbox 테스트"""
+
+    def setUp(self):
+        self.admin_user = User.objects.create_user(username='outbox_admin', password='adminpass', is_staff=True)
+        brand = Brand.objects.create(name='현대')
+        car_type = CarType.objects.create(brand=brand, name='SUV')
+        self.model = Model.objects.create(car_type=car_type, name='팰리세이드')
+        self.service = AuctionService()
+
+    def _create_vehicle(self):
+        return VehicleService().create_vehicle(VehicleCreateDTO(
+            model_id=self.model.id,
+            year=2022,
+            first_registration_date=date(2022, 3, 1),
+            color='블랙',
+            fuel_type=Vehicle.FuelType.GASOLINE,
+            transmission=Vehicle.Transmission.AUTO,
+            mileage=10000,
+            region='서울',
+            images=[]
+        ))
+
+    def _events(self):
+        return list(AuctionEvent.objects.values_list('event_type', 'vehicle_id'))
+
+    def test_transitions_record_events(self):
+        vehicle = self._create_vehicle()
+        self.service.approve_auction(vehicle.id, self.admin_user)
+        Auction.objects.filter(vehicle=vehicle).update(end_time=timezone.now() - timedelta(seconds=1))
+        self.service.check_and_end_expired_auctions()
+        self.service.complete_transaction(vehicle.id, self.admin_user)
+
+        self.assertEqual(self._events(), [
+            (AuctionEvent.EventType.VEHICLE_CREATED, vehicle.id),
+            (AuctionEvent.EventType.AUCTION_APPROVED, vehicle.id),
+            (AuctionEvent.EventType.AUCTION_ENDED, vehicle.id),
+            (AuctionEvent.EventType.TRANSACTION_COMPLETED, vehicle.id),
+        ])
+        self.assertEqual(AuctionEvent.objects.get(event_type='VEHICLE_CREATED').payload, {'model_id': self.model.id})
+
+    def test_failed_transition_records_nothing(self):
+        vehicle = self._create_vehicle()
+        AuctionEvent.objects.all().delete()
+
+        with self.assertRaises(ValidationError):
+            self.service.complete_transaction(vehicle.id, self.admin_user)
+
+        self.assertEqual(self._events(), [])
+
+    def test_bulk_approve_records_event_per_vehicle(self):
+        vehicles = [self._create_vehicle() for _ in range(3)]
+
+        self.service.bulk_approve([vehicle.id for vehicle in vehicles], self.admin_user)
+
+        self.assertEqual(
+            AuctionEvent.objects.filter(event_type=AuctionEvent.EventType.AUCTION_APPROVED).count(), 3
+        )
+
+    def test_relay_publishes_in_order_and_marks_published(self):
+        vehicles = [self._create_vehicle() for _ in range(3)]
+        client = self.use_fake_redis()
+        outbox = AuctionEventOutbox(client=client)
+
+        with mock.patch.object(AuctionEventOutbox, 'BATCH_SIZE', 2):
+            relayed = outbox.relay_pending()
+
+        entries = [fields for _, fields in client.xrange(AuctionEventOutbox.STREAM_KEY)]
+        self.assertEqual(relayed, 3)
+        self.assertEqual([int(entry[b'vehicle_id']) for entry in entries], [v.id for v in vehicles])
+        self.assertEqual(
+            [int(entry[b'event_id']) for entry in entries],
+            list(AuctionEvent.objects.order_by('id').values_list('id', flat=True))
+        )
+        self.assertEqual(json.loads(entries[0][b'payload']), {'model_id': self.model.id})
+        self.assertFalse(AuctionEvent.objects.filter(published_at__isnull=True).exists())
+
+        # 이미 발행한 이벤트는 다시 발행하지 않음
+        with self.assertNumQueries(3):
+            self.assertEqual(outbox.relay_pending(), 0)
+
+    def test_relay_failure_keeps_events_unpublished(self):
+        self._create_vehicle()
+        broken = mock.Mock()
+        broken.pipeline.return_value.execute.side_effect = ConnectionError
+
+        with self.assertRaises(ConnectionError):
+            AuctionEventOutbox(client=broken).relay_batch()
+
+        # 선점을 풀어 다음 실행에서 바로 다시 발행
+        self.assertTrue(AuctionEvent.objects.filter(published_at__isnull=True, claimed_until__isnull=True).exists())
+
+    def test_relay_skips_batch_claimed_by_another_relay(self):
+        self._create_vehicle()
+        client = self.use_fake_redis()
+        AuctionEvent.objects.update(claimed_until=timezone.now() + timedelta(seconds=10))
+
+        self.assertEqual(AuctionEventOutbox(client=client).relay_pending(), 0)
+        self.assertEqual(client.xlen(AuctionEventOutbox.STREAM_KEY), 0)
+
+        # 선점한 relay 가 죽어 선점이 만료되면 다시 발행
+        AuctionEvent.objects.update(claimed_until=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(AuctionEventOutbox(client=client).relay_pending(), 1)
+        self.assertFalse(AuctionEvent.objects.filter(published_at__isnull=True).exists())
+
+    def test_purge_published(self):
+        self._create_vehicle()
+        self._create_vehicle()
+        old, recent = AuctionEvent.objects.order_by('id')
+        AuctionEvent.objects.filter(id=old.id).update(published_at=timezone.now() - timedelta(days=8))
+        AuctionEvent.objects.filter(id=recent.id).update(published_at=timezone.now())
+
+        self.assertEqual(AuctionEventOutbox().purge_published(), 1)
+        self.assertEqual(list(AuctionEvent.objects.values_list('id', flat=True)), [recent.id])
+
+    def test_run_survives_purge_failure(self):
+        outbox = AuctionEventOutbox(client=self.use_fake_redis())
+
+        with mock.patch.object(outbox, 'purge_published', side_effect=ConnectionError), \
+                mock.patch.object(outbox, 'relay_pending', return_value=0), \
+                mock.patch('apps.auctions.outbox.time.sleep', side_effect=[None, KeyboardInterrupt]):
+            with self.assertLogs('apps.auctions.outbox', level='WARNING'):
+                with self.assertRaises(KeyboardInterrupt):
+                    outbox.run()
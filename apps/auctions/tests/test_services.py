@@ -1,10 +1,12 @@
 from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 from datetime import timedelta
 
-from apps.vehicles.models import Brand, CarType, Model, Vehicle
+from apps.vehicles.models import Brand, CarType, Model, Vehicle, VehicleListing
 from apps.auctions.models import Auction, AuctionHistory
 from apps.auctions.services import AuctionService
 
@@ -100,6 +102,37 @@ class AuctionServiceTestCase(TestCase):
 
         self.assertIn("승인대기 상태만", str(ctx.exception))
 
+    def test_approve_auction_twice_only_first_succeeds(self):
+        vehicle = self._create_vehicle_with_auction(Auction.Status.PENDING)
+        other_admin = User.objects.create_user(username='test_admin2', password='adminpass', is_staff=True)
+
+        self.service.approve_auction(vehicle.id, self.admin_user)
+        with self.assertRaises(ValidationError):
+            self.service.approve_auction(vehicle.id, other_admin)
+
+        histories = AuctionHistory.objects.filter(
+            vehicle=vehicle,
+            action_type=AuctionHistory.ActionType.AUCTION_START
+        )
+        self.assertEqual([history.user_id for history in histories], [self.admin_user.id])
+        self.assertEqual(
+            VehicleListing.objects.get(vehicle_id=vehicle.id).status, Auction.Status.AUCTION_ACTIVE
+        )
+
+    def test_approve_auction_does_not_lock_vehicle(self):
+        vehicle = self._create_vehicle_with_auction(Auction.Status.PENDING)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.service.approve_auction(vehicle.id, self.admin_user)
+
+        statements = [
+            query['sql'] for query in queries.captured_queries
+            if not query['sql'].startswith(('SAVEPOINT', 'RELEASE'))
+        ]
+        # 첫 쿼리가 조건부 UPDATE (사전 SELECT ... FOR UPDATE 없음)
+        self.assertTrue(statements[0].startswith('UPDATE "auctions"'))
+        self.assertFalse(any('FOR UPDATE' in sql for sql in statements))
+
     def test_complete_transaction_success_by_admin(self):
         vehicle = self._create_vehicle_with_auction(Auction.Status.AUCTION_ENDED)
         initial_history_count = AuctionHistory.objects.count()
@@ -131,6 +164,15 @@ class AuctionServiceTestCase(TestCase):
 
         self.assertIn("경매종료 상태만", str(ctx.exception))
 
+    def test_complete_transaction_updates_listing(self):
+        vehicle = self._create_vehicle_with_auction(Auction.Status.AUCTION_ENDED)
+
+        self.service.complete_transaction(vehicle.id, self.admin_user)
+
+        self.assertEqual(
+            VehicleListing.objects.get(vehicle_id=vehicle.id).status, Auction.Status.TRANSACTION_COMPLETE
+        )
+
     def test_check_and_end_expired_auctions_success(self):
         # 만료된 경매 2개 생성
         expired_vehicle1 = Vehicle.objects.create(
@@ -231,6 +273,90 @@ class AuctionServiceTestCase(TestCase):
         active_vehicle.refresh_from_db()
         self.assertEqual(active_vehicle.auction.status, Auction.Status.AUCTION_ACTIVE)
 
+    def _create_expired_auction(self):
+        vehicle = self._create_vehicle_with_auction(Auction.Status.AUCTION_ACTIVE)
+        Auction.objects.filter(vehicle=vehicle).update(
+            start_time=timezone.now() - timedelta(hours=49),
+            end_time=timezone.now() - timedelta(hours=1)
+        )
+        return vehicle
+
+    def test_check_and_end_expired_auctions_in_batches(self):
+        vehicles = [self._create_expired_auction() for _ in range(5)]
+
+        result = self.service.check_and_end_expired_auctions(batch_size=2)
+
+        self.assertEqual(result['ended_count'], 5)
+        self.assertEqual(result['batch_count'], 3)
+        self.assertIn('elapsed_ms', result)
+        self.assertEqual(
+            Auction.objects.filter(status=Auction.Status.AUCTION_ENDED).count(), 5
+        )
+        self.assertEqual(
+            AuctionHistory.objects.filter(action_type=AuctionHistory.ActionType.AUCTION_END).count(), 5
+        )
+        # 목록 테이블에도 반영
+        self.assertEqual(
+            set(VehicleListing.objects.values_list('status', flat=True)),
+            {Auction.Status.AUCTION_ENDED}
+        )
+        self.assertEqual(VehicleListing.objects.count(), len(vehicles))
+
+    def test_check_and_end_expired_auctions_query_count_is_per_batch(self):
+        self.service.get_system_user()
+
+        def count_queries(size):
+            for _ in range(size):
+                self._create_expired_auction()
+            with CaptureQueriesContext(connection) as queries:
+                self.service.check_and_end_expired_auctions()
+            return len(queries.captured_queries)
+
+        # 경매 수와 관계없이 배치당 쿼리 수 일정
+        self.assertEqual(count_queries(2), count_queries(6))
+
+    def test_claim_batch_takes_earliest_deadlines(self):
+        vehicles = [self._create_expired_auction() for _ in range(3)]
+        # 종료 시각을 역순으로 배치
+        for minutes, vehicle in enumerate(vehicles):
+            Auction.objects.filter(vehicle=vehicle).update(
+                end_time=timezone.now() - timedelta(minutes=10 - minutes)
+            )
+
+        claimed, ended = self.service._claim_and_end_batch(timezone.now(), 2, self.service.get_system_user())
+
+        self.assertEqual((claimed, ended), (2, 2))
+        self.assertEqual(
+            set(Auction.objects.filter(
+                status=Auction.Status.AUCTION_ENDED
+            ).values_list('vehicle_id', flat=True)),
+            {vehicles[0].id, vehicles[1].id}
+        )
+
+    def test_end_auction_batch_skips_changed_auctions(self):
+        ended = self._create_expired_auction()
+        changed = self._create_expired_auction()
+        candidates = list(
+            Auction.objects.filter(vehicle__in=[ended, changed]).order_by('id').values_list(
+                'id', 'vehicle_id', 'end_time'
+            )
+        )
+
+        # 후보 조회 이후 다른 경로에서 이미 종료된 경매
+        Auction.objects.filter(vehicle=changed).update(status=Auction.Status.AUCTION_ENDED)
+
+        count = self.service._end_auction_batch(
+            candidates, timezone.now(), self.service.get_system_user()
+        )
+
+        self.assertEqual(count, 1)
+        self.assertEqual(
+            list(AuctionHistory.objects.filter(
+                action_type=AuctionHistory.ActionType.AUCTION_END
+            ).values_list('vehicle_id', flat=True)),
+            [ended.id]
+        )
+
 
 class AuctionServiceTransactionTestCase(TransactionTestCase):
     """경매 서비스 트랜잭션 테스트"""
@@ -0,0 +1,242 @@
+import asyncio
+import json
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from freezegun import freeze_time
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.common.testing import FakeRedisMixin
+from apps.vehicles.models import Brand, CarType, Model, Vehicle
+from apps.auctions.models import Auction, AuctionEvent
+from apps.auctions.outbox import AuctionEventOutbox
+from apps.auctions.stream import RESYNC, AuctionStatusBroker, issue_stream_token, verify_stream_token
+from apps.auctions.views import AuctionStatusStreamView
+
+User = get_user_model()
+
+
+class FakeBroker(AuctionStatusBroker):
+    """Redis 구독 없이 분배만 하는 브로커 (구독 확인은 subscribe_delay 초 뒤, None 이면 확인되지 않음)"""
+
+    SUBSCRIBE_TIMEOUT_SECONDS = 0.2
+
+    def __init__(self, subscribe_delay=0):
+        super().__init__()
+        self.subscribe_delay = subscribe_delay
+
+    def _ensure_listener(self):
+        if self.subscribe_delay == 0:
+            self._subscribed.set()
+        elif self.subscribe_delay is not None and self._listener is None:
+            self._listener = asyncio.get_running_loop().call_later(self.subscribe_delay, self._subscribed.set)
+
+
+class AuctionStatusStreamTestCase(FakeRedisMixin, TestCase):
+    """경매 상태 실시간 구독 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='stream_user', password='userpass')
+        brand = Brand.objects.create(name='현대')
+        car_type = CarType.objects.create(brand=brand, name='SUV')
+        self.model = Model.objects.create(car_type=car_type, name='팰리세이드')
+        self.active = self._create_vehicle(Auction.Status.AUCTION_ACTIVE)
+        self.pending = self._create_vehicle(Auction.Status.PENDING)
+        self.broker = FakeBroker()
+
+    def _create_vehicle(self, auction_status):
+        vehicle = Vehicle.objects.create(
+            year=2022,
+            first_registration_date=timezone.now().date(),
+            model=self.model,
+            color='블랙',
+            fuel_type=Vehicle.FuelType.GASOLINE,
+            transmission=Vehicle.Transmission.AUTO,
+            mileage=10000,
+            region='서울'
+        )
+        is_active = auction_status == Auction.Status.AUCTION_ACTIVE
+        Auction.objects.create(
+            vehicle=vehicle,
+            status=auction_status,
+            start_time=timezone.now() if is_active else None,
+            end_time=timezone.now() + timedelta(hours=48) if is_active else None
+        )
+        return vehicle
+
+    def _auth_header(self):
+        return {'Authorization': f'Bearer {AccessToken.for_user(self.user)}'}
+
+    def _parse(self, chunk):
+        fields = dict(line.split(': ', 1) for line in chunk.decode().strip().split('\n'))
+        return fields['event'], json.loads(fields['data'])
+
+    def test_dispatch_only_to_subscribers(self):
+        first = self.broker.subscribe([1, 2])
+        second = self.broker.subscribe([2])
+
+        self.broker.dispatch([{'vehicle_id': 1, 'status': 'AUCTION_ENDED'}])
+        self.broker.unsubscribe(first, [1, 2])
+        self.broker.dispatch([{'vehicle_id': 2, 'status': 'AUCTION_ENDED'}])
+
+        self.assertEqual(first.qsize(), 1)
+        self.assertEqual(second.get_nowait(), {'vehicle_id': 2, 'status': 'AUCTION_ENDED'})
+        self.assertEqual(list(self.broker._queues), [2])
+
+    async def test_stream_snapshot_then_status(self):
+        with mock.patch('apps.auctions.views.get_broker', return_value=self.broker):
+            response = await self.async_client.get(
+                '/api/auctions/stream/',
+                {'vehicle_ids': f'{self.active.id},{self.pending.id}'},
+                headers=self._auth_header()
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response['Content-Type'], 'text/event-stream')
+
+            stream = response.streaming_content
+            self.assertTrue((await stream.__anext__()).startswith(b'retry:'))
+
+            event, data = self._parse(await stream.__anext__())
+            self.assertEqual(event, 'snapshot')
+            # 승인대기 차량은 노출하지 않음
+            self.assertEqual([auction['vehicle_id'] for auction in data['auctions']], [self.active.id])
+            self.assertEqual(data['auctions'][0]['status'], Auction.Status.AUCTION_ACTIVE)
+            self.assertIn('server_time', data)
+
+            self.broker.dispatch([
+                {'event_id': 7, 'vehicle_id': self.active.id, 'status': Auction.Status.AUCTION_ENDED}
+            ])
+            event, data = self._parse((await stream.__anext__()).split(b'\n', 1)[1])
+            self.assertEqual(event, 'status')
+            self.assertEqual(data['status'], Auction.Status.AUCTION_ENDED)
+
+    async def test_snapshot_is_read_after_subscription_confirmed(self):
+        broker = FakeBroker(subscribe_delay=0.05)
+        snapshot = AuctionStatusStreamView._snapshot
+        subscribed_at_snapshot = []
+
+        def record(view, vehicle_ids):
+            subscribed_at_snapshot.append(broker._subscribed.is_set())
+            return snapshot(view, vehicle_ids)
+
+        with mock.patch('apps.auctions.views.get_broker', return_value=broker), \
+                mock.patch.object(AuctionStatusStreamView, '_snapshot', record):
+            response = await self.async_client.get(
+                '/api/auctions/stream/', {'vehicle_ids': self.active.id}, headers=self._auth_header()
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(subscribed_at_snapshot, [True])
+
+    async def test_stream_unavailable_until_subscribed(self):
+        broker = FakeBroker(subscribe_delay=None)
+
+        with mock.patch('apps.auctions.views.get_broker', return_value=broker):
+            response = await self.async_client.get(
+                '/api/auctions/stream/', {'vehicle_ids': self.active.id}, headers=self._auth_header()
+            )
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(broker._queues, {})
+
+    def test_full_queue_is_replaced_by_resync(self):
+        queue = self.broker.subscribe([1])
+
+        self.broker.dispatch([{'vehicle_id': 1, 'status': 'AUCTION_ENDED'}] * (AuctionStatusBroker.QUEUE_SIZE + 1))
+
+        self.assertEqual(queue.qsize(), 1)
+        self.assertIs(queue.get_nowait(), RESYNC)
+
+    async def test_stream_sends_snapshot_on_resync(self):
+        queue = self.broker.subscribe([self.active.id])
+        stream = AuctionStatusStreamView()._stream(self.broker, queue, [self.active.id], {'auctions': []})
+        await stream.__anext__()
+        await stream.__anext__()
+
+        queue.put_nowait(RESYNC)
+        event, data = self._parse((await stream.__anext__()).encode())
+        await stream.aclose()
+
+        self.assertEqual(event, 'resync')
+        self.assertEqual([auction['vehicle_id'] for auction in data['auctions']], [self.active.id])
+
+    def test_issue_stream_token(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=self._auth_header()['Authorization'])
+
+        response = client.post('/api/auctions/stream/token/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(verify_stream_token(response.data['token']), self.user.id)
+        self.assertEqual(APIClient().post('/api/auctions/stream/token/').status_code, 401)
+
+    async def test_stream_accepts_query_token(self):
+        with mock.patch('apps.auctions.views.get_broker', return_value=self.broker):
+            response = await self.async_client.get(
+                '/api/auctions/stream/', {'vehicle_ids': self.active.id, 'token': issue_stream_token(self.user.id)}
+            )
+            self.assertEqual(response.status_code, 200)
+
+        response = await self.async_client.get(
+            '/api/auctions/stream/', {'vehicle_ids': self.active.id, 'token': 'forged'}
+        )
+        self.assertEqual(response.status_code, 401)
+
+        with freeze_time(timezone.now() - timedelta(minutes=5)):
+            expired = issue_stream_token(self.user.id)
+        response = await self.async_client.get(
+            '/api/auctions/stream/', {'vehicle_ids': self.active.id, 'token': expired}
+        )
+        self.assertEqual(response.status_code, 401)
+
+    async def test_stream_unsubscribes_on_close(self):
+        queue = self.broker.subscribe([self.active.id])
+        stream = AuctionStatusStreamView()._stream(self.broker, queue, [self.active.id], {'auctions': []})
+
+        await stream.__anext__()
+        await stream.__anext__()
+        await stream.aclose()
+
+        self.assertEqual(self.broker._queues, {})
+
+    async def test_stream_requires_authentication(self):
+        response = await self.async_client.get('/api/auctions/stream/', {'vehicle_ids': '1'})
+
+        self.assertEqual(response.status_code, 401)
+
+    async def test_stream_invalid_vehicle_ids(self):
+        for vehicle_ids in ('', 'abc', ','.join(str(i) for i in range(1, 102))):
+            response = await self.async_client.get(
+                '/api/auctions/stream/', {'vehicle_ids': vehicle_ids}, headers=self._auth_header()
+            )
+            self.assertEqual(response.status_code, 400)
+
+    def test_relay_publishes_status_messages(self):
+        AuctionEvent.objects.create(
+            event_type=AuctionEvent.EventType.VEHICLE_CREATED, vehicle_id=self.pending.id
+        )
+        approved = AuctionEvent.objects.create(
+            event_type=AuctionEvent.EventType.AUCTION_APPROVED,
+            vehicle_id=self.active.id,
+            payload={'end_time': '2025-01-03T00:00:00+09:00'}
+        )
+        client = self.use_fake_redis()
+        pubsub = client.pubsub()
+        pubsub.subscribe(AuctionStatusBroker.CHANNEL)
+        self.assertEqual(pubsub.get_message(timeout=1)['type'], 'subscribe')
+
+        AuctionEventOutbox(client=client).relay_batch()
+
+        message = pubsub.get_message(timeout=1)
+        self.assertEqual(message['channel'], AuctionStatusBroker.CHANNEL.encode())
+        self.assertEqual(json.loads(message['data']), [{
+            'event_id': approved.id,
+            'vehicle_id': self.active.id,
+            'status': Auction.Status.AUCTION_ACTIVE,
+            'end_time': '2025-01-03T00:00:00+09:00'
+        }])
+        self.assertIsNone(pubsub.get_message(timeout=0.1))
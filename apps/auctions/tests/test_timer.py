@@ -0,0 +1,143 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from datetime import timedelta
+from unittest import mock
+
+from apps.common.testing import FakeRedisMixin
+from apps.vehicles.models import Brand, CarType, Model, Vehicle
+from apps.auctions.models import Auction, AuctionHistory
+from apps.auctions.services import AuctionService
+from apps.auctions.timer import AuctionTimer
+
+User = get_user_model()
+
+
+class AuctionTimerTestCase(FakeRedisMixin, TestCase):
+    """경매 종료 타이머 테스트"""
+
+    def setUp(self):
+        self.redis = self.use_fake_redis(AuctionTimer)
+        self.timer = AuctionTimer()
+
+        self.admin_user = User.objects.create_user(username='timer_admin', password='adminpass', is_staff=True)
+        brand = Brand.objects.create(name='현대')
+        car_type = CarType.objects.create(brand=brand, name='SUV')
+        self.model = Model.objects.create(car_type=car_type, name='팰리세이드')
+
+    def _create_auction(self, end_delta, auction_status=Auction.Status.AUCTION_ACTIVE):
+        vehicle = Vehicle.objects.create(
+            year=2022,
+            first_registration_date=timezone.now().date(),
+            model=self.model,
+            color='블랙',
+            fuel_type=Vehicle.FuelType.GASOLINE,
+            transmission=Vehicle.Transmission.AUTO,
+            mileage=10000,
+            region='서울'
+        )
+        end_time = timezone.now() + end_delta
+        return Auction.objects.create(
+            vehicle=vehicle,
+            status=auction_status,
+            start_time=end_time - timedelta(hours=48),
+            end_time=end_time
+        )
+
+    def test_drain_ends_only_due_auctions(self):
+        due = self._create_auction(timedelta(seconds=-1))
+        future = self._create_auction(timedelta(hours=1))
+        self.timer.sync_from_db()
+
+        ended = self.timer.drain()
+
+        self.assertEqual(ended, 1)
+        due.refresh_from_db()
+        future.refresh_from_db()
+        self.assertEqual(due.status, Auction.Status.AUCTION_ENDED)
+        self.assertEqual(future.status, Auction.Status.AUCTION_ACTIVE)
+        self.assertEqual(self.redis.zrange(AuctionTimer.KEY, 0, -1), [str(future.id).encode()])
+        self.assertTrue(
+            AuctionHistory.objects.filter(
+                vehicle_id=due.vehicle_id,
+                action_type=AuctionHistory.ActionType.AUCTION_END
+            ).exists()
+        )
+
+    def test_lost_keys_are_rebuilt_from_db(self):
+        auction = self._create_auction(timedelta(hours=1))
+        self.timer.sync_from_db()
+        self.assertEqual(self.timer.ensure_synced(), 0)
+
+        # Redis 재시작 등으로 데이터가 모두 사라진 경우
+        self.redis.flushall()
+        with self.assertLogs('apps.auctions.timer', level='WARNING'):
+            self.assertEqual(self.timer.ensure_synced(), 1)
+
+        self.assertAlmostEqual(
+            self.redis.zscore(AuctionTimer.KEY, auction.id), auction.end_time.timestamp(), places=3
+        )
+
+    def test_drain_skips_auctions_changed_elsewhere(self):
+        # 이미 다른 경로(주기 점검 등)에서 종료된 경매
+        auction = self._create_auction(timedelta(seconds=-1), Auction.Status.AUCTION_ENDED)
+        self.redis.zadd(AuctionTimer.KEY, {auction.id: auction.end_time.timestamp()})
+
+        self.assertEqual(self.timer.drain(), 0)
+        self.assertEqual(self.redis.zcard(AuctionTimer.KEY), 0)
+        self.assertFalse(AuctionHistory.objects.exists())
+
+    def test_idle_does_not_query_database(self):
+        self._create_auction(timedelta(minutes=2))
+        self.timer.sync_from_db()
+
+        with self.assertNumQueries(0), mock.patch.object(self.redis, 'blpop') as blpop:
+            self.assertEqual(self.timer.drain(), 0)
+            self.timer.wait()
+
+        # 다음 종료 시각까지만 대기
+        self.assertEqual(blpop.call_count, 1)
+        self.assertAlmostEqual(blpop.call_args.kwargs['timeout'], 120, delta=5)
+
+    def test_wait_without_auctions_uses_max_idle(self):
+        with mock.patch.object(self.redis, 'blpop') as blpop:
+            self.timer.wait()
+
+        blpop.assert_called_once_with(AuctionTimer.WAKEUP_KEY, timeout=AuctionTimer.MAX_IDLE_SECONDS)
+
+    def test_approve_schedules_after_commit(self):
+        auction = self._create_auction(timedelta(hours=1), Auction.Status.PENDING)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            AuctionService().approve_auction(auction.vehicle_id, self.admin_user)
+
+        auction.refresh_from_db()
+        self.assertAlmostEqual(
+            self.redis.zscore(AuctionTimer.KEY, auction.id), auction.end_time.timestamp(), places=3
+        )
+        self.assertEqual(self.redis.lrange(AuctionTimer.WAKEUP_KEY, 0, -1), [b'1'])
+
+    def test_schedule_failure_does_not_raise(self):
+        auction = self._create_auction(timedelta(hours=1))
+        broken = mock.Mock()
+        broken.pipeline.side_effect = ConnectionError
+
+        with mock.patch.object(AuctionTimer, 'client', broken):
+            with self.assertLogs('apps.auctions.timer', level='WARNING'):
+                AuctionTimer().schedule(auction.id, auction.end_time)
+
+    def test_run_survives_drain_failure(self):
+        auction = self._create_auction(-timedelta(seconds=1))
+        self.timer.schedule(auction.id, auction.end_time)
+
+        # 첫 drain 은 DB 오류, 대기 후 다시 시도해 종료
+        end_auctions = mock.Mock(side_effect=[ConnectionError, 1])
+        with mock.patch.object(AuctionService, 'end_auctions', end_auctions), \
+                mock.patch.object(AuctionTimer, 'wait', side_effect=KeyboardInterrupt), \
+                mock.patch('apps.auctions.timer.time.sleep') as sleep:
+            with self.assertLogs('apps.auctions.timer', level='WARNING'):
+                with self.assertRaises(KeyboardInterrupt):
+                    self.timer.run()
+
+        sleep.assert_called_once_with(AuctionTimer.RETRY_SECONDS)
+        self.assertEqual(end_auctions.call_count, 2)
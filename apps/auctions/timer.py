@@ -0,0 +1,143 @@
+"""
+경매 종료 타이머
+
+경매 승인 시 Redis sorted set 에 (경매 ID, 종료 시각) 을 넣고,
+스케줄러 프로세스(run_auction_timer)가 가장 빠른 종료 시각까지 잠들었다가 도래한 경매를 종료한다.
+
+- 대기 중에는 BLPOP 으로 블록되어 DB/Redis 를 조회하지 않는다
+- 새 경매가 등록되면 wakeup 리스트에 push 해 대기 시간을 다시 계산하게 한다
+- 종료는 조건부 UPDATE 라 여러 스케줄러가 같은 경매를 처리해도 한 번만 종료된다
+- 키는 입찰 상태와 같은 noeviction Redis(AUCTION_REDIS_URL)에 두어 메모리 부족으로 밀려나지 않는다
+- Redis 재시작 등으로 키가 사라지면 루프마다 확인하는 동기화 표시가 없어지므로 DB 에서 다시 등록한다
+- 등록 실패 등은 주기적인 check_expired_auctions 와 기동 시 sync_from_db 로 보정
+"""
+import logging
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from django.db import transaction
+
+from apps.auctions.bids import get_auction_redis
+from apps.auctions.models import Auction
+
+logger = logging.getLogger(__name__)
+
+
+class AuctionTimer:
+    KEY = 'vehicle_auction:auction_timer'
+    WAKEUP_KEY = 'vehicle_auction:auction_timer:wakeup'
+    SYNCED_KEY = 'vehicle_auction:auction_timer:synced'
+
+    BATCH_SIZE = 500
+    MAX_IDLE_SECONDS = 300  # 깨우기 신호를 놓쳐도 이 시간 안에는 다시 확인
+    RETRY_SECONDS = 5  # Redis/DB 오류 후 다시 시도하기까지 대기
+
+    def __init__(self, client=None, auction_service=None):
+        self._client = client
+        self._auction_service = auction_service
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_auction_redis()
+        return self._client
+
+    @property
+    def auction_service(self):
+        if self._auction_service is None:
+            from apps.auctions.services import AuctionService
+            self._auction_service = AuctionService()
+        return self._auction_service
+
+    def schedule_on_commit(self, end_times: Dict[int, datetime]) -> None:
+        """{경매 ID: 종료 시각} 을 트랜잭션 커밋 후 등록"""
+        transaction.on_commit(lambda: self.schedule_many(end_times))
+
+    def schedule(self, auction_id: int, end_time: datetime) -> None:
+        self.schedule_many({auction_id: end_time})
+
+    def schedule_many(self, end_times: Dict[int, datetime]) -> None:
+        """종료 시각 등록 (실패해도 주기 점검에서 종료되므로 예외를 올리지 않음)"""
+        if not end_times:
+            return
+        try:
+            pipe = self.client.pipeline()
+            pipe.zadd(self.KEY, {
+                auction_id: end_time.timestamp() for auction_id, end_time in end_times.items()
+            })
+            pipe.lpush(self.WAKEUP_KEY, 1)
+            pipe.ltrim(self.WAKEUP_KEY, 0, 0)
+            pipe.execute()
+        except Exception:
+            logger.warning(f"경매 종료 타이머 등록 실패: auction_ids={list(end_times)[:10]}", exc_info=True)
+
+    def sync_from_db(self) -> int:
+        """진행 중인 경매 전체를 다시 등록 (스케줄러 기동 시, 키 유실 시)"""
+        scheduled = 0
+        batch = {}
+        for auction_id, end_time in Auction.objects.filter(
+            status=Auction.Status.AUCTION_ACTIVE,
+            end_time__isnull=False
+        ).values_list('id', 'end_time').iterator(chunk_size=self.BATCH_SIZE):
+            batch[auction_id] = end_time.timestamp()
+            if len(batch) >= self.BATCH_SIZE:
+                scheduled += self._add(batch)
+                batch = {}
+        if batch:
+            scheduled += self._add(batch)
+        self.client.set(self.SYNCED_KEY, 1)
+        return scheduled
+
+    def ensure_synced(self) -> int:
+        """동기화 표시가 없으면(Redis 데이터 유실) DB 에서 다시 등록, 등록한 경매 수 반환"""
+        if self.client.exists(self.SYNCED_KEY):
+            return 0
+        scheduled = self.sync_from_db()
+        logger.warning(f"경매 종료 타이머 키 유실, 진행 중 경매 {scheduled}개 다시 등록")
+        return scheduled
+
+    def _add(self, mapping) -> int:
+        self.client.zadd(self.KEY, mapping)
+        return len(mapping)
+
+    def drain(self) -> int:
+        """종료 시각이 지난 경매를 모두 종료, 종료한 경매 수 반환"""
+        ended = 0
+        while True:
+            due = self.client.zrangebyscore(self.KEY, '-inf', time.time(), start=0, num=self.BATCH_SIZE)
+            if not due:
+                return ended
+
+            ended += self.auction_service.end_auctions([int(member) for member in due])
+
+            # DB 반영 후 제거 (중간에 죽으면 다음 루프에서 다시 처리)
+            self.client.zrem(self.KEY, *due)
+
+    def seconds_until_next(self) -> Optional[float]:
+        first = self.client.zrange(self.KEY, 0, 0, withscores=True)
+        if not first:
+            return None
+        return max(0.0, first[0][1] - time.time())
+
+    def wait(self) -> None:
+        """다음 종료 시각 또는 새 등록까지 대기"""
+        remaining = self.seconds_until_next()
+        timeout = self.MAX_IDLE_SECONDS if remaining is None else min(remaining, self.MAX_IDLE_SECONDS)
+        if timeout > 0:
+            self.client.blpop(self.WAKEUP_KEY, timeout=timeout)
+
+    def run(self) -> None:
+        scheduled = self.sync_from_db()
+        logger.info(f"경매 종료 타이머 시작: 진행 중 경매 {scheduled}개 등록")
+
+        while True:
+            try:
+                self.ensure_synced()
+                ended = self.drain()
+                if ended:
+                    logger.info(f"경매 종료 타이머: {ended}개 경매 종료")
+                self.wait()
+            except Exception:
+                logger.warning("경매 종료 타이머 처리 실패, 잠시 후 재시도", exc_info=True)
+                time.sleep(self.RETRY_SECONDS)
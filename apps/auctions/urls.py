@@ -1,9 +1,22 @@
 from django.urls import path
 
-from apps.auctions.views import VehicleApprovalView, VehicleTransactionCompleteView
+from apps.auctions.views import (
+    VehicleApprovalView, VehicleTransactionCompleteView,
+    BulkVehicleApprovalView, BulkVehicleTransactionCompleteView,
+    AuctionStatusStreamView, AuctionStatusStreamTokenView, BidCreateView, OfferCreateView,
+    ExpiryForecastView, ExpiryForecastMetricsView
+)
 
 urlpatterns = [
 
     path('<int:pk>/approve/', VehicleApprovalView.as_view(), name='vehicle-approve'),
-    path('<int:pk>/complete/', VehicleTransactionCompleteView.as_view(), name='vehicle-complete')
+    path('<int:pk>/complete/', VehicleTransactionCompleteView.as_view(), name='vehicle-complete'),
+    path('<int:pk>/bids/', BidCreateView.as_view(), name='vehicle-bid-create'),
+    path('<int:pk>/offers/', OfferCreateView.as_view(), name='vehicle-offer-create'),
+    path('bulk-approve/', BulkVehicleApprovalView.as_view(), name='vehicle-bulk-approve'),
+    path('bulk-complete/', BulkVehicleTransactionCompleteView.as_view(), name='vehicle-bulk-complete'),
+    path('expiry-forecast/', ExpiryForecastView.as_view(), name='auction-expiry-forecast'),
+    path('expiry-forecast/metrics/', ExpiryForecastMetricsView.as_view(), name='auction-expiry-forecast-metrics'),
+    path('stream/', AuctionStatusStreamView.as_view(), name='auction-status-stream'),
+    path('stream/token/', AuctionStatusStreamTokenView.as_view(), name='auction-status-stream-token')
 ]
\ No newline at end of file
@@ -1,16 +1,35 @@
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
 from rest_framework import status, serializers
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.permissions import IsAdminUser
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.exceptions import AuthenticationFailed, NotAuthenticated
 from django.core.exceptions import ValidationError, BadRequest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.views import View
 
+from apps.accounts.authentication import StatelessJWTAuthentication
 from apps.auctions.models import Auction
 from apps.vehicles.models import Vehicle
 from apps.vehicles.serializers import VehicleDetailSerializer
+from apps.auctions.serializers import (
+    AuctionApproveSerializer, BulkAuctionActionSerializer, BulkAuctionApproveSerializer,
+    BidCreateSerializer, OfferCreateSerializer, ExpiryForecastQuerySerializer
+)
+from apps.auctions.bids import BidEngine
+from apps.auctions.forecast import ExpiryForecast
 from apps.auctions.services import AuctionService
+from apps.auctions.stream import (
+    RESYNC, STREAM_TOKEN_SECONDS, get_broker, issue_stream_token, verify_stream_token
+)
 
 
 class VehicleApprovalView(APIView):
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [IsAdminUser]
 
     def __init__(self):
@@ -18,8 +37,18 @@ class VehicleApprovalView(APIView):
         self.auction_service = AuctionService()
 
     def post(self, request, pk):
+        serializer = AuctionApproveSerializer(data=request.data)
+
+        if not serializer.is_valid():
+            return Response(
+                serializer.errors,
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
         try:
-            vehicle = self.auction_service.approve_auction(pk, request.user)
+            vehicle = self.auction_service.approve_auction(
+                pk, request.user, mode=serializer.validated_data['mode']
+            )
 
             response_serializer = VehicleDetailSerializer(
                 vehicle,
@@ -42,6 +71,7 @@ class VehicleApprovalView(APIView):
             )
 
 class VehicleTransactionCompleteView(APIView):
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [IsAdminUser]
 
     def __init__(self):
@@ -73,3 +103,314 @@ class VehicleTransactionCompleteView(APIView):
                 {"detail": str(e)},
                 status=status.HTTP_400_BAD_REQUEST
             )
+
+
+class BulkAuctionActionView(APIView):
+    """
+    여러 차량을 한 번에 처리하고 차량별 결과만 반환 (상세 정보는 반환하지 않음)
+
+    results 값: ok, not_found, invalid_status
+    service_method 는 AuctionService 의 일괄 처리 메서드 이름, vehicle_ids 외 요청 값은 키워드 인자로 넘긴다.
+    """
+    authentication_classes = [StatelessJWTAuthentication]
+    permission_classes = [IsAdminUser]
+    serializer_class = BulkAuctionActionSerializer
+    service_method: str
+
+    def __init__(self):
+        super().__init__()
+        self.auction_service = AuctionService()
+
+    def post(self, request):
+        serializer = self.serializer_class(data=request.data)
+
+        if not serializer.is_valid():
+            return Response(
+                serializer.errors,
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        options = dict(serializer.validated_data)
+        vehicle_ids = options.pop('vehicle_ids')
+        results = getattr(self.auction_service, self.service_method)(vehicle_ids, request.user, **options)
+
+        return Response(
+            {
+                'count': sum(result == AuctionService.RESULT_OK for result in results.values()),
+                'results': results
+            },
+            status=status.HTTP_200_OK
+        )
+
+
+class BulkVehicleApprovalView(BulkAuctionActionView):
+    serializer_class = BulkAuctionApproveSerializer
+    service_method = 'bulk_approve'
+
+
+class BulkVehicleTransactionCompleteView(BulkAuctionActionView):
+    service_method = 'bulk_complete'
+
+
+class BidCreateView(APIView):
+    """입찰 (수락 여부는 Redis 에서 판단, DB 저장은 run_bid_writer 가 비동기로 처리)"""
+    permission_classes = [IsAuthenticated]
+
+    def __init__(self):
+        super().__init__()
+        self.bid_engine = BidEngine()
+
+    def post(self, request, pk):
+        serializer = BidCreateSerializer(data=request.data)
+
+        if not serializer.is_valid():
+            return Response(
+                serializer.errors,
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            bid = self.bid_engine.place(pk, request.user.id, serializer.validated_data['amount'])
+        except ValidationError as e:
+            return Response(
+                {"detail": e.message, "code": e.code, **e.params},
+                status=status.HTTP_409_CONFLICT if e.code == 'too_low' else status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response(
+            {
+                "vehicle_id": bid.vehicle_id,
+                "amount": bid.amount,
+                "sequence": bid.sequence
+            },
+            status=status.HTTP_201_CREATED
+        )
+
+
+class OfferCreateView(APIView):
+    """
+    비공개 경매 최고가 제시
+
+    제시한 최고가는 공개하지 않고, 응답에는 현재 낙찰가(두 번째 최고가 + 입찰 단위)만 포함한다.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def __init__(self):
+        super().__init__()
+        self.bid_engine = BidEngine()
+
+    def post(self, request, pk):
+        serializer = OfferCreateSerializer(data=request.data)
+
+        if not serializer.is_valid():
+            return Response(
+                serializer.errors,
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            offer = self.bid_engine.place_offer(pk, request.user.id, serializer.validated_data['ceiling'])
+        except ValidationError as e:
+            return Response(
+                {"detail": e.message, "code": e.code, **e.params},
+                status=status.HTTP_409_CONFLICT if e.code == 'too_low' else status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response(
+            {
+                "vehicle_id": offer.vehicle_id,
+                "ceiling": offer.ceiling,
+                "sequence": offer.sequence,
+                "clearing_price": offer.clearing_price
+            },
+            status=status.HTTP_201_CREATED
+        )
+
+
+class ExpiryForecastView(APIView):
+    """
+    경매 종료 예정 분포 (관리자)
+
+    향후 minutes 분의 분 단위, hours 시간의 시간 단위 종료 예정 경매 수 (빈 구간 생략)
+    """
+    authentication_classes = [StatelessJWTAuthentication]
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        serializer = ExpiryForecastQuerySerializer(data=request.query_params)
+
+        if not serializer.is_valid():
+            return Response(
+                serializer.errors,
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response(
+            ExpiryForecast().snapshot(**serializer.validated_data),
+            status=status.HTTP_200_OK
+        )
+
+
+class ExpiryForecastMetricsView(APIView):
+    """경매 종료 예정 분포 지표 (Prometheus 텍스트 형식, 관리자)"""
+    authentication_classes = [StatelessJWTAuthentication]
+    permission_classes = [IsAdminUser]
+
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def get(self, request):
+        metrics = ExpiryForecast().metrics()
+
+        lines = [
+            '# HELP auction_expiring_auctions Active auctions ending within the window.',
+            '# TYPE auction_expiring_auctions gauge',
+            *[
+                f'auction_expiring_auctions{{window="{window}"}} {count}'
+                for window, count in metrics['upcoming'].items()
+            ],
+            '# HELP auction_expiring_peak_per_minute Largest number of auctions ending in one minute within the window.',
+            '# TYPE auction_expiring_peak_per_minute gauge',
+            *[
+                f'auction_expiring_peak_per_minute{{window="{window}"}} {count}'
+                for window, count in metrics['peak_per_minute'].items()
+            ],
+            '# HELP auction_overdue_auctions Active auctions past their end time.',
+            '# TYPE auction_overdue_auctions gauge',
+            f"auction_overdue_auctions {metrics['overdue']}",
+        ]
+        return HttpResponse('\n'.join(lines) + '\n', content_type=self.CONTENT_TYPE)
+
+
+class AuctionStatusStreamTokenView(APIView):
+    """경매 상태 구독(SSE) 연결용 짧은 토큰 발급 (브라우저 EventSource 는 Authorization 헤더를 보낼 수 없음)"""
+
+    authentication_classes = [StatelessJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        return Response(
+            {'token': issue_stream_token(request.user.id), 'expires_in': STREAM_TOKEN_SECONDS},
+            status=status.HTTP_200_OK
+        )
+
+
+class AuctionStatusStreamView(View):
+    """
+    경매 상태 실시간 구독 (Server-Sent Events, ASGI 서버 필요)
+
+    GET ?vehicle_ids=1,2,3[&token=...]
+    Authorization 헤더 또는 AuctionStatusStreamTokenView 에서 받은 token 으로 인증한다. (EventSource 는 헤더 불가)
+    연결 직후 snapshot 이벤트로 현재 상태와 서버 시각을 보내고, 이후 상태가 바뀔 때마다 status 이벤트를 보낸다.
+    읽지 못해 밀린 연결에는 resync 이벤트로 현재 상태를 다시 보낸다.
+    Django 4.2 는 클라이언트 연결 종료를 스트림에 알리지 않으므로 MAX_STREAM_SECONDS 후 끊고 재접속하게 한다.
+    """
+
+    MAX_VEHICLES = 100
+    HEARTBEAT_SECONDS = 15
+    MAX_STREAM_SECONDS = 300
+    RETRY_MILLISECONDS = 3000
+
+    async def get(self, request):
+        if not await self._authenticate(request):
+            return JsonResponse(
+                {"detail": str(NotAuthenticated.default_detail)},
+                status=status.HTTP_401_UNAUTHORIZED
+            )
+
+        try:
+            vehicle_ids = self._parse_vehicle_ids(request.GET.get('vehicle_ids', ''))
+        except ValueError as e:
+            return JsonResponse({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 구독이 확인된 뒤 초기 상태를 읽어 그 사이 변경을 놓치지 않음
+        broker = get_broker()
+        queue = broker.subscribe(vehicle_ids)
+        try:
+            if not await broker.wait_subscribed():
+                broker.unsubscribe(queue, vehicle_ids)
+                response = JsonResponse(
+                    {"detail": "경매 상태를 구독할 수 없습니다. 잠시 후 다시 시도해주세요."},
+                    status=status.HTTP_503_SERVICE_UNAVAILABLE
+                )
+                response['Retry-After'] = str(self.RETRY_MILLISECONDS // 1000)
+                return response
+            snapshot = await sync_to_async(self._snapshot)(vehicle_ids)
+        except Exception:
+            broker.unsubscribe(queue, vehicle_ids)
+            raise
+
+        response = StreamingHttpResponse(
+            self._stream(broker, queue, vehicle_ids, snapshot),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    async def _authenticate(self, request) -> bool:
+        if 'token' in request.GET:
+            return verify_stream_token(request.GET['token']) is not None
+        try:
+            result = await sync_to_async(StatelessJWTAuthentication().authenticate)(request)
+        except AuthenticationFailed:
+            return False
+        return result is not None
+
+    def _parse_vehicle_ids(self, raw: str):
+        try:
+            vehicle_ids = sorted({int(value) for value in raw.split(',') if value.strip()})
+        except ValueError:
+            raise ValueError("vehicle_ids 는 콤마로 구분한 차량 ID 목록이어야 합니다.")
+        if not vehicle_ids:
+            raise ValueError("vehicle_ids 를 지정해야 합니다.")
+        if len(vehicle_ids) > self.MAX_VEHICLES:
+            raise ValueError(f"vehicle_ids 는 최대 {self.MAX_VEHICLES}개까지 지정할 수 있습니다.")
+        return vehicle_ids
+
+    def _snapshot(self, vehicle_ids):
+        auctions = Auction.objects.filter(
+            vehicle_id__in=vehicle_ids
+        ).exclude(
+            status=Auction.Status.PENDING
+        ).order_by('vehicle_id').values_list('vehicle_id', 'status', 'end_time')
+
+        return {
+            'server_time': timezone.now().isoformat(),
+            'auctions': [
+                {
+                    'vehicle_id': vehicle_id,
+                    'status': auction_status,
+                    'end_time': end_time.isoformat() if end_time else None
+                }
+                for vehicle_id, auction_status, end_time in auctions
+            ]
+        }
+
+    async def _stream(self, broker, queue, vehicle_ids, snapshot):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.MAX_STREAM_SECONDS
+        try:
+            yield f"retry: {self.RETRY_MILLISECONDS}\n\n"
+            yield self._format('snapshot', snapshot)
+
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=min(self.HEARTBEAT_SECONDS, remaining))
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if message is RESYNC:
+                    yield self._format('resync', await sync_to_async(self._snapshot)(vehicle_ids))
+                    continue
+                yield self._format('status', message, event_id=message.get('event_id'))
+        finally:
+            broker.unsubscribe(queue, vehicle_ids)
+
+    def _format(self, event: str, data, event_id=None) -> str:
+        lines = [f"event: {event}", f"data: {json.dumps(data, ensure_ascii=False)}"]
+        if event_id is not None:
+            lines.insert(0, f"id: {event_id}")
+        return "\n".join(lines) + "\n\n"
@@ -0,0 +1,36 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+class CacheVersion:
+    """
+    캐시에 저장하는 버전 번호
+
+    키가 유실되어도 이전 번호와 겹치지 않도록 현재 시각(ms)으로 시작하고, 변경 시 1씩 올린다.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+
+    def get(self) -> int:
+        version = cache.get(self.key)
+        if version is None:
+            cache.add(self.key, int(time.time() * 1000), None)
+            version = cache.get(self.key)
+        return version
+
+    def bump(self) -> None:
+        """
+        버전 올리기
+
+        커밋 전에 다른 프로세스가 이전 데이터를 읽어 새 버전으로 기록할 수 있으므로
+        커밋 후에 한 번 더 올린다.
+        """
+        self._incr()
+        transaction.on_commit(self._incr)
+
+    def _incr(self) -> None:
+        if not cache.add(self.key, int(time.time() * 1000), None):
+            cache.incr(self.key)
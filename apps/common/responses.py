@@ -0,0 +1,32 @@
+import json
+
+from rest_framework.response import Response
+
+
+class PrerenderedJSONResponse(Response):
+    """
+    미리 렌더링한 JSON 바이트를 그대로 내보내는 응답
+
+    캐시에 저장된 JSON 을 렌더러로 다시 직렬화하지 않는다.
+    `data` 는 접근할 때만 파싱한다. (테스트 등)
+    """
+
+    def __init__(self, content: bytes, status=None, headers=None):
+        self._prerendered = content
+        self._data = None
+        super().__init__(status=status, headers=headers, content_type='application/json')
+        self['Content-Type'] = 'application/json'
+
+    @property
+    def data(self):
+        if self._data is None and self._prerendered is not None:
+            self._data = json.loads(self._prerendered)
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+
+    @property
+    def rendered_content(self):
+        return self._prerendered
@@ -0,0 +1,33 @@
+"""
+테스트용 Redis
+
+fakeredis(Lua 포함)로 실제 명령과 Lua 스크립트를 그대로 실행한다.
+서비스 클래스의 client 속성을 테스트마다 새로 만든 가짜 서버의 클라이언트로 바꿔 끼운다.
+"""
+from unittest import mock
+
+import fakeredis
+
+
+class FakeRedisMixin:
+    """TestCase 용, use_fake_redis(서비스 클래스...) 로 client 를 fakeredis 로 교체"""
+
+    def use_fake_redis(self, *service_classes) -> fakeredis.FakeRedis:
+        self.redis_server = fakeredis.FakeServer()
+        client = fakeredis.FakeRedis(server=self.redis_server)
+        self._patch_clients(service_classes, client)
+        return client
+
+    def use_fake_async_redis(self, *service_classes) -> fakeredis.FakeAsyncRedis:
+        """비동기 클라이언트, use_fake_redis 와 함께 쓰면 같은 가짜 서버를 공유"""
+        if not hasattr(self, 'redis_server'):
+            self.redis_server = fakeredis.FakeServer()
+        client = fakeredis.FakeAsyncRedis(server=self.redis_server)
+        self._patch_clients(service_classes, client)
+        return client
+
+    def _patch_clients(self, service_classes, client) -> None:
+        for service_class in service_classes:
+            patcher = mock.patch.object(service_class, 'client', client)
+            patcher.start()
+            self.addCleanup(patcher.stop)
@@ -4,4 +4,7 @@ from django.apps import AppConfig
 class VehiclesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.vehicles'
-    verbose_name = '차량 관리'
\ No newline at end of file
+    verbose_name = '차량 관리'
+
+    def ready(self):
+        from apps.vehicles import signals  # noqa: F401
@@ -0,0 +1,462 @@
+"""
+공개 차량 비트맵 인덱스 (프로세스 내)
+
+브랜드/차종/모델/연료/변속기/지역/연식/상태 값마다 차량 ID 비트맵을 두고,
+필터는 비트맵 AND, 카운트는 popcount 로 계산한다. SQL 은 최종 페이지 ID 조회에만 사용한다.
+
+- 비트맵은 2^16 단위 청크로 나누고, 청크 안의 값이 적으면 set, 많으면 비트 배열로 저장 (roaring 방식)
+- 첫 사용 시 vehicle_listings 전체로 생성하고, 이후에는 VehicleListingService 가 남기는
+  변경 로그(캐시의 순번 + 순번별 차량 ID)를 따라 바뀐 차량만 다시 읽어 반영
+- 변경 로그가 끊겼거나(만료, 유실) 너무 많이 밀렸으면 백그라운드에서 전체 재생성하고, 그동안은 이전 상태로 응답
+"""
+import bisect
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+from apps.vehicles.models import VehicleListing
+
+logger = logging.getLogger(__name__)
+
+CHUNK_BITS = 16
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+CHUNK_BYTES = 1 << (CHUNK_BITS - 3)
+ARRAY_MAX = 4096  # 청크 내 값이 이보다 많으면 비트 배열로 전환
+
+if hasattr(int, 'bit_count'):
+    _popcount = int.bit_count
+else:  # Python 3.9 이하
+    def _popcount(value: int) -> int:
+        return bin(value).count('1')
+
+
+def _to_bits(values: Iterable[int]) -> bytearray:
+    bits = bytearray(CHUNK_BYTES)
+    for value in values:
+        bits[value >> 3] |= 1 << (value & 7)
+    return bits
+
+
+def _as_int(bits: bytearray) -> int:
+    return int.from_bytes(bits, 'little')
+
+
+class Bitmap:
+    """
+    청크 단위 압축 비트맵
+
+    청크는 값이 적으면 set, 많으면 8KB 비트 배열(bytearray)이다.
+    비트 배열끼리의 AND/OR/popcount 는 int 로 변환해 한 번에 계산한다.
+    """
+
+    __slots__ = ('chunks',)
+
+    def __init__(self, chunks: Optional[Dict[int, Any]] = None):
+        self.chunks = chunks or {}
+
+    def add(self, value: int) -> None:
+        key, low = value >> CHUNK_BITS, value & CHUNK_MASK
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            self.chunks[key] = {low}
+        elif isinstance(chunk, bytearray):
+            chunk[low >> 3] |= 1 << (low & 7)
+        else:
+            chunk.add(low)
+            if len(chunk) > ARRAY_MAX:
+                self.chunks[key] = _to_bits(chunk)
+
+    def discard(self, value: int) -> None:
+        key, low = value >> CHUNK_BITS, value & CHUNK_MASK
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            return
+        if isinstance(chunk, bytearray):
+            chunk[low >> 3] &= ~(1 << (low & 7)) & 0xFF
+            if not any(chunk):
+                del self.chunks[key]
+        else:
+            chunk.discard(low)
+            if not chunk:
+                del self.chunks[key]
+
+    def __contains__(self, value: int) -> bool:
+        chunk = self.chunks.get(value >> CHUNK_BITS)
+        if chunk is None:
+            return False
+        low = value & CHUNK_MASK
+        if isinstance(chunk, bytearray):
+            return bool((chunk[low >> 3] >> (low & 7)) & 1)
+        return low in chunk
+
+    def __len__(self) -> int:
+        return sum(
+            _popcount(_as_int(chunk)) if isinstance(chunk, bytearray) else len(chunk)
+            for chunk in self.chunks.values()
+        )
+
+    def __and__(self, other: 'Bitmap') -> 'Bitmap':
+        if len(other.chunks) < len(self.chunks):
+            self, other = other, self
+
+        chunks = {}
+        for key, left in self.chunks.items():
+            right = other.chunks.get(key)
+            if right is None:
+                continue
+            if isinstance(left, bytearray) and isinstance(right, bytearray):
+                bits = _as_int(left) & _as_int(right)
+                chunk = bytearray(bits.to_bytes(CHUNK_BYTES, 'little')) if bits else None
+            elif isinstance(left, bytearray):
+                chunk = {low for low in right if (left[low >> 3] >> (low & 7)) & 1}
+            elif isinstance(right, bytearray):
+                chunk = {low for low in left if (right[low >> 3] >> (low & 7)) & 1}
+            else:
+                chunk = left & right
+            if chunk:
+                chunks[key] = chunk
+        return Bitmap(chunks)
+
+    def __or__(self, other: 'Bitmap') -> 'Bitmap':
+        chunks = {
+            key: chunk.copy() for key, chunk in self.chunks.items()
+        }
+        for key, right in other.chunks.items():
+            left = chunks.get(key)
+            if left is None:
+                chunks[key] = right.copy()
+            elif isinstance(left, bytearray) or isinstance(right, bytearray):
+                left = left if isinstance(left, bytearray) else _to_bits(left)
+                right = right if isinstance(right, bytearray) else _to_bits(right)
+                chunks[key] = bytearray(
+                    (_as_int(left) | _as_int(right)).to_bytes(CHUNK_BYTES, 'little')
+                )
+            else:
+                chunk = left | right
+                chunks[key] = _to_bits(chunk) if len(chunk) > ARRAY_MAX else chunk
+        return Bitmap(chunks)
+
+    def copy(self) -> 'Bitmap':
+        return Bitmap({key: chunk.copy() for key, chunk in self.chunks.items()})
+
+    def __iter__(self):
+        for key, chunk in self.chunks.items():
+            base = key << CHUNK_BITS
+            if isinstance(chunk, bytearray):
+                for position, byte in enumerate(chunk):
+                    if byte:
+                        for offset in range(8):
+                            if (byte >> offset) & 1:
+                                yield base | (position << 3) | offset
+            else:
+                for low in chunk:
+                    yield base | low
+
+
+class VehicleBitmapIndex:
+    """공개 차량 비트맵 인덱스 (프로세스 단위 싱글턴으로 사용)"""
+
+    FIELDS = (
+        'brand_id', 'car_type_id', 'model_id', 'fuel_type',
+        'transmission', 'region', 'year', 'status',
+    )
+
+    SEQ_KEY = 'vehicle_bitmap:seq'
+    CHANGES_KEY = 'vehicle_bitmap:changes:{seq}'
+    CHANGES_TIMEOUT = 60 * 60
+    MAX_REPLAY = 500  # 밀린 변경 로그가 이보다 많으면 전체 재생성
+    SMALL_RESULT = 50000  # 결과가 이보다 작으면 비트맵 연산 대신 차량별로 직접 집계/정렬
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.bitmaps: Dict[str, Dict[Any, Bitmap]] = {field: {} for field in self.FIELDS}
+        self.rows: Dict[int, tuple] = {}
+        self.value_counts: Dict[str, Counter] = {field: Counter() for field in self.FIELDS}
+        self.visible = Bitmap()
+        self.order: List[Tuple[int, int]] = []  # (경매시작시간, 차량 ID) 오름차순 정렬 키
+        self.applied_seq: Optional[int] = None
+        self._built = False
+        self._rebuilding = False
+
+    # 변경 로그
+
+    @classmethod
+    def publish_changes(cls, vehicle_ids: Iterable[int]) -> None:
+        """
+        공개 차량 변경 기록 (vehicle_listings 를 갱신하는 쪽에서 호출)
+
+        커밋 후에 순번을 올려, 순번을 본 프로세스는 항상 커밋된 데이터를 읽는다. (변경당 한 번)
+        """
+        vehicle_ids = sorted(set(vehicle_ids))
+        if not vehicle_ids:
+            return
+        transaction.on_commit(lambda: cls._append_changes(vehicle_ids))
+
+    @classmethod
+    def _append_changes(cls, vehicle_ids: List[int]) -> None:
+        # 키가 유실되어도 이전 순번과 겹치지 않도록 현재 시각(ms)으로 시작
+        if cache.add(cls.SEQ_KEY, int(time.time() * 1000), None):
+            seq = cache.get(cls.SEQ_KEY)
+        else:
+            seq = cache.incr(cls.SEQ_KEY)
+        cache.set(cls.CHANGES_KEY.format(seq=seq), vehicle_ids, cls.CHANGES_TIMEOUT)
+
+    def refresh(self) -> None:
+        """
+        변경 로그를 따라 최신 상태로 맞춤
+
+        처음이면 전체 생성하고, 이후 전체 재생성이 필요하면 백그라운드에서 만드는 동안 이전 상태로 응답한다.
+        """
+        with self._lock:
+            if not self._built:
+                return self.rebuild()
+
+            current = cache.get(self.SEQ_KEY)
+            if current == self.applied_seq:
+                return
+
+            missed = None if current is None else current - self.applied_seq
+            if missed is None or missed < 0 or missed > self.MAX_REPLAY:
+                return self._rebuild_in_background()
+
+            keys = [
+                self.CHANGES_KEY.format(seq=seq)
+                for seq in range(self.applied_seq + 1, current + 1)
+            ]
+            changes = cache.get_many(keys)
+            if len(changes) != len(keys):
+                return self._rebuild_in_background()
+
+            vehicle_ids = set()
+            for ids in changes.values():
+                vehicle_ids.update(ids)
+            self._reload(vehicle_ids)
+            self.applied_seq = current
+
+    def reset(self) -> None:
+        """다음 refresh 에서 전체 재생성 (요청 안에서 바로)"""
+        with self._lock:
+            self._built = False
+
+    def _rebuild_in_background(self) -> None:
+        with self._lock:
+            if self._rebuilding:
+                return
+            self._rebuilding = True
+        threading.Thread(target=self._run_rebuild, name='vehicle-bitmap-rebuild', daemon=True).start()
+
+    def _run_rebuild(self) -> None:
+        try:
+            self.rebuild()
+        except Exception:
+            logger.warning("차량 비트맵 인덱스 재생성 실패, 다음 refresh 에서 재시도", exc_info=True)
+        finally:
+            self._rebuilding = False
+            connection.close()
+
+    def rebuild(self) -> None:
+        """
+        전체 재생성
+
+        새 인덱스를 잠금 없이 만든 뒤 교체하므로 만드는 동안에도 이전 상태로 조회할 수 있다.
+        """
+        # 읽기 전 순번을 기록해 두어 생성 중 발생한 변경은 다음 refresh 에서 다시 반영
+        seq = cache.get(self.SEQ_KEY)
+        if seq is None:
+            cache.add(self.SEQ_KEY, int(time.time() * 1000), None)
+            seq = cache.get(self.SEQ_KEY)
+
+        fresh = VehicleBitmapIndex()
+        for row in VehicleListing.objects.order_by().values_list(
+            'vehicle_id', 'start_time', *self.FIELDS
+        ).iterator(chunk_size=10000):
+            fresh._add(row, sort_order=False)
+        fresh.order.sort()
+
+        with self._lock:
+            self.bitmaps = fresh.bitmaps
+            self.value_counts = fresh.value_counts
+            self.rows = fresh.rows
+            self.visible = fresh.visible
+            self.order = fresh.order
+            self.applied_seq = seq
+            self._built = True
+
+    def _reload(self, vehicle_ids: Iterable[int]) -> None:
+        vehicle_ids = list(vehicle_ids)
+        for vehicle_id in vehicle_ids:
+            self._remove(vehicle_id)
+        for row in VehicleListing.objects.filter(vehicle_id__in=vehicle_ids).values_list(
+            'vehicle_id', 'start_time', *self.FIELDS
+        ):
+            self._add(row)
+
+    def _add(self, row: tuple, sort_order: bool = True) -> None:
+        vehicle_id, start_time, values = row[0], row[1], row[2:]
+        self.rows[vehicle_id] = (self._sort_key(vehicle_id, start_time), values)
+        self.visible.add(vehicle_id)
+        for field, value in zip(self.FIELDS, values):
+            self.bitmaps[field].setdefault(value, Bitmap()).add(vehicle_id)
+            self.value_counts[field][value] += 1
+        if sort_order:
+            bisect.insort(self.order, self.rows[vehicle_id][0])
+        else:
+            self.order.append(self.rows[vehicle_id][0])
+
+    def _remove(self, vehicle_id: int) -> None:
+        entry = self.rows.pop(vehicle_id, None)
+        if entry is None:
+            return
+        sort_key, values = entry
+        self.visible.discard(vehicle_id)
+        for field, value in zip(self.FIELDS, values):
+            bitmap = self.bitmaps[field].get(value)
+            if bitmap is not None:
+                bitmap.discard(vehicle_id)
+                if not bitmap.chunks:
+                    del self.bitmaps[field][value]
+            self.value_counts[field][value] -= 1
+            if self.value_counts[field][value] <= 0:
+                del self.value_counts[field][value]
+        position = bisect.bisect_left(self.order, sort_key)
+        if position < len(self.order) and self.order[position] == sort_key:
+            del self.order[position]
+
+    def _sort_key(self, vehicle_id: int, start_time) -> Tuple[int, int]:
+        # 경매시작시간이 없으면 0 (오름차순 처음, 내림차순 마지막: vehicle_listings 정렬과 동일)
+        micros = int(start_time.timestamp() * 1000000) if start_time else 0
+        return micros, vehicle_id
+
+    # 조회
+
+    def filter(self, **conditions) -> Bitmap:
+        """
+        필드 = 값 조건 AND (조건이 없으면 공개 차량 전체)
+
+        결과는 잠금 밖에서 읽히므로 refresh 가 바꾸지 않는 복사본을 돌려준다.
+        """
+        with self._lock:
+            result = None
+            for field, value in conditions.items():
+                bitmap = self.bitmaps[field].get(value)
+                if bitmap is None:
+                    return Bitmap()
+                result = bitmap if result is None else result & bitmap
+            return (self.visible if result is None else result).copy()
+
+    def _is_everything(self, bitmap: Bitmap, size: int) -> bool:
+        # 필터 결과는 항상 공개 차량의 부분집합이므로 크기가 같으면 전체
+        return bitmap is self.visible or size == len(self.rows)
+
+    def counts(self, field: str, within: Optional[Bitmap] = None) -> Dict[Any, int]:
+        """필드 값별 차량 수 (within 이 있으면 교집합 popcount)"""
+        with self._lock:
+            size = None if within is None else len(within)
+            if within is None or self._is_everything(within, size):
+                return dict(self.value_counts[field])
+
+            if size <= self.SMALL_RESULT:
+                position = self.FIELDS.index(field)
+                return dict(Counter(self.rows[vehicle_id][1][position] for vehicle_id in within))
+
+            counts = {}
+            for value, bitmap in self.bitmaps[field].items():
+                count = len(bitmap & within)
+                if count:
+                    counts[value] = count
+            return counts
+
+    def page_ids(self, bitmap: Bitmap, start: int, stop: int, descending: bool = True) -> List[int]:
+        """
+        정렬 순서대로 start ~ stop 번째 차량 ID
+
+        필터가 없으면 정렬 키 배열을 바로 자르고, 결과가 작고 드문드문하면 결과만 정렬,
+        그 외에는 정렬 순서로 훑으며 비트를 확인한다.
+        """
+        if start >= stop:
+            return []
+
+        with self._lock:
+            size = len(bitmap)
+            if self._is_everything(bitmap, size):
+                if descending:
+                    size = len(self.order)
+                    keys = self.order[max(size - stop, 0):max(size - start, 0)][::-1]
+                else:
+                    keys = self.order[start:stop]
+                return [vehicle_id for _, vehicle_id in keys]
+
+            # 앞쪽 페이지는 훑는 편이 빠르다 (예상 탐색 길이 = stop * 전체 / 결과 수)
+            if size <= self.SMALL_RESULT and stop * len(self.order) > size * size:
+                keys = sorted(
+                    (self.rows[vehicle_id][0] for vehicle_id in bitmap),
+                    reverse=descending
+                )
+                return [vehicle_id for _, vehicle_id in keys[start:stop]]
+
+            return self._scan_ids(bitmap, start, stop, descending)
+
+    def _scan_ids(self, bitmap: Bitmap, start: int, stop: int, descending: bool) -> List[int]:
+        ids = []
+        position = 0
+        for _, vehicle_id in reversed(self.order) if descending else self.order:
+            if vehicle_id not in bitmap:
+                continue
+            if position >= start:
+                ids.append(vehicle_id)
+                if len(ids) >= stop - start:
+                    break
+            position += 1
+        return ids
+
+
+class BitmapListingQuery:
+    """
+    비트맵 결과를 Paginator 가 다룰 수 있게 감싼 객체
+
+    count() 는 popcount, 슬라이스는 해당 페이지 ID 만 vehicle_listings 에서 조회한다.
+    """
+    ordered = True
+
+    def __init__(self, index: VehicleBitmapIndex, bitmap: Bitmap, descending: bool = True):
+        self.index = index
+        self.bitmap = bitmap
+        self.descending = descending
+
+    def count(self) -> int:
+        return len(self.bitmap)
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __getitem__(self, item):
+        if not isinstance(item, slice):
+            return self[item:item + 1][0]
+
+        start = item.start or 0
+        stop = item.stop if item.stop is not None else self.count()
+        ids = self.index.page_ids(self.bitmap, start, stop, self.descending)
+        listings = VehicleListing.objects.in_bulk(ids)
+        return [listings[vehicle_id] for vehicle_id in ids if vehicle_id in listings]
+
+    def counts(self, field: str) -> Dict[Any, int]:
+        return self.index.counts(field, within=self.bitmap)
+
+
+_index = VehicleBitmapIndex()
+
+
+def is_enabled() -> bool:
+    return getattr(settings, 'VEHICLE_BITMAP_INDEX_ENABLED', False)
+
+
+def get_index() -> VehicleBitmapIndex:
+    """최신 상태로 맞춘 프로세스 인덱스"""
+    _index.refresh()
+    return _index
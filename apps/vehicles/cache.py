@@ -0,0 +1,56 @@
+"""
+필터 트리 캐시
+
+렌더링된 JSON 바이트를 버전이 붙은 키로 저장한다.
+공개 차량 수나 분류 데이터가 바뀌면 버전을 올려 이전 사본을 무효화하고,
+무효화 직후에는 한 워커만 락을 잡고 재생성하며 나머지는 직전 사본을 응답한다.
+"""
+from typing import Callable
+
+from django.core.cache import cache
+
+from apps.common.cache import CacheVersion
+
+
+class FilterTreeCache:
+    VERSION_KEY = 'filter_tree:version'
+    DATA_KEY = 'filter_tree:data:{version}'
+    LOCK_KEY = 'filter_tree:lock:{version}'
+    LATEST_KEY = 'filter_tree:latest'
+
+    DATA_TIMEOUT = 60 * 60 * 24
+    LOCK_TIMEOUT = 30  # 재생성 중 워커가 죽어도 이 시간 후에는 다른 워커가 재생성
+
+    def __init__(self):
+        self.version = CacheVersion(self.VERSION_KEY)
+
+    def get_or_build(self, build: Callable[[], bytes]) -> bytes:
+        version = self.get_version()
+
+        content = cache.get(self.DATA_KEY.format(version=version))
+        if content is not None:
+            return content
+
+        lock_key = self.LOCK_KEY.format(version=version)
+        if cache.add(lock_key, 1, self.LOCK_TIMEOUT):
+            try:
+                content = build()
+                cache.set(self.DATA_KEY.format(version=version), content, self.DATA_TIMEOUT)
+                cache.set(self.LATEST_KEY, content, None)
+                return content
+            finally:
+                cache.delete(lock_key)
+
+        # 다른 워커가 재생성 중이면 직전 사본 응답
+        content = cache.get(self.LATEST_KEY)
+        if content is not None:
+            return content
+
+        # 직전 사본도 없으면 (최초 요청) 직접 생성
+        return build()
+
+    def get_version(self) -> int:
+        return self.version.get()
+
+    def invalidate(self) -> None:
+        self.version.bump()
@@ -0,0 +1,102 @@
+"""
+브랜드/차종/모델 분류 카탈로그 (프로세스 내 읽기 전용)
+
+분류 데이터는 scripts/import_brands.py 로 넣는 참조 데이터라 거의 바뀌지 않는다.
+프로세스마다 id → (이름, 상위 id) 스냅샷을 한 번 읽어 두고, 캐시의 버전 키가 바뀌었을 때만 다시 읽는다.
+(Brand/CarType/Model 이 저장/삭제되면 시그널에서 버전을 올림)
+"""
+import threading
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, NamedTuple, Optional, Tuple
+
+from apps.common.cache import CacheVersion
+from apps.vehicles.models import Brand, CarType, Model
+
+
+class CatalogEntry(NamedTuple):
+    id: int
+    name: str
+    parent_id: Optional[int]  # 브랜드는 None, 차종은 브랜드 id, 모델은 차종 id
+
+
+class TaxonomyCatalog:
+    """분류 스냅샷 (생성 후 변경하지 않음)"""
+
+    VERSION_KEY = 'taxonomy:version'
+
+    __slots__ = (
+        'version', 'brands', 'car_types', 'models',
+        'car_type_ids_by_brand', 'model_ids_by_car_type',
+    )
+
+    def __init__(
+        self,
+        version: int,
+        brands: Iterable[Tuple[int, str]],
+        car_types: Iterable[Tuple[int, int, str]],
+        models: Iterable[Tuple[int, int, str]],
+    ):
+        self.version = version
+        self.brands: Mapping[int, CatalogEntry] = MappingProxyType({
+            brand_id: CatalogEntry(brand_id, name, None) for brand_id, name in brands
+        })
+        self.car_types: Mapping[int, CatalogEntry] = MappingProxyType({
+            car_type_id: CatalogEntry(car_type_id, name, brand_id)
+            for car_type_id, brand_id, name in car_types
+        })
+        self.models: Mapping[int, CatalogEntry] = MappingProxyType({
+            model_id: CatalogEntry(model_id, name, car_type_id)
+            for model_id, car_type_id, name in models
+        })
+        self.car_type_ids_by_brand = self._group(self.car_types)
+        self.model_ids_by_car_type = self._group(self.models)
+
+    @classmethod
+    def load(cls, version: int) -> 'TaxonomyCatalog':
+        return cls(
+            version,
+            Brand.objects.order_by('id').values_list('id', 'name'),
+            CarType.objects.order_by('id').values_list('id', 'brand_id', 'name'),
+            Model.objects.order_by('id').values_list('id', 'car_type_id', 'name'),
+        )
+
+    def _group(self, entries: Mapping[int, CatalogEntry]) -> Mapping[int, Tuple[int, ...]]:
+        grouped: Dict[int, list] = {}
+        for entry in entries.values():
+            grouped.setdefault(entry.parent_id, []).append(entry.id)
+        return MappingProxyType({parent_id: tuple(ids) for parent_id, ids in grouped.items()})
+
+    def has_model(self, model_id: int) -> bool:
+        return model_id in self.models
+
+    def model_path(self, model_id: int) -> Optional[Tuple[CatalogEntry, CatalogEntry, CatalogEntry]]:
+        """모델 id → (브랜드, 차종, 모델), 없으면 None"""
+        model = self.models.get(model_id)
+        if model is None:
+            return None
+        car_type = self.car_types[model.parent_id]
+        return self.brands[car_type.parent_id], car_type, model
+
+
+_catalog: Optional[TaxonomyCatalog] = None
+_lock = threading.Lock()
+_version = CacheVersion(TaxonomyCatalog.VERSION_KEY)
+
+
+def get_catalog() -> TaxonomyCatalog:
+    """현재 버전의 카탈로그 (버전이 바뀌었으면 다시 읽음)"""
+    global _catalog
+
+    version = _version.get()
+    catalog = _catalog
+    if catalog is not None and catalog.version == version:
+        return catalog
+
+    with _lock:
+        if _catalog is None or _catalog.version != version:
+            _catalog = TaxonomyCatalog.load(version)
+        return _catalog
+
+
+def invalidate_catalog() -> None:
+    _version.bump()
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.vehicles.services import VehicleCountService
+
+
+class Command(BaseCommand):
+    help = '모델별 공개 차량 수(model_vehicle_counts)를 원본 테이블 기준으로 재생성하고 검증합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify-only',
+            action='store_true',
+            help='재생성 없이 현재 카운트 테이블만 검증합니다.'
+        )
+
+    def handle(self, *args, **options):
+        service = VehicleCountService()
+
+        mismatches = service.verify()
+        self._report(mismatches)
+
+        if options['verify_only']:
+            if mismatches:
+                raise CommandError(f'불일치 {len(mismatches)}건')
+            return
+
+        row_count = service.rebuild()
+        self.stdout.write(f'{row_count}개 모델 카운트 재생성 완료')
+
+        mismatches = service.verify()
+        if mismatches:
+            self._report(mismatches)
+            raise CommandError(f'재생성 후에도 불일치 {len(mismatches)}건')
+
+        self.stdout.write(self.style.SUCCESS('검증 완료: 불일치 없음'))
+
+    def _report(self, mismatches):
+        if not mismatches:
+            self.stdout.write('불일치 없음')
+            return
+
+        self.stdout.write(self.style.WARNING(f'불일치 {len(mismatches)}건'))
+        for mismatch in mismatches[:20]:
+            self.stdout.write(
+                f"  model_id={mismatch['model_id']} "
+                f"expected={mismatch['expected']} stored={mismatch['stored']}"
+            )
@@ -0,0 +1,176 @@
+# Generated by Django 4.2 on 2026-10-17 03:32
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_vehicle_listings(apps, schema_editor):
+    """기존 공개 차량으로 vehicle_listings 채우기"""
+    Vehicle = apps.get_model("vehicles", "Vehicle")
+    VehicleImage = apps.get_model("vehicles", "VehicleImage")
+    VehicleListing = apps.get_model("vehicles", "VehicleListing")
+
+    vehicles = (
+        Vehicle.objects.filter(auction__isnull=False)
+        .exclude(auction__status="PENDING")
+        .select_related("model__car_type__brand", "auction")
+        .order_by("id")
+    )
+
+    def create_listings(batch):
+        # 배치의 대표 이미지를 한 번에 조회 (차량별 조회 없음, 여러 장이면 id 가 가장 작은 것)
+        primary_images = {}
+        for vehicle_id, image in (
+            VehicleImage.objects.filter(vehicle_id__in=[vehicle.id for vehicle in batch], is_primary=True)
+            .order_by("-id")
+            .values_list("vehicle_id", "image")
+        ):
+            primary_images[vehicle_id] = image
+
+        VehicleListing.objects.bulk_create([
+            VehicleListing(
+                vehicle_id=vehicle.id,
+                brand_id=vehicle.model.car_type.brand_id,
+                brand_name=vehicle.model.car_type.brand.name,
+                car_type_id=vehicle.model.car_type_id,
+                car_type_name=vehicle.model.car_type.name,
+                model_id=vehicle.model_id,
+                model_name=vehicle.model.name,
+                status=vehicle.auction.status,
+                start_time=vehicle.auction.start_time,
+                end_time=vehicle.auction.end_time,
+                year=vehicle.year,
+                mileage=vehicle.mileage,
+                fuel_type=vehicle.fuel_type,
+                transmission=vehicle.transmission,
+                region=vehicle.region,
+                thumbnail=primary_images.get(vehicle.id) or "",
+            )
+            for vehicle in batch
+        ])
+
+    batch = []
+    for vehicle in vehicles.iterator(chunk_size=1000):
+        batch.append(vehicle)
+        if len(batch) >= 1000:
+            create_listings(batch)
+            batch = []
+
+    if batch:
+        create_listings(batch)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("vehicles", "0001_initial"),
+        ("auctions", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VehicleListing",
+            fields=[
+                (
+                    "vehicle",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="listing",
+                        serialize=False,
+                        to="vehicles.vehicle",
+                        verbose_name="차량",
+                    ),
+                ),
+                ("brand_id", models.BigIntegerField(verbose_name="브랜드 ID")),
+                ("brand_name", models.CharField(max_length=50, verbose_name="브랜드명")),
+                ("car_type_id", models.BigIntegerField(verbose_name="차종 ID")),
+                ("car_type_name", models.CharField(max_length=50, verbose_name="차종명")),
+                ("model_id", models.BigIntegerField(verbose_name="모델 ID")),
+                ("model_name", models.CharField(max_length=100, verbose_name="모델명")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("PENDING", "승인대기"),
+                            ("AUCTION_ACTIVE", "경매진행"),
+                            ("AUCTION_ENDED", "경매종료"),
+                            ("TRANSACTION_COMPLETE", "거래완료"),
+                        ],
+                        max_length=30,
+                        verbose_name="상태",
+                    ),
+                ),
+                (
+                    "start_time",
+                    models.DateTimeField(blank=True, null=True, verbose_name="경매시작시간"),
+                ),
+                (
+                    "end_time",
+                    models.DateTimeField(blank=True, null=True, verbose_name="경매종료시간"),
+                ),
+                ("year", models.IntegerField(verbose_name="연식")),
+                ("mileage", models.PositiveIntegerField(verbose_name="주행거리")),
+                (
+                    "fuel_type",
+                    models.CharField(
+                        choices=[
+                            ("lpg", "LPG"),
+                            ("gasoline", "가솔린"),
+                            ("diesel", "디젤"),
+                            ("hybrid", "하이브리드"),
+                            ("electric", "전기"),
+                            ("bifuel", "바이퓨얼"),
+                        ],
+                        max_length=20,
+                        verbose_name="연료타입",
+                    ),
+                ),
+                (
+                    "transmission",
+                    models.CharField(
+                        choices=[("auto", "자동"), ("manual", "수동")],
+                        max_length=10,
+                        verbose_name="변속기",
+                    ),
+                ),
+                ("region", models.CharField(max_length=50, verbose_name="지역")),
+                (
+                    "thumbnail",
+                    models.ImageField(blank=True, upload_to="", verbose_name="대표이미지"),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "차량 목록",
+                "verbose_name_plural": "차량 목록",
+                "db_table": "vehicle_listings",
+                "ordering": ["-start_time", "-vehicle"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="vehiclelisting",
+            index=models.Index(
+                fields=["start_time"], name="vehicle_lis_start_t_2cde01_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="vehiclelisting",
+            index=models.Index(
+                fields=["brand_id", "start_time"], name="vehicle_lis_brand_i_365719_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="vehiclelisting",
+            index=models.Index(
+                fields=["car_type_id", "start_time"],
+                name="vehicle_lis_car_typ_b2a1ef_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="vehiclelisting",
+            index=models.Index(
+                fields=["model_id", "start_time"], name="vehicle_lis_model_i_fd20b8_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_vehicle_listings, migrations.RunPython.noop),
+    ]
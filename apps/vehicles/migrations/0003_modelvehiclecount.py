@@ -0,0 +1,84 @@
+# Generated by Django 4.2 on 2026-10-17 03:34
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_model_vehicle_counts(apps, schema_editor):
+    """모든 모델에 대해 공개 차량 수 행 생성"""
+    Model = apps.get_model("vehicles", "Model")
+    Vehicle = apps.get_model("vehicles", "Vehicle")
+    ModelVehicleCount = apps.get_model("vehicles", "ModelVehicleCount")
+
+    counts = dict(
+        Vehicle.objects.filter(auction__isnull=False)
+        .exclude(auction__status="PENDING")
+        .values("model_id")
+        .annotate(total=models.Count("id"))
+        .values_list("model_id", "total")
+    )
+
+    ModelVehicleCount.objects.bulk_create(
+        [
+            ModelVehicleCount(
+                model_id=model_id,
+                car_type_id=car_type_id,
+                brand_id=brand_id,
+                vehicle_count=counts.get(model_id, 0),
+            )
+            for model_id, car_type_id, brand_id in Model.objects.values_list(
+                "id", "car_type_id", "car_type__brand_id"
+            )
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("vehicles", "0002_vehiclelisting"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ModelVehicleCount",
+            fields=[
+                (
+                    "model",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="visible_count",
+                        serialize=False,
+                        to="vehicles.model",
+                        verbose_name="모델",
+                    ),
+                ),
+                ("car_type_id", models.BigIntegerField(verbose_name="차종 ID")),
+                ("brand_id", models.BigIntegerField(verbose_name="브랜드 ID")),
+                (
+                    "vehicle_count",
+                    models.IntegerField(default=0, verbose_name="공개 차량 수"),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "모델별 차량 수",
+                "verbose_name_plural": "모델별 차량 수",
+                "db_table": "model_vehicle_counts",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="modelvehiclecount",
+            index=models.Index(
+                fields=["car_type_id"], name="model_vehic_car_typ_3305cd_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="modelvehiclecount",
+            index=models.Index(
+                fields=["brand_id"], name="model_vehic_brand_i_a43c9f_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_model_vehicle_counts, migrations.RunPython.noop),
+    ]
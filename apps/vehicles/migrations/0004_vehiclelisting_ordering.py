@@ -0,0 +1,20 @@
+# Generated by Django 4.2 on 2026-10-17 05:18
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("vehicles", "0003_modelvehiclecount"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="vehiclelisting",
+            options={
+                "ordering": ["-start_time", "-vehicle_id"],
+                "verbose_name": "차량 목록",
+                "verbose_name_plural": "차량 목록",
+            },
+        ),
+    ]
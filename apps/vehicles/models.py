@@ -3,6 +3,8 @@ from django.core.exceptions import ValidationError
 from django.utils import timezone
 from django.conf import settings
 
+from apps.auctions.models import Auction
+
 
 class Brand(models.Model):
     """브랜드 모델 (현대, 기아 등)"""
@@ -153,3 +155,100 @@ class VehicleImage(models.Model):
     def __str__(self):
         return f"{self.vehicle} 이미지"
 
+
+class VehicleListing(models.Model):
+    """
+    차량 목록 조회용 비정규화 모델
+
+    공개 차량(승인대기 제외)만 저장하며 브랜드/차종/모델 이름과 경매 상태를 함께 보관해
+    목록 조회를 조인 없는 단일 테이블 조회로 처리한다.
+    VehicleListingService 가 차량/경매 변경과 같은 트랜잭션에서 동기화한다.
+    """
+    vehicle = models.OneToOneField(
+        Vehicle,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='listing',
+        verbose_name='차량'
+    )
+
+    # 브랜드/차종/모델
+    brand_id = models.BigIntegerField(verbose_name='브랜드 ID')
+    brand_name = models.CharField(max_length=50, verbose_name='브랜드명')
+    car_type_id = models.BigIntegerField(verbose_name='차종 ID')
+    car_type_name = models.CharField(max_length=50, verbose_name='차종명')
+    model_id = models.BigIntegerField(verbose_name='모델 ID')
+    model_name = models.CharField(max_length=100, verbose_name='모델명')
+
+    # 경매
+    status = models.CharField(max_length=30, choices=Auction.Status.choices, verbose_name='상태')
+    start_time = models.DateTimeField(null=True, blank=True, verbose_name='경매시작시간')
+    end_time = models.DateTimeField(null=True, blank=True, verbose_name='경매종료시간')
+
+    # 차량 정보
+    year = models.IntegerField(verbose_name='연식')
+    mileage = models.PositiveIntegerField(verbose_name='주행거리')
+    fuel_type = models.CharField(max_length=20, choices=Vehicle.FuelType.choices, verbose_name='연료타입')
+    transmission = models.CharField(max_length=10, choices=Vehicle.Transmission.choices, verbose_name='변속기')
+    region = models.CharField(max_length=50, verbose_name='지역')
+    thumbnail = models.ImageField(blank=True, verbose_name='대표이미지')
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'vehicle_listings'
+        verbose_name = '차량 목록'
+        verbose_name_plural = '차량 목록'
+        ordering = ['-start_time', '-vehicle_id']
+        # InnoDB 보조 인덱스는 PK(vehicle_id)를 포함하므로 (start_time, vehicle_id) 순 정렬까지 인덱스로 처리
+        indexes = [
+            models.Index(fields=['start_time']),
+            models.Index(fields=['brand_id', 'start_time']),
+            models.Index(fields=['car_type_id', 'start_time']),
+            models.Index(fields=['model_id', 'start_time']),
+        ]
+
+    def __str__(self):
+        return f"{self.brand_name} {self.model_name} ({self.year}년식)"
+
+    @property
+    def remaining_seconds(self):
+        """경매 남은 시간(초)"""
+        if self.status != Auction.Status.AUCTION_ACTIVE:
+            return 0
+
+        remaining = self.end_time - timezone.now()
+        return max(0, int(remaining.total_seconds()))
+
+
+class ModelVehicleCount(models.Model):
+    """
+    모델별 공개 차량 수 (필터 트리 카운트용)
+
+    차종/브랜드 합계는 car_type_id, brand_id 기준으로 모델 행을 합산한다.
+    VehicleListingService 가 공개 여부가 바뀔 때마다 증감하며,
+    rebuild_model_counts 명령으로 원본 테이블 기준 재계산/검증할 수 있다.
+    """
+    model = models.OneToOneField(
+        Model,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='visible_count',
+        verbose_name='모델'
+    )
+    car_type_id = models.BigIntegerField(verbose_name='차종 ID')
+    brand_id = models.BigIntegerField(verbose_name='브랜드 ID')
+    vehicle_count = models.IntegerField(default=0, verbose_name='공개 차량 수')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'model_vehicle_counts'
+        verbose_name = '모델별 차량 수'
+        verbose_name_plural = '모델별 차량 수'
+        indexes = [
+            models.Index(fields=['car_type_id']),
+            models.Index(fields=['brand_id']),
+        ]
+
+    def __str__(self):
+        return f"{self.model_id}: {self.vehicle_count}"
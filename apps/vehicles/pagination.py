@@ -1,8 +1,173 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import json
+from collections import OrderedDict
+from functools import reduce
+
+from django.db.models import F, Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class VehicleListPagination(PageNumberPagination):
     """차량 목록 페이지네이션"""
     page_size = 20  # 기본 페이지 사이즈
     page_size_query_param = 'page_size'  # 클라이언트가 페이지 사이즈 조정 가능
-    max_page_size = 100  # 최대 페이지 사이즈 제한
\ No newline at end of file
+    max_page_size = 100  # 최대 페이지 사이즈 제한
+
+
+class VehicleCursorPagination(BasePagination):
+    """
+    차량 목록 커서(keyset) 페이지네이션
+
+    (경매시작시간, 차량 ID) 를 키로 사용해 COUNT(*) 와 OFFSET 없이 페이지를 조회한다.
+    경매시작시간이 없는 차량은 최신순에서는 마지막, 오래된순에서는 처음에 위치한다.
+    (MySQL 의 기본 NULL 정렬 순서와 동일하여 인덱스를 그대로 사용)
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = '유효하지 않은 커서입니다.'
+
+    # 정렬 키 (vehicle_listings 컬럼)
+    time_field = 'start_time'
+    id_field = 'vehicle_id'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.descending = getattr(view, 'sort_descending', True)
+
+        cursor = self.decode_cursor(request)
+        reverse = cursor['reverse'] if cursor else False
+
+        # 이전 페이지 요청이면 반대 방향으로 스캔 후 결과를 뒤집는다
+        scan_descending = self.descending != reverse
+        queryset = queryset.order_by(*self._get_ordering(scan_descending))
+        if cursor:
+            queryset = queryset.filter(
+                self._get_position_filter(cursor['time'], cursor['id'], scan_descending)
+            )
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next = cursor is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True},
+                'previous': {'type': 'string', 'nullable': True},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        time_value, id_value = self._get_position(self.page[-1])
+        return self.encode_cursor(time_value, id_value, reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        time_value, id_value = self._get_position(self.page[0])
+        return self.encode_cursor(time_value, id_value, reverse=True)
+
+    def encode_cursor(self, time_value, id_value, reverse):
+        payload = {
+            't': time_value.isoformat() if time_value else None,
+            'i': id_value,
+            'r': 1 if reverse else 0,
+        }
+        encoded = base64.urlsafe_b64encode(
+            json.dumps(payload, separators=(',', ':')).encode('ascii')
+        ).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')))
+            time_value = parse_datetime(payload['t']) if payload['t'] is not None else None
+            if payload['t'] is not None and time_value is None:
+                raise ValueError(payload['t'])
+            return {
+                'time': time_value,
+                'id': int(payload['i']),
+                'reverse': bool(payload['r']),
+            }
+        except (TypeError, ValueError, KeyError, UnicodeEncodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _get_ordering(self, descending):
+        if descending:
+            return [F(self.time_field).desc(nulls_last=True), F(self.id_field).desc()]
+        return [F(self.time_field).asc(nulls_first=True), F(self.id_field).asc()]
+
+    def _get_position_filter(self, time_value, id_value, descending):
+        """커서 위치 이후의 행만 남기는 keyset 조건"""
+        is_null = Q(**{f'{self.time_field}__isnull': True})
+        is_not_null = Q(**{f'{self.time_field}__isnull': False})
+
+        if descending:
+            if time_value is None:
+                return is_null & Q(**{f'{self.id_field}__lt': id_value})
+            return (
+                Q(**{f'{self.time_field}__lt': time_value})
+                | Q(**{self.time_field: time_value, f'{self.id_field}__lt': id_value})
+                | is_null
+            )
+
+        if time_value is None:
+            return (is_null & Q(**{f'{self.id_field}__gt': id_value})) | is_not_null
+        return (
+            Q(**{f'{self.time_field}__gt': time_value})
+            | Q(**{self.time_field: time_value, f'{self.id_field}__gt': id_value})
+        )
+
+    def _get_position(self, item):
+        time_value = reduce(
+            lambda obj, attr: getattr(obj, attr, None) if obj is not None else None,
+            self.time_field.split('__'),
+            item
+        )
+        id_value = reduce(getattr, self.id_field.split('__'), item)
+        return time_value, id_value
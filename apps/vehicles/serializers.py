@@ -2,8 +2,9 @@ from rest_framework import serializers
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.utils import timezone
 
-from apps.vehicles.models import Brand, CarType, Model, Vehicle, VehicleImage
+from apps.vehicles.models import Brand, CarType, Model, Vehicle, VehicleImage, VehicleListing
 from apps.vehicles.services import FilterService
+from apps.vehicles.catalog import get_catalog
 from apps.vehicles.dto import VehicleCreateDTO
 
 
@@ -74,17 +75,15 @@ class VehicleCreateSerializer(serializers.Serializer):
 
 
 class VehicleListSerializer(serializers.ModelSerializer):
-    """차량 목록 시리얼라이저"""
-    brand_name = serializers.CharField(source='model.car_type.brand.name', read_only=True)
-    model_name = serializers.CharField(source='model.name', read_only=True)
+    """차량 목록 시리얼라이저 (vehicle_listings 기반)"""
+    id = serializers.IntegerField(source='vehicle_id', read_only=True)
     thumbnail_image = serializers.SerializerMethodField()
-    status = serializers.CharField(source='auction.status', read_only=True)
-    auction_start_time = serializers.DateTimeField(source='auction.start_time', read_only=True)
-    auction_end_time = serializers.DateTimeField(source='auction.end_time', read_only=True)
-    remaining_seconds = serializers.IntegerField(source='auction.remaining_seconds', read_only=True)
+    auction_start_time = serializers.DateTimeField(source='start_time', read_only=True)
+    auction_end_time = serializers.DateTimeField(source='end_time', read_only=True)
+    remaining_seconds = serializers.IntegerField(read_only=True)
 
     class Meta:
-        model = Vehicle
+        model = VehicleListing
         fields = [
             'id', 'brand_name', 'model_name', 'year',
             'mileage', 'fuel_type', 'status',
@@ -94,19 +93,17 @@ class VehicleListSerializer(serializers.ModelSerializer):
 
     def get_thumbnail_image(self, obj):
         """대표 이미지 URL 반환"""
-        primary_image = obj.images.filter(is_primary=True).first()
-        if primary_image:
-            request = self.context.get('request')
-            if request and primary_image.image:
-                return request.build_absolute_uri(primary_image.image.url)
+        request = self.context.get('request')
+        if request and obj.thumbnail:
+            return request.build_absolute_uri(obj.thumbnail.url)
         return None
 
 
 class VehicleDetailSerializer(serializers.ModelSerializer):
-    """차량 상세 시리얼라이저"""
-    brand = BrandSerializer(source='model.car_type.brand', read_only=True)
-    car_type = CarTypeSerializer(source='model.car_type', read_only=True)
-    model = ModelSerializer(read_only=True)
+    """차량 상세 시리얼라이저 (브랜드/차종/모델 이름은 분류 카탈로그에서 조회)"""
+    brand = serializers.SerializerMethodField()
+    car_type = serializers.SerializerMethodField()
+    model = serializers.SerializerMethodField()
     images = VehicleImageSerializer(many=True, read_only=True)
     status = serializers.CharField(source='auction.status', read_only=True)
     auction_start_time = serializers.DateTimeField(source='auction.start_time', read_only=True)
@@ -124,6 +121,30 @@ class VehicleDetailSerializer(serializers.ModelSerializer):
             'remaining_seconds', 'images'
         ]
 
+    def get_brand(self, obj):
+        return self._get_taxonomy(obj)[0]
+
+    def get_car_type(self, obj):
+        return self._get_taxonomy(obj)[1]
+
+    def get_model(self, obj):
+        return self._get_taxonomy(obj)[2]
+
+    def _get_taxonomy(self, obj):
+        if not hasattr(self, '_catalog'):
+            self._catalog = get_catalog()
+
+        path = self._catalog.model_path(obj.model_id)
+        if path is None:
+            # 카탈로그에 아직 반영되지 않은 모델은 DB 에서 조회
+            model = obj.model
+            return (
+                BrandSerializer(model.car_type.brand).data,
+                CarTypeSerializer(model.car_type).data,
+                ModelSerializer(model).data,
+            )
+        return tuple({'id': entry.id, 'name': entry.name} for entry in path)
+
 
 class FilterModelSerializer(serializers.Serializer):
     """필터 트리 모델 시리얼라이저"""
@@ -149,4 +170,23 @@ class FilterBrandSerializer(serializers.Serializer):
 
 
 class FilterTreeSerializer(serializers.Serializer):
-    brands = FilterBrandSerializer(many=True)
\ No newline at end of file
+    brands = FilterBrandSerializer(many=True)
+
+
+class FilterNodeSerializer(serializers.Serializer):
+    """필터 단계별 조회 노드 시리얼라이저"""
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    count = serializers.IntegerField()
+
+
+class FilterBrandListSerializer(serializers.Serializer):
+    brands = FilterNodeSerializer(many=True)
+
+
+class FilterBrandCarTypesSerializer(FilterNodeSerializer):
+    car_types = FilterNodeSerializer(many=True)
+
+
+class FilterCarTypeModelsSerializer(FilterNodeSerializer):
+    models = FilterNodeSerializer(many=True)
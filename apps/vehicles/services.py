@@ -1,12 +1,20 @@
-from typing import Dict, Any, Optional, List
+from collections import Counter
+from typing import Dict, Any, Optional, List, Iterable
 from django.core.exceptions import ValidationError
 from django.db import transaction
-from django.db.models import Count, Q, Prefetch
+from django.db.models import Count, F, Sum
 from django.contrib.auth import get_user_model
+from rest_framework.renderers import JSONRenderer
 
-from apps.vehicles.models import Brand, CarType, Model, Vehicle, VehicleImage
+from apps.vehicles.models import (
+    Brand, CarType, Model, Vehicle, VehicleImage, VehicleListing, ModelVehicleCount
+)
 from apps.vehicles.dto import VehicleCreateDTO
-from apps.auctions.models import Auction
+from apps.vehicles.cache import FilterTreeCache
+from apps.vehicles.catalog import get_catalog
+from apps.vehicles import bitmap
+from apps.auctions.models import Auction, AuctionEvent
+from apps.auctions.outbox import AuctionEventOutbox
 
 User = get_user_model()
 
@@ -15,10 +23,12 @@ class VehicleService:
 
     def create_vehicle(self, vehicle_data: VehicleCreateDTO) -> Vehicle:
 
-        model = Model.objects.get(id=vehicle_data.model_id)
+        # 모델 존재 여부는 DB 대신 분류 카탈로그로 확인
+        if not get_catalog().has_model(vehicle_data.model_id):
+            raise Model.DoesNotExist(f"존재하지 않는 모델입니다: {vehicle_data.model_id}")
 
         vehicle = Vehicle(
-            model=model,
+            model_id=vehicle_data.model_id,
             year=vehicle_data.year,
             first_registration_date=vehicle_data.first_registration_date,
             color=vehicle_data.color,
@@ -28,10 +38,14 @@ class VehicleService:
             region=vehicle_data.region
         )
 
-        vehicle.full_clean()
-        vehicle.save()
+        vehicle.full_clean(exclude=['model'])
 
-        Auction.objects.create(vehicle=vehicle)
+        with transaction.atomic():
+            vehicle.save()
+            Auction.objects.create(vehicle=vehicle)
+            AuctionEventOutbox.record(
+                AuctionEvent.EventType.VEHICLE_CREATED, [vehicle.id], {'model_id': vehicle.model_id}
+            )
 
         return vehicle
 
@@ -58,72 +72,409 @@ class VehicleService:
             raise ValidationError("차량 이미지는 최소 5장 이상 업로드해야 합니다.")
 
 
-class FilterService:
+class VehicleListingService:
+    """차량 목록 비정규화 테이블(vehicle_listings) 동기화"""
+
+    @transaction.atomic
+    def sync_vehicles(self, vehicle_ids: Iterable[int]) -> None:
+        """
+        원본 테이블 기준으로 차량들의 목록 행을 다시 만든다.
+        공개 차량(승인대기 제외)은 행을 생성/갱신하고, 그 외에는 행을 삭제한다.
+        """
+        vehicle_ids = set(vehicle_ids)
+        if not vehicle_ids:
+            return
+
+        vehicles = Vehicle.objects.filter(
+            id__in=vehicle_ids,
+            auction__isnull=False
+        ).exclude(
+            auction__status=Auction.Status.PENDING
+        ).select_related(
+            'model__car_type__brand',
+            'auction'
+        )
+
+        # 대표 이미지가 여러 장이면 먼저 등록된 이미지 사용
+        thumbnails = dict(
+            VehicleImage.objects.filter(
+                vehicle_id__in=vehicle_ids,
+                is_primary=True
+            ).order_by('-id').values_list('vehicle_id', 'image')
+        )
+
+        listings = [
+            self.build_listing(vehicle, thumbnails.get(vehicle.id, ''))
+            for vehicle in vehicles
+        ]
+
+        # 기존 행과 비교해 공개 여부(또는 모델)가 바뀐 만큼 모델별 차량 수 증감
+        previous_model_ids = list(
+            VehicleListing.objects.select_for_update().filter(
+                vehicle_id__in=vehicle_ids
+            ).values_list('model_id', flat=True)
+        )
+        deltas = Counter(listing.model_id for listing in listings)
+        deltas.subtract(previous_model_ids)
+
+        VehicleListing.objects.filter(vehicle_id__in=vehicle_ids).delete()
+        VehicleListing.objects.bulk_create(listings)
+
+        VehicleCountService().apply_deltas(deltas)
+        self.publish_changes(vehicle_ids)
+
+    def update_status(self, vehicle_ids: Iterable[int], **auction_fields) -> int:
+        """경매 상태 변경을 목록 행에 반영 (set-based 경매 전이에서 사용)"""
+        vehicle_ids = list(vehicle_ids)
+        updated = VehicleListing.objects.filter(
+            vehicle_id__in=vehicle_ids
+        ).update(**auction_fields)
+        self.publish_changes(vehicle_ids)
+        return updated
+
+    def publish_changes(self, vehicle_ids: Iterable[int]) -> None:
+        """비트맵 인덱스를 사용하는 경우 다른 프로세스에 변경 차량 전달"""
+        if bitmap.is_enabled():
+            bitmap.VehicleBitmapIndex.publish_changes(vehicle_ids)
+
+    def build_listing(self, vehicle: Vehicle, thumbnail: str = '') -> VehicleListing:
+        model = vehicle.model
+        car_type = model.car_type
+        auction = vehicle.auction
+
+        return VehicleListing(
+            vehicle_id=vehicle.id,
+            brand_id=car_type.brand_id,
+            brand_name=car_type.brand.name,
+            car_type_id=car_type.id,
+            car_type_name=car_type.name,
+            model_id=model.id,
+            model_name=model.name,
+            status=auction.status,
+            start_time=auction.start_time,
+            end_time=auction.end_time,
+            year=vehicle.year,
+            mileage=vehicle.mileage,
+            fuel_type=vehicle.fuel_type,
+            transmission=vehicle.transmission,
+            region=vehicle.region,
+            thumbnail=thumbnail
+        )
 
-    def get_filter_tree(self) -> Dict[str, Any]:
 
-        # 모델별 차량 카운트
-        models_with_count = Model.objects.annotate(
-            vehicle_count=Count(
-                'vehicle',
-                filter=~Q(vehicle__auction__status=Auction.Status.PENDING)
+class VehicleCountService:
+    """모델별 공개 차량 수(model_vehicle_counts) 관리"""
+
+    def apply_deltas(self, deltas: Dict[int, int]) -> None:
+        """모델별 증감분 반영 (호출하는 쪽 트랜잭션 안에서 실행)"""
+        if not any(deltas.values()):
+            return
+
+        FilterTreeCache().invalidate()
+
+        for model_id, delta in deltas.items():
+            if not delta:
+                continue
+
+            updated = ModelVehicleCount.objects.filter(model_id=model_id).update(
+                vehicle_count=F('vehicle_count') + delta
             )
-        ).select_related('car_type__brand')
+            if not updated:
+                # bulk_create 등으로 카운트 행 없이 생성된 모델
+                self.ensure_rows([model_id])
+                ModelVehicleCount.objects.filter(model_id=model_id).update(
+                    vehicle_count=F('vehicle_count') + delta
+                )
+
+    def ensure_rows(self, model_ids: Iterable[int]) -> None:
+        """카운트 행이 없는 모델에 0 건 행 생성"""
+        existing = set(
+            ModelVehicleCount.objects.filter(model_id__in=model_ids).values_list('model_id', flat=True)
+        )
+        ModelVehicleCount.objects.bulk_create(
+            [
+                ModelVehicleCount(model_id=model_id, car_type_id=car_type_id, brand_id=brand_id)
+                for model_id, car_type_id, brand_id in Model.objects.filter(
+                    id__in=set(model_ids) - existing
+                ).values_list('id', 'car_type_id', 'car_type__brand_id')
+            ],
+            ignore_conflicts=True
+        )
+
+    def count_from_source(self) -> Dict[int, int]:
+        """원본 테이블(vehicles ⋈ auctions) 기준 모델별 공개 차량 수"""
+        return dict(
+            Vehicle.objects.filter(
+                auction__isnull=False
+            ).exclude(
+                auction__status=Auction.Status.PENDING
+            ).values('model_id').annotate(
+                total=Count('id')
+            ).values_list('model_id', 'total')
+        )
 
-        # 차종별 차량 카운트
-        car_types_with_count = CarType.objects.annotate(
-            vehicle_count=Count(
-                'models__vehicle',
-                filter=~Q(models__vehicle__auction__status=Auction.Status.PENDING)
+    def verify(self) -> List[Dict[str, Any]]:
+        """카운트 테이블과 원본 테이블 비교, 불일치 목록 반환"""
+        expected = self.count_from_source()
+        taxonomy = {
+            model_id: (car_type_id, brand_id)
+            for model_id, car_type_id, brand_id in Model.objects.values_list(
+                'id', 'car_type_id', 'car_type__brand_id'
             )
-        ).select_related('brand').prefetch_related(
-            Prefetch(
-                'models',
-                queryset=models_with_count
+        }
+        stored = {
+            model_id: (vehicle_count, car_type_id, brand_id)
+            for model_id, vehicle_count, car_type_id, brand_id in ModelVehicleCount.objects.values_list(
+                'model_id', 'vehicle_count', 'car_type_id', 'brand_id'
             )
-        )
+        }
+
+        mismatches = []
+        for model_id, (car_type_id, brand_id) in taxonomy.items():
+            expected_row = (expected.get(model_id, 0), car_type_id, brand_id)
+            if stored.get(model_id) != expected_row:
+                mismatches.append({
+                    'model_id': model_id,
+                    'expected': expected_row[0],
+                    'stored': stored[model_id][0] if model_id in stored else None,
+                })
+        return mismatches
 
-        # 브랜드별 차량 카운트
-        brands = Brand.objects.annotate(
-            vehicle_count=Count(
-                'car_types__models__vehicle',
-                filter=~Q(car_types__models__vehicle__auction__status=Auction.Status.PENDING)
+    @transaction.atomic
+    def rebuild(self) -> int:
+        """원본 테이블 기준으로 카운트 테이블 전체 재생성, 생성한 행 수 반환"""
+        counts = self.count_from_source()
+        rows = [
+            ModelVehicleCount(
+                model_id=model_id,
+                car_type_id=car_type_id,
+                brand_id=brand_id,
+                vehicle_count=counts.get(model_id, 0)
             )
-        ).prefetch_related(
-            Prefetch(
-                'car_types',
-                queryset=car_types_with_count
+            for model_id, car_type_id, brand_id in Model.objects.values_list(
+                'id', 'car_type_id', 'car_type__brand_id'
             )
-        )
+        ]
+
+        ModelVehicleCount.objects.all().delete()
+        ModelVehicleCount.objects.bulk_create(rows, batch_size=1000)
+        FilterTreeCache().invalidate()
+        return len(rows)
+
+
+class VehicleFacetService:
+    """
+    차량 목록 패싯 카운트
+
+    필터가 적용된 vehicle_listings 쿼리셋을 (연료, 변속기, 지역, 연식) 으로 한 번만 GROUP BY 하고,
+    요청한 패싯별 합계는 파이썬에서 올린다. (조합 수는 수백 건 이내)
+    비트맵 인덱스 결과(BitmapListingQuery)가 들어오면 쿼리 없이 계산한다.
+    """
+    FACETS = ('fuel_type', 'transmission', 'region', 'year')
+    YEAR_BUCKET_SIZE = 5
+
+    def parse_facets(self, value: Optional[str]) -> List[str]:
+        """`facets` 파라미터 파싱 (콤마 구분, 알 수 없는 이름이면 ValidationError)"""
+        if not value:
+            return []
 
-        result = {'brands': []}
+        facets = []
+        for name in value.split(','):
+            name = name.strip()
+            if not name or name in facets:
+                continue
+            if name not in self.FACETS:
+                raise ValidationError(
+                    f"지원하지 않는 패싯입니다: {name} (가능한 값: {', '.join(self.FACETS)})"
+                )
+            facets.append(name)
+        return facets
 
-        for brand in brands:
-            brand_data = {
-                'id': brand.id,
-                'name': brand.name,
-                'count': brand.vehicle_count,
-                'car_types': []
+    def count_facets(self, queryset, facets: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        if not facets:
+            return {}
+
+        counters: Dict[str, Counter] = {name: Counter() for name in facets}
+
+        # 비트맵 인덱스 결과면 값별 비트맵과의 교집합 popcount 로 계산
+        if isinstance(queryset, bitmap.BitmapListingQuery):
+            for name in facets:
+                for value, total in queryset.counts(name).items():
+                    if name == 'year':
+                        value -= value % self.YEAR_BUCKET_SIZE
+                    counters[name][value] += total
+            return {name: self._to_buckets(name, counters[name]) for name in facets}
+
+        rows = queryset.order_by().values_list(*self.FACETS).annotate(total=Count('vehicle_id'))
+        for fuel_type, transmission, region, year, total in rows:
+            values = {
+                'fuel_type': fuel_type,
+                'transmission': transmission,
+                'region': region,
+                'year': year - year % self.YEAR_BUCKET_SIZE,
             }
+            for name in facets:
+                counters[name][values[name]] += total
+
+        return {name: self._to_buckets(name, counters[name]) for name in facets}
+
+    def _to_buckets(self, name: str, counter: Counter) -> List[Dict[str, Any]]:
+        labels = {
+            'fuel_type': dict(Vehicle.FuelType.choices),
+            'transmission': dict(Vehicle.Transmission.choices),
+        }.get(name, {})
+
+        buckets = []
+        for value in sorted(counter):
+            if name == 'year':
+                label = f"{value}~{value + self.YEAR_BUCKET_SIZE - 1}"
+            else:
+                label = labels.get(value, value)
+            buckets.append({'value': value, 'label': label, 'count': counter[value]})
+        return buckets
+
+
+class FilterTreeBuilder:
+    """
+    브랜드 → 차종 → 모델 필터 트리 생성기
+
+    모델별 카운트(model_id → count)만 입력받고, 분류 데이터는 카탈로그에서 읽어
+    모델 → 차종 → 브랜드 순서로 한 번씩만 순회하며 합계를 올린다.
+    기존 응답(집계 쿼리라 Meta.ordering 이 적용되지 않음)과 동일하게 각 단계는 PK 순으로 정렬한다.
+    """
 
-            for car_type in brand.car_types.all():
-                car_type_data = {
-                    'id': car_type.id,
-                    'name': car_type.name,
-                    'count': car_type.vehicle_count,
-                    'models': []
+    def build(self, model_counts: Dict[int, int]) -> Dict[str, Any]:
+        catalog = get_catalog()
+
+        # 차종별 모델 노드, 차종별 합계 (카탈로그는 id 순)
+        models_by_car_type: Dict[int, List[Dict[str, Any]]] = {}
+        car_type_counts: Counter = Counter()
+        for model_id, name, car_type_id in catalog.models.values():
+            count = model_counts.get(model_id, 0)
+            models_by_car_type.setdefault(car_type_id, []).append(
+                {'id': model_id, 'name': name, 'count': count}
+            )
+            car_type_counts[car_type_id] += count
+
+        # 브랜드별 차종 노드, 브랜드별 합계
+        car_types_by_brand: Dict[int, List[Dict[str, Any]]] = {}
+        brand_counts: Counter = Counter()
+        for car_type_id, name, brand_id in catalog.car_types.values():
+            count = car_type_counts[car_type_id]
+            car_types_by_brand.setdefault(brand_id, []).append({
+                'id': car_type_id,
+                'name': name,
+                'count': count,
+                'models': models_by_car_type.get(car_type_id, [])
+            })
+            brand_counts[brand_id] += count
+
+        return {
+            'brands': [
+                {
+                    'id': brand_id,
+                    'name': name,
+                    'count': brand_counts[brand_id],
+                    'car_types': car_types_by_brand.get(brand_id, [])
                 }
+                for brand_id, name, _ in catalog.brands.values()
+            ]
+        }
+
+
+class FilterService:
+
+    def __init__(self):
+        self.tree_builder = FilterTreeBuilder()
+        self.tree_cache = FilterTreeCache()
+
+    def get_filter_tree_json(self) -> bytes:
+        """렌더링된 필터 트리 JSON (캐시 우선)"""
+        return self.tree_cache.get_or_build(
+            lambda: JSONRenderer().render(self.get_filter_tree())
+        )
+
+    def get_filter_tree(self) -> Dict[str, Any]:
+
+        # 모델별 공개 차량 수 (비트맵 인덱스 popcount 또는 model_vehicle_counts)
+        if bitmap.is_enabled():
+            model_counts = bitmap.get_index().counts('model_id')
+        else:
+            model_counts = dict(
+                ModelVehicleCount.objects.values_list('model_id', 'vehicle_count')
+            )
+
+        return self.tree_builder.build(model_counts)
+
+    def get_brands(self, min_count: int = 0) -> Dict[str, Any]:
+        """브랜드 목록과 공개 차량 수 (하위 노드 없음)"""
+        brand_counts = dict(
+            ModelVehicleCount.objects.values('brand_id').annotate(
+                total=Sum('vehicle_count')
+            ).values_list('brand_id', 'total')
+        )
+
+        catalog = get_catalog()
 
-                for model in car_type.models.all():
-                    model_data = {
-                        'id': model.id,
-                        'name': model.name,
-                        'count': model.vehicle_count
-                    }
-                    car_type_data['models'].append(model_data)
+        return {
+            'brands': self._to_nodes(catalog.brands.values(), brand_counts, min_count)
+        }
 
-                brand_data['car_types'].append(car_type_data)
+    def get_car_types(self, brand_id: int, min_count: int = 0) -> Dict[str, Any]:
+        """브랜드 한 개의 차종 목록 (존재하지 않으면 Brand.DoesNotExist)"""
+        catalog = get_catalog()
+        brand = catalog.brands.get(brand_id)
+        if brand is None:
+            raise Brand.DoesNotExist(f"존재하지 않는 브랜드입니다: {brand_id}")
+
+        # model_vehicle_counts 의 brand_id 인덱스로 해당 브랜드 행만 집계
+        car_type_counts = dict(
+            ModelVehicleCount.objects.filter(brand_id=brand_id).values('car_type_id').annotate(
+                total=Sum('vehicle_count')
+            ).values_list('car_type_id', 'total')
+        )
+        car_types = self._to_nodes(
+            (catalog.car_types[car_type_id] for car_type_id in catalog.car_type_ids_by_brand.get(brand_id, ())),
+            car_type_counts,
+            min_count
+        )
+
+        return {
+            'id': brand.id,
+            'name': brand.name,
+            'count': sum(car_type_counts.values()),
+            'car_types': car_types
+        }
+
+    def get_models(self, car_type_id: int, min_count: int = 0) -> Dict[str, Any]:
+        """차종 한 개의 모델 목록 (존재하지 않으면 CarType.DoesNotExist)"""
+        catalog = get_catalog()
+        car_type = catalog.car_types.get(car_type_id)
+        if car_type is None:
+            raise CarType.DoesNotExist(f"존재하지 않는 차종입니다: {car_type_id}")
+
+        model_counts = dict(
+            ModelVehicleCount.objects.filter(car_type_id=car_type_id).values_list(
+                'model_id', 'vehicle_count'
+            )
+        )
+        models = self._to_nodes(
+            (catalog.models[model_id] for model_id in catalog.model_ids_by_car_type.get(car_type_id, ())),
+            model_counts,
+            min_count
+        )
 
-            result['brands'].append(brand_data)
+        return {
+            'id': car_type.id,
+            'name': car_type.name,
+            'count': sum(model_counts.values()),
+            'models': models
+        }
 
-        return result
+    def _to_nodes(self, rows: Iterable, counts: Dict[int, int], min_count: int) -> List[Dict[str, Any]]:
+        nodes = []
+        for node_id, name, _ in rows:
+            count = counts.get(node_id) or 0
+            if count >= min_count:
+                nodes.append({'id': node_id, 'name': name, 'count': count})
+        return nodes
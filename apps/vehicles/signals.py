@@ -0,0 +1,147 @@
+"""
+차량 목록 비정규화 테이블(vehicle_listings), 모델별 차량 수(model_vehicle_counts) 동기화 및
+분류 카탈로그, 필터 트리 캐시 무효화 시그널
+
+모델 save/delete 와 같은 트랜잭션에서 실행된다. (카탈로그, 필터 트리 캐시 무효화는 커밋 후 트랜잭션당 한 번)
+QuerySet.update() 처럼 시그널이 발생하지 않는 set-based 변경은
+호출하는 쪽에서 VehicleListingService 를 직접 호출해야 한다.
+(모델별 차량 수는 VehicleListingService 가 공개 여부 변화에 맞춰 함께 증감)
+"""
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.vehicles.models import (
+    Brand, CarType, Model, Vehicle, VehicleImage, VehicleListing, ModelVehicleCount
+)
+from apps.vehicles.services import VehicleListingService, VehicleCountService
+from apps.vehicles.cache import FilterTreeCache
+from apps.vehicles.catalog import invalidate_catalog
+from apps.auctions.models import Auction
+
+
+@receiver(post_save, sender=Auction)
+def sync_listing_on_auction_save(sender, instance, created, raw=False, **kwargs):
+    # 새로 생성된 승인대기 경매는 목록에 노출되지 않음
+    if raw or (created and instance.status == Auction.Status.PENDING):
+        return
+    VehicleListingService().sync_vehicles([instance.vehicle_id])
+
+
+@receiver(post_delete, sender=Auction)
+def sync_listing_on_auction_delete(sender, instance, **kwargs):
+    VehicleListingService().sync_vehicles([instance.vehicle_id])
+
+
+@receiver(post_save, sender=Vehicle)
+def sync_listing_on_vehicle_save(sender, instance, created, raw=False, **kwargs):
+    # 새 차량은 아직 경매가 없으므로 목록에 노출되지 않음
+    if raw or created:
+        return
+    VehicleListingService().sync_vehicles([instance.id])
+
+
+@receiver(post_save, sender=VehicleImage)
+def sync_listing_on_image_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    # 대표 이미지가 저장/지정되었고 목록에 노출 중인 차량의 썸네일이 다를 때만 갱신
+    # (승인대기 차량 등록 시 이미지 저장, 일반 이미지 저장은 UPDATE 없음)
+    if raw or not instance.is_primary:
+        return
+    if update_fields is not None and not {'image', 'is_primary'} & set(update_fields):
+        return
+    listing = VehicleListing.objects.filter(vehicle_id=instance.vehicle_id).exclude(
+        thumbnail=instance.image.name
+    )
+    if listing.exists():
+        listing.update(thumbnail=instance.image.name)
+
+
+@receiver(post_delete, sender=VehicleImage)
+def sync_listing_on_image_delete(sender, instance, **kwargs):
+    if not instance.is_primary:
+        return
+    VehicleListing.objects.filter(vehicle_id=instance.vehicle_id).update(thumbnail='')
+
+
+@receiver(post_save, sender=Brand)
+def sync_listing_on_brand_save(sender, instance, created, raw=False, **kwargs):
+    if raw or created:
+        return
+    VehicleListing.objects.filter(brand_id=instance.id).update(brand_name=instance.name)
+
+
+@receiver(post_save, sender=CarType)
+def sync_listing_on_car_type_save(sender, instance, created, raw=False, **kwargs):
+    if raw or created:
+        return
+    ModelVehicleCount.objects.filter(car_type_id=instance.id).update(brand_id=instance.brand_id)
+    VehicleListing.objects.filter(car_type_id=instance.id).update(
+        car_type_name=instance.name,
+        brand_id=instance.brand_id,
+        brand_name=instance.brand.name
+    )
+    VehicleListingService().publish_changes(
+        VehicleListing.objects.filter(car_type_id=instance.id).values_list('vehicle_id', flat=True)
+    )
+
+
+@receiver(post_save, sender=Model)
+def sync_listing_on_model_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        VehicleCountService().ensure_rows([instance.id])
+        return
+
+    car_type = instance.car_type
+    ModelVehicleCount.objects.filter(model_id=instance.id).update(
+        car_type_id=car_type.id,
+        brand_id=car_type.brand_id
+    )
+    VehicleListing.objects.filter(model_id=instance.id).update(
+        model_name=instance.name,
+        car_type_id=car_type.id,
+        car_type_name=car_type.name,
+        brand_id=car_type.brand_id,
+        brand_name=car_type.brand.name
+    )
+    VehicleListingService().publish_changes(
+        VehicleListing.objects.filter(model_id=instance.id).values_list('vehicle_id', flat=True)
+    )
+
+
+@receiver(post_save, sender=Brand)
+@receiver(post_save, sender=CarType)
+@receiver(post_save, sender=Model)
+@receiver(post_delete, sender=Brand)
+@receiver(post_delete, sender=CarType)
+@receiver(post_delete, sender=Model)
+def invalidate_on_taxonomy_change(sender, raw=False, **kwargs):
+    # 브랜드/차종/모델 임포트, 수정 시 분류 카탈로그와 필터 트리 캐시 무효화
+    if raw:
+        return
+    TaxonomyInvalidation.schedule()
+
+
+class TaxonomyInvalidation:
+    """
+    커밋 후 분류 카탈로그와 필터 트리 캐시 버전 올리기
+
+    임포트처럼 한 트랜잭션에서 여러 건을 저장해도 아직 실행되지 않은 등록이 있으면
+    다시 등록하지 않아 커밋 후 한 번만 올린다. (롤백되면 등록도 함께 사라짐)
+    """
+
+    def __init__(self):
+        self.done = False
+
+    def __call__(self) -> None:
+        self.done = True
+        invalidate_catalog()
+        FilterTreeCache().invalidate()
+
+    @classmethod
+    def schedule(cls) -> None:
+        pending = transaction.get_connection().run_on_commit
+        if any(isinstance(func, cls) and not func.done for _, func, _ in pending):
+            return
+        transaction.on_commit(cls())
@@ -12,6 +12,7 @@ import io
 import json
 
 from apps.vehicles.models import Brand, CarType, Model, Vehicle, VehicleImage
+from apps.vehicles.catalog import get_catalog
 from apps.auctions.models import Auction
 
 User = get_user_model()
@@ -240,9 +241,10 @@ class TestVehicleDetailAPI(TestCase):
         # JWT 토큰 발급
         self.client.force_authenticate(user=self.user)
 
-        brand = Brand.objects.create(name="기아")
-        car_type = CarType.objects.create(brand=brand, name="세단")
-        model = Model.objects.create(car_type=car_type, name="K8")
+        with self.captureOnCommitCallbacks(execute=True):
+            brand = Brand.objects.create(name="기아")
+            car_type = CarType.objects.create(brand=brand, name="세단")
+            model = Model.objects.create(car_type=car_type, name="K8")
 
         self.public_vehicle = Vehicle.objects.create(
             model=model,
@@ -374,20 +376,21 @@ class TestVehicleFilterAPI(TestCase):
 
     def _create_test_data(self):
         # 브랜드
-        self.hyundai = Brand.objects.create(name="현대")
-        self.kia = Brand.objects.create(name="기아")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.hyundai = Brand.objects.create(name="현대")
+            self.kia = Brand.objects.create(name="기아")
 
-        # 현대 차종
-        self.hyundai_suv = CarType.objects.create(brand=self.hyundai, name="SUV")
-        self.hyundai_sedan = CarType.objects.create(brand=self.hyundai, name="세단")
+            # 현대 차종
+            self.hyundai_suv = CarType.objects.create(brand=self.hyundai, name="SUV")
+            self.hyundai_sedan = CarType.objects.create(brand=self.hyundai, name="세단")
 
-        # 기아 차종
-        self.kia_suv = CarType.objects.create(brand=self.kia, name="SUV")
+            # 기아 차종
+            self.kia_suv = CarType.objects.create(brand=self.kia, name="SUV")
 
-        # 모델
-        self.palisade = Model.objects.create(car_type=self.hyundai_suv, name="팰리세이드")
-        self.sonata = Model.objects.create(car_type=self.hyundai_sedan, name="소나타")
-        self.sorento = Model.objects.create(car_type=self.kia_suv, name="쏘렌토")
+            # 모델
+            self.palisade = Model.objects.create(car_type=self.hyundai_suv, name="팰리세이드")
+            self.sonata = Model.objects.create(car_type=self.hyundai_sedan, name="소나타")
+            self.sorento = Model.objects.create(car_type=self.kia_suv, name="쏘렌토")
 
         self._create_vehicles()
 
@@ -545,3 +548,203 @@ class TestVehicleFilterAPI(TestCase):
 
         for brand in brands:
             self.assertEqual(brand['count'], 0)
+
+
+class TestVehicleFilterCacheAPI(TestCase):
+    """필터 트리 캐시 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+        self.user = User.objects.create_user(
+            username='testuser_filter_cache',
+            password='testpass123'
+        )
+        self.admin = User.objects.create_superuser(
+            username='admin_filter_cache',
+            password='adminpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.brand = Brand.objects.create(name="현대")
+            self.car_type = CarType.objects.create(brand=self.brand, name="SUV")
+            self.model = Model.objects.create(car_type=self.car_type, name="팰리세이드")
+
+        self.vehicle = Vehicle.objects.create(
+            model=self.model,
+            year=2023,
+            first_registration_date=timezone.now().date(),
+            color='검정',
+            fuel_type=Vehicle.FuelType.GASOLINE,
+            transmission=Vehicle.Transmission.AUTO,
+            mileage=5000,
+            region='서울'
+        )
+        self.auction = Auction.objects.create(vehicle=self.vehicle, status=Auction.Status.PENDING)
+
+    def _brand_count(self, response):
+        return json.loads(response.content)['brands'][0]['count']
+
+    def test_cache_hit_skips_database(self):
+        self.client.get(reverse('vehicle-filters'))
+
+        # 인증(force_authenticate)은 쿼리가 없으므로 캐시 적중 시 쿼리 0회
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('vehicle-filters'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(self._brand_count(response), 0)
+
+    def test_approve_invalidates_cache(self):
+        from apps.auctions.services import AuctionService
+
+        response = self.client.get(reverse('vehicle-filters'))
+        self.assertEqual(self._brand_count(response), 0)
+
+        AuctionService().approve_auction(self.vehicle.id, self.admin)
+
+        response = self.client.get(reverse('vehicle-filters'))
+        self.assertEqual(self._brand_count(response), 1)
+
+    def test_taxonomy_change_invalidates_cache(self):
+        self.client.get(reverse('vehicle-filters'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Brand.objects.create(name="기아")
+
+        response = self.client.get(reverse('vehicle-filters'))
+        names = [brand['name'] for brand in json.loads(response.content)['brands']]
+        self.assertEqual(names, ["현대", "기아"])
+
+    def test_serves_stale_copy_while_rebuilding(self):
+        from apps.vehicles.cache import FilterTreeCache
+
+        tree_cache = FilterTreeCache()
+        self.client.get(reverse('vehicle-filters'))
+
+        # 버전이 바뀐 뒤 다른 워커가 재생성 락을 잡고 있는 상황
+        tree_cache.invalidate()
+        cache.add(tree_cache.LOCK_KEY.format(version=tree_cache.get_version()), 1)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('vehicle-filters'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._brand_count(response), 0)
+
+
+class TestVehicleFilterLevelAPI(TestCase):
+    """필터 트리 단계별 조회 API 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser_filter_level',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.hyundai = Brand.objects.create(name="현대")
+            self.kia = Brand.objects.create(name="기아")
+            self.hyundai_suv = CarType.objects.create(brand=self.hyundai, name="SUV")
+            self.hyundai_sedan = CarType.objects.create(brand=self.hyundai, name="세단")
+            self.kia_suv = CarType.objects.create(brand=self.kia, name="SUV")
+            self.palisade = Model.objects.create(car_type=self.hyundai_suv, name="팰리세이드")
+            self.tucson = Model.objects.create(car_type=self.hyundai_suv, name="투싼")
+            self.sonata = Model.objects.create(car_type=self.hyundai_sedan, name="소나타")
+            self.sorento = Model.objects.create(car_type=self.kia_suv, name="쏘렌토")
+
+        # 팰리세이드 2대 공개, 소나타 1대 승인대기, 기아는 차량 없음
+        self._create_vehicle(self.palisade, Auction.Status.AUCTION_ACTIVE)
+        self._create_vehicle(self.palisade, Auction.Status.TRANSACTION_COMPLETE)
+        self._create_vehicle(self.sonata, Auction.Status.PENDING)
+
+    def _create_vehicle(self, model, auction_status):
+        vehicle = Vehicle.objects.create(
+            model=model,
+            year=2023,
+            first_registration_date=timezone.now().date(),
+            color='검정',
+            fuel_type=Vehicle.FuelType.GASOLINE,
+            transmission=Vehicle.Transmission.AUTO,
+            mileage=5000,
+            region='서울'
+        )
+        Auction.objects.create(vehicle=vehicle, status=auction_status)
+        return vehicle
+
+    def test_brands_without_children(self):
+        response = self.client.get(reverse('vehicle-filter-brands'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['brands'], [
+            {'id': self.hyundai.id, 'name': '현대', 'count': 2},
+            {'id': self.kia.id, 'name': '기아', 'count': 0},
+        ])
+
+    def test_brands_min_count(self):
+        response = self.client.get(reverse('vehicle-filter-brands'), {'min_count': 1})
+
+        self.assertEqual([b['id'] for b in response.data['brands']], [self.hyundai.id])
+
+    def test_car_types_for_brand(self):
+        url = reverse('vehicle-filter-car-types', args=[self.hyundai.id])
+        get_catalog()
+
+        with self.assertNumQueries(1):  # 차종별 합계 (이름은 분류 카탈로그)
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['id'], self.hyundai.id)
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(response.data['car_types'], [
+            {'id': self.hyundai_suv.id, 'name': 'SUV', 'count': 2},
+            {'id': self.hyundai_sedan.id, 'name': '세단', 'count': 0},
+        ])
+
+        response = self.client.get(url, {'min_count': 1})
+        self.assertEqual([ct['id'] for ct in response.data['car_types']], [self.hyundai_suv.id])
+
+    def test_models_for_car_type(self):
+        url = reverse('vehicle-filter-models', args=[self.hyundai_suv.id])
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(response.data['models'], [
+            {'id': self.palisade.id, 'name': '팰리세이드', 'count': 2},
+            {'id': self.tucson.id, 'name': '투싼', 'count': 0},
+        ])
+
+        response = self.client.get(url, {'min_count': 1})
+        self.assertEqual([m['id'] for m in response.data['models']], [self.palisade.id])
+
+    def test_levels_match_full_tree(self):
+        full_tree = self.client.get(reverse('vehicle-filters')).data
+
+        for brand in full_tree['brands']:
+            brand_level = self.client.get(reverse('vehicle-filter-car-types', args=[brand['id']])).data
+            self.assertEqual(brand_level['count'], brand['count'])
+            for car_type, car_type_node in zip(brand['car_types'], brand_level['car_types']):
+                self.assertEqual(car_type_node['count'], car_type['count'])
+                models = self.client.get(
+                    reverse('vehicle-filter-models', args=[car_type['id']])
+                ).data['models']
+                self.assertEqual(models, car_type['models'])
+
+    def test_unknown_parent_returns_404(self):
+        response = self.client.get(reverse('vehicle-filter-car-types', args=[99999]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.get(reverse('vehicle-filter-models', args=[99999]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalid_min_count(self):
+        for value in ['abc', '-1']:
+            response = self.client.get(reverse('vehicle-filter-brands'), {'min_count': value})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
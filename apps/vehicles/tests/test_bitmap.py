@@ -0,0 +1,221 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from django.core.cache import cache
+from datetime import timedelta
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from apps.vehicles import bitmap
+from apps.vehicles.bitmap import Bitmap, VehicleBitmapIndex, ARRAY_MAX
+from apps.vehicles.models import Brand, CarType, Model, Vehicle, VehicleListing
+from apps.vehicles.services import FilterService, VehicleCountService
+from apps.auctions.models import Auction
+from apps.auctions.services import AuctionService
+
+User = get_user_model()
+
+
+class TestBitmap(TestCase):
+    """압축 비트맵 테스트"""
+
+    def test_sparse_and_dense_chunks(self):
+        sparse = Bitmap()
+        dense = Bitmap()
+        for value in range(0, 200000, 37):
+            sparse.add(value)
+        for value in range(0, ARRAY_MAX * 3):
+            dense.add(value)
+
+        self.assertIsInstance(dense.chunks[0], bytearray)
+        self.assertIsInstance(sparse.chunks[0], set)
+        self.assertEqual(len(sparse), len(range(0, 200000, 37)))
+        self.assertEqual(len(dense), ARRAY_MAX * 3)
+
+        both = sparse & dense
+        self.assertEqual(len(both), len(range(0, ARRAY_MAX * 3, 37)))
+        self.assertIn(37, both)
+        self.assertNotIn(38, both)
+
+        either = sparse | dense
+        self.assertEqual(len(either), len(set(range(0, 200000, 37)) | set(range(ARRAY_MAX * 3))))
+
+    def test_discard(self):
+        values = Bitmap()
+        for value in [1, 70000, 70001]:
+            values.add(value)
+
+        values.discard(70000)
+        values.discard(70001)
+        values.discard(99)
+
+        self.assertEqual(len(values), 1)
+        self.assertEqual(list(values.chunks), [0])
+
+
+@override_settings(VEHICLE_BITMAP_INDEX_ENABLED=True)
+class TestVehicleBitmapIndex(TestCase):
+    """공개 차량 비트맵 인덱스 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        bitmap.get_index().reset()
+
+        self.admin = User.objects.create_superuser(username='admin_bitmap', password='adminpass123')
+        self.user = User.objects.create_user(username='user_bitmap', password='testpass123')
+
+        self.hyundai = Brand.objects.create(name='현대')
+        self.kia = Brand.objects.create(name='기아')
+        self.sedan = CarType.objects.create(brand=self.hyundai, name='세단')
+        self.kia_suv = CarType.objects.create(brand=self.kia, name='SUV')
+        self.sonata = Model.objects.create(car_type=self.sedan, name='소나타')
+        self.grandeur = Model.objects.create(car_type=self.sedan, name='그랜저')
+        self.sorento = Model.objects.create(car_type=self.kia_suv, name='쏘렌토')
+
+        now = timezone.now()
+        self.vehicles = [
+            self._create_vehicle(self.sonata, Vehicle.FuelType.GASOLINE, '서울', now - timedelta(hours=3)),
+            self._create_vehicle(self.sonata, Vehicle.FuelType.HYBRID, '부산', now - timedelta(hours=2)),
+            self._create_vehicle(self.grandeur, Vehicle.FuelType.GASOLINE, '서울', now - timedelta(hours=1)),
+            self._create_vehicle(self.sorento, Vehicle.FuelType.DIESEL, '서울', None),
+        ]
+        self.pending = self._create_vehicle(self.sonata, Vehicle.FuelType.GASOLINE, '서울', None,
+                                            Auction.Status.PENDING)
+
+    def _create_vehicle(self, model, fuel_type, region, start_time, auction_status=Auction.Status.AUCTION_ACTIVE):
+        vehicle = Vehicle.objects.create(
+            model=model,
+            year=2022,
+            first_registration_date=timezone.now().date(),
+            color='검정',
+            fuel_type=fuel_type,
+            transmission=Vehicle.Transmission.AUTO,
+            mileage=10000,
+            region=region
+        )
+        Auction.objects.create(
+            vehicle=vehicle,
+            status=auction_status,
+            start_time=start_time,
+            end_time=start_time + timedelta(days=1) if start_time else None
+        )
+        return vehicle
+
+    def test_filter_and_counts_match_listings(self):
+        index = bitmap.get_index()
+
+        self.assertEqual(len(index.visible), VehicleListing.objects.count())
+        self.assertEqual(len(index.filter(brand_id=self.hyundai.id)), 3)
+        self.assertEqual(len(index.filter(brand_id=self.hyundai.id, region='서울')), 2)
+        self.assertEqual(len(index.filter(model_id=self.sorento.id, region='부산')), 0)
+        self.assertEqual(index.counts('model_id'), VehicleCountService().count_from_source())
+        self.assertEqual(
+            index.counts('fuel_type', within=index.filter(brand_id=self.hyundai.id)),
+            {'gasoline': 2, 'hybrid': 1}
+        )
+
+    def test_page_ids_follow_listing_order(self):
+        index = bitmap.get_index()
+        expected = list(
+            VehicleListing.objects.order_by('-start_time', '-vehicle_id').values_list('vehicle_id', flat=True)
+        )
+
+        self.assertEqual(index.page_ids(index.visible, 0, 10), expected)
+        self.assertEqual(index.page_ids(index.visible, 1, 3), expected[1:3])
+        self.assertEqual(index.page_ids(index.visible, 0, 10, descending=False), expected[::-1])
+
+        hyundai = index.filter(brand_id=self.hyundai.id)
+        self.assertEqual(
+            index.page_ids(hyundai, 1, 10),
+            [vehicle_id for vehicle_id in expected if vehicle_id in hyundai][1:]
+        )
+
+    def test_filter_result_is_not_changed_by_refresh(self):
+        index = bitmap.get_index()
+        everything = index.filter()
+        sonata = index.filter(model_id=self.sonata.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            AuctionService().approve_auction(self.pending.id, self.admin)
+        index = bitmap.get_index()
+
+        self.assertNotIn(self.pending.id, everything)
+        self.assertNotIn(self.pending.id, sonata)
+        self.assertEqual(len(sonata), 2)
+        self.assertIn(self.pending.id, index.filter(model_id=self.sonata.id))
+
+    def test_page_ids_with_large_vehicle_ids(self):
+        index = VehicleBitmapIndex()
+        now = timezone.now()
+        values = ('brand', 'car_type', 'model', 'gasoline', 'auto', '서울', 2022, 'auction_active')
+        for vehicle_id, start_time in ((2 ** 32 + 1, now), (5, now), (2 ** 40, now - timedelta(hours=1))):
+            index._add((vehicle_id, start_time, *values))
+
+        self.assertEqual(index.page_ids(index.visible, 0, 3), [2 ** 32 + 1, 5, 2 ** 40])
+        self.assertEqual(index.page_ids(index.filter(region='서울'), 0, 3), [2 ** 32 + 1, 5, 2 ** 40])
+
+    def test_incremental_refresh_after_approval(self):
+        index = bitmap.get_index()
+        applied_seq = index.applied_seq
+
+        with self.captureOnCommitCallbacks(execute=True):
+            AuctionService().approve_auction(self.pending.id, self.admin)
+
+        with self.assertNumQueries(1):
+            index = bitmap.get_index()
+
+        # 커밋 후 변경당 순번 하나
+        self.assertEqual(index.applied_seq, applied_seq + 1)
+        self.assertIn(self.pending.id, index.visible)
+        self.assertEqual(index.counts('model_id')[self.sonata.id], 3)
+        self.assertEqual(index.page_ids(index.visible, 0, 1), [self.pending.id])
+
+    def test_rebuild_when_change_log_missing(self):
+        index = bitmap.get_index()
+        with self.captureOnCommitCallbacks(execute=True):
+            AuctionService().approve_auction(self.pending.id, self.admin)
+
+        # 순번별 변경 목록이 만료된 경우, 요청에서는 재생성하지 않고 이전 상태로 응답
+        cache.delete(VehicleBitmapIndex.CHANGES_KEY.format(seq=cache.get(VehicleBitmapIndex.SEQ_KEY)))
+        with mock.patch.object(VehicleBitmapIndex, '_rebuild_in_background') as rebuild_in_background:
+            with self.assertNumQueries(0):
+                index = bitmap.get_index()
+
+        rebuild_in_background.assert_called_once()
+        self.assertNotIn(self.pending.id, index.visible)
+
+        index.rebuild()
+        self.assertIn(self.pending.id, index.visible)
+        self.assertEqual(len(index.visible), VehicleListing.objects.count())
+
+    def test_list_view_uses_bitmap(self):
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        bitmap.get_index()
+
+        # 페이지 행 조회 1회 (COUNT, 패싯 쿼리 없음)
+        with self.assertNumQueries(1):
+            response = client.get('/api/vehicles/', {
+                'brand': self.hyundai.id,
+                'page_size': 2,
+                'facets': 'region'
+            })
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(
+            [vehicle['id'] for vehicle in response.data['results']],
+            [self.vehicles[2].id, self.vehicles[1].id]
+        )
+        self.assertEqual(response.data['facets']['region'], [
+            {'value': '부산', 'label': '부산', 'count': 1},
+            {'value': '서울', 'label': '서울', 'count': 2},
+        ])
+
+    def test_filter_tree_counts_from_bitmap(self):
+        tree = FilterService().get_filter_tree()
+
+        counts = {brand['id']: brand['count'] for brand in tree['brands']}
+        self.assertEqual(counts, {self.hyundai.id: 3, self.kia.id: 1})
@@ -0,0 +1,146 @@
+from unittest import mock
+
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection, transaction
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from datetime import date
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from apps.vehicles.catalog import TaxonomyCatalog, get_catalog
+from apps.vehicles.dto import VehicleCreateDTO
+from apps.vehicles.models import Brand, CarType, Model, Vehicle
+from apps.vehicles.services import VehicleService
+from apps.vehicles.signals import TaxonomyInvalidation
+from apps.auctions.models import Auction
+
+User = get_user_model()
+
+
+class TestTaxonomyCatalog(TestCase):
+    """분류 카탈로그 테스트"""
+
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.hyundai = Brand.objects.create(name="현대")
+            self.suv = CarType.objects.create(brand=self.hyundai, name="SUV")
+            self.sedan = CarType.objects.create(brand=self.hyundai, name="세단")
+            self.palisade = Model.objects.create(car_type=self.suv, name="팰리세이드")
+            self.sonata = Model.objects.create(car_type=self.sedan, name="소나타")
+
+    def _dto(self, model_id):
+        return VehicleCreateDTO(
+            model_id=model_id,
+            year=2023,
+            first_registration_date=date(2023, 6, 15),
+            color='검정',
+            fuel_type='diesel',
+            transmission='manual',
+            mileage=5000,
+            region='부산',
+            images=[]
+        )
+
+    def test_loaded_once_per_version(self):
+        with self.assertNumQueries(3):
+            catalog = get_catalog()
+        with self.assertNumQueries(0):
+            self.assertIs(get_catalog(), catalog)
+
+        brand, car_type, model = catalog.model_path(self.palisade.id)
+        self.assertEqual((brand.name, car_type.name, model.name), ("현대", "SUV", "팰리세이드"))
+        self.assertEqual(catalog.car_type_ids_by_brand[self.hyundai.id], (self.suv.id, self.sedan.id))
+        self.assertIsNone(catalog.model_path(9999))
+
+    def test_read_only(self):
+        catalog = get_catalog()
+
+        with self.assertRaises(TypeError):
+            catalog.models[9999] = catalog.models[self.sonata.id]
+        with self.assertRaises(AttributeError):
+            catalog.extra = 1
+
+    def test_reload_on_taxonomy_change(self):
+        catalog = get_catalog()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tucson = Model.objects.create(car_type=self.suv, name="투싼")
+            # 커밋 전에는 이전 카탈로그 유지
+            self.assertIs(get_catalog(), catalog)
+
+        self.assertFalse(catalog.has_model(tucson.id))
+        self.assertTrue(get_catalog().has_model(tucson.id))
+
+    def test_invalidated_once_per_transaction(self):
+        with mock.patch('apps.vehicles.signals.invalidate_catalog') as invalidate:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                kia = Brand.objects.create(name="기아")
+                suv = CarType.objects.create(brand=kia, name="SUV")
+                Model.objects.create(car_type=suv, name="쏘렌토")
+                Model.objects.create(car_type=suv, name="스포티지")
+                self.sonata.delete()
+
+        self.assertEqual(sum(isinstance(callback, TaxonomyInvalidation) for callback in callbacks), 1)
+        invalidate.assert_called_once_with()
+
+    def test_not_invalidated_on_rollback(self):
+        with mock.patch('apps.vehicles.signals.invalidate_catalog') as invalidate:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                try:
+                    with transaction.atomic():
+                        Brand.objects.create(name="기아")
+                        raise RuntimeError
+                except RuntimeError:
+                    pass
+                Brand.objects.create(name="제네시스")
+
+        self.assertEqual(sum(isinstance(callback, TaxonomyInvalidation) for callback in callbacks), 1)
+        invalidate.assert_called_once_with()
+
+    def test_reload_when_other_process_bumps_version(self):
+        catalog = get_catalog()
+
+        # 다른 프로세스에서 임포트 후 버전을 올린 상황
+        cache.incr(TaxonomyCatalog.VERSION_KEY)
+
+        self.assertIsNot(get_catalog(), catalog)
+
+    def test_create_vehicle_validates_model_from_catalog(self):
+        get_catalog()
+
+        with CaptureQueriesContext(connection) as queries:
+            with self.assertRaises(Model.DoesNotExist):
+                VehicleService().create_vehicle(self._dto(9999))
+            VehicleService().create_vehicle(self._dto(self.sonata.id))
+
+        self.assertFalse(any('"models"' in query['sql'] for query in queries.captured_queries))
+        self.assertEqual(Vehicle.objects.get().model_id, self.sonata.id)
+
+    def test_detail_names_from_catalog(self):
+        user = User.objects.create_user(username='testuser_catalog', password='testpass123')
+        client = APIClient()
+        client.force_authenticate(user=user)
+        vehicle = Vehicle.objects.create(
+            model=self.palisade,
+            year=2023,
+            first_registration_date=date(2023, 6, 15),
+            color='검정',
+            fuel_type=Vehicle.FuelType.GASOLINE,
+            transmission=Vehicle.Transmission.AUTO,
+            mileage=5000,
+            region='서울'
+        )
+        Auction.objects.create(vehicle=vehicle, status=Auction.Status.AUCTION_ENDED)
+        get_catalog()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(f'/api/vehicles/{vehicle.id}/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['brand'], {'id': self.hyundai.id, 'name': "현대"})
+        self.assertEqual(response.data['car_type'], {'id': self.suv.id, 'name': "SUV"})
+        self.assertEqual(response.data['model'], {'id': self.palisade.id, 'name': "팰리세이드"})
+        for table in ('"brands"', '"car_types"', '"models"'):
+            self.assertFalse(any(table in query['sql'] for query in queries.captured_queries))
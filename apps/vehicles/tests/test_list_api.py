@@ -4,15 +4,18 @@ Phase 7: 차량 목록 API 테스트
 - 정렬 (최근순/오래된순)
 - 페이지네이션
 - 남은 시간 계산
+- 패싯 카운트
 """
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from rest_framework.test import APIClient
 from rest_framework import status
 from datetime import timedelta
 
-from apps.vehicles.models import Brand, CarType, Model, Vehicle, VehicleImage
+from apps.vehicles.models import Brand, CarType, Model, Vehicle, VehicleImage, VehicleListing
 from apps.auctions.models import Auction
 
 User = get_user_model()
@@ -505,3 +508,312 @@ class VehicleRemainingTimeTestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         vehicle_data = response.data['results'][0]
         self.assertEqual(vehicle_data['remaining_seconds'], 0)
+
+
+class VehicleCursorPaginationTestCase(TestCase):
+    """차량 커서 페이지네이션 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+        self.brand = Brand.objects.create(name='현대')
+        self.car_type = CarType.objects.create(brand=self.brand, name='세단')
+        self.model = Model.objects.create(car_type=self.car_type, name='소나타')
+
+        # 같은 경매시작시간을 가진 차량을 섞어 tie-break(차량 ID) 검증
+        now = timezone.now()
+        self.vehicles = []
+        for i in range(7):
+            vehicle = Vehicle.objects.create(
+                year=2020,
+                first_registration_date=timezone.now().date(),
+                model=self.model,
+                color='화이트',
+                fuel_type=Vehicle.FuelType.GASOLINE,
+                transmission=Vehicle.Transmission.AUTO,
+                mileage=10000,
+                region='서울'
+            )
+            Auction.objects.create(
+                vehicle=vehicle,
+                status=Auction.Status.AUCTION_ACTIVE,
+                start_time=now - timedelta(hours=i // 2),
+                end_time=now + timedelta(hours=48 - i // 2)
+            )
+            self.vehicles.append(vehicle)
+
+    def _collect_ids(self, params):
+        ids = []
+        response = self.client.get('/api/vehicles/', params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(v['id'] for v in response.data['results'])
+            if not response.data['next']:
+                return ids, response
+            response = self.client.get(response.data['next'])
+
+    def test_cursor_pagination_has_no_count(self):
+        response = self.client.get('/api/vehicles/', {'pagination': 'cursor', 'page_size': 3})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('count', response.data)
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertIsNotNone(response.data['next'])
+        self.assertIsNone(response.data['previous'])
+
+    def test_cursor_pagination_desc_walks_all_vehicles(self):
+        ids, _ = self._collect_ids({'pagination': 'cursor', 'page_size': 3})
+
+        expected = sorted(
+            self.vehicles,
+            key=lambda v: (v.auction.start_time, v.id),
+            reverse=True
+        )
+        self.assertEqual(ids, [v.id for v in expected])
+
+    def test_cursor_pagination_asc_walks_all_vehicles(self):
+        ids, _ = self._collect_ids({
+            'pagination': 'cursor',
+            'page_size': 2,
+            'sort': 'auction__start_time'
+        })
+
+        expected = sorted(self.vehicles, key=lambda v: (v.auction.start_time, v.id))
+        self.assertEqual(ids, [v.id for v in expected])
+
+    def test_cursor_pagination_previous_link(self):
+        first = self.client.get('/api/vehicles/', {'pagination': 'cursor', 'page_size': 3})
+        second = self.client.get(first.data['next'])
+        back = self.client.get(second.data['previous'])
+
+        self.assertEqual(back.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [v['id'] for v in back.data['results']],
+            [v['id'] for v in first.data['results']]
+        )
+        self.assertIsNone(back.data['previous'])
+
+    def test_cursor_pagination_includes_vehicles_without_start_time(self):
+        vehicle = Vehicle.objects.create(
+            year=2020,
+            first_registration_date=timezone.now().date(),
+            model=self.model,
+            color='블랙',
+            fuel_type=Vehicle.FuelType.GASOLINE,
+            transmission=Vehicle.Transmission.AUTO,
+            mileage=10000,
+            region='서울'
+        )
+        Auction.objects.create(vehicle=vehicle, status=Auction.Status.TRANSACTION_COMPLETE)
+
+        desc_ids, _ = self._collect_ids({'pagination': 'cursor', 'page_size': 3})
+        asc_ids, _ = self._collect_ids({
+            'pagination': 'cursor',
+            'page_size': 3,
+            'sort': 'auction__start_time'
+        })
+
+        self.assertEqual(len(desc_ids), 8)
+        self.assertEqual(desc_ids[-1], vehicle.id)
+        self.assertEqual(asc_ids[0], vehicle.id)
+
+    def test_invalid_cursor(self):
+        response = self.client.get('/api/vehicles/', {'cursor': 'not-a-cursor'})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class VehicleListQueryCountTestCase(TestCase):
+    """차량 목록 쿼리 수 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+        self.brand = Brand.objects.create(name='현대')
+        self.car_type = CarType.objects.create(brand=self.brand, name='세단')
+        self.model = Model.objects.create(car_type=self.car_type, name='소나타')
+
+    def _create_vehicles(self, count):
+        for i in range(count):
+            vehicle = Vehicle.objects.create(
+                year=2020,
+                first_registration_date=timezone.now().date(),
+                model=self.model,
+                color='화이트',
+                fuel_type=Vehicle.FuelType.GASOLINE,
+                transmission=Vehicle.Transmission.AUTO,
+                mileage=10000,
+                region='서울'
+            )
+            Auction.objects.create(
+                vehicle=vehicle,
+                status=Auction.Status.AUCTION_ACTIVE,
+                start_time=timezone.now() - timedelta(hours=i),
+                end_time=timezone.now() + timedelta(hours=48 - i)
+            )
+            for index in range(3):
+                VehicleImage.objects.create(
+                    vehicle=vehicle,
+                    image=f'vehicle_images/vehicle_{vehicle.id}_{index}.jpg',
+                    is_primary=(index == 0)
+                )
+
+    def test_thumbnail_uses_primary_image(self):
+        self._create_vehicles(1)
+
+        response = self.client.get('/api/vehicles/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['results'][0]['thumbnail_image'].endswith('_0.jpg'))
+
+    def test_image_save_updates_listing_only_for_new_primary(self):
+        self._create_vehicles(1)
+        vehicle = Vehicle.objects.get()
+        primary, other = VehicleImage.objects.filter(vehicle=vehicle)[:2]
+
+        with CaptureQueriesContext(connection) as queries:
+            other.save()
+            primary.save()
+            VehicleImage.objects.create(vehicle=vehicle, image='vehicle_images/extra.jpg')
+        self.assertFalse(any('UPDATE "vehicle_listings"' in query['sql'] for query in queries.captured_queries))
+
+        other.is_primary = True
+        other.save(update_fields=['is_primary'])
+        self.assertTrue(VehicleListing.objects.get(vehicle=vehicle).thumbnail.name.endswith('_1.jpg'))
+
+    def test_image_save_without_listing_skips_update(self):
+        vehicle = Vehicle.objects.create(
+            year=2020,
+            first_registration_date=timezone.now().date(),
+            model=self.model,
+            color='화이트',
+            fuel_type=Vehicle.FuelType.GASOLINE,
+            transmission=Vehicle.Transmission.AUTO,
+            mileage=10000,
+            region='서울'
+        )
+        Auction.objects.create(vehicle=vehicle, status=Auction.Status.PENDING)
+
+        with CaptureQueriesContext(connection) as queries:
+            VehicleImage.objects.create(vehicle=vehicle, image='vehicle_images/pending.jpg', is_primary=True)
+
+        self.assertFalse(any('UPDATE "vehicle_listings"' in query['sql'] for query in queries.captured_queries))
+
+    def test_query_count_does_not_grow_with_page_size(self):
+        self._create_vehicles(2)
+        with self.assertNumQueries(2):  # count + 목록 (vehicle_listings 단일 테이블)
+            self.client.get('/api/vehicles/')
+
+        self._create_vehicles(8)
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/vehicles/')
+
+        self.assertEqual(len(response.data['results']), 10)
+
+    def test_list_query_has_no_join(self):
+        self._create_vehicles(3)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/api/vehicles/')
+            self.client.get('/api/vehicles/', {'sort': 'unknown'})
+            VehicleListing.objects.in_bulk([1, 2, 3])
+
+        for query in queries.captured_queries:
+            self.assertNotIn('JOIN', query['sql'].upper())
+
+
+class VehicleFacetTestCase(TestCase):
+    """패싯 카운트 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+        self.brand_hyundai = Brand.objects.create(name='현대')
+        self.brand_kia = Brand.objects.create(name='기아')
+        car_type_hyundai = CarType.objects.create(brand=self.brand_hyundai, name='세단')
+        car_type_kia = CarType.objects.create(brand=self.brand_kia, name='세단')
+        self.model_sonata = Model.objects.create(car_type=car_type_hyundai, name='소나타')
+        self.model_k5 = Model.objects.create(car_type=car_type_kia, name='K5')
+
+        self._create_vehicle(self.model_sonata, 2021, Vehicle.FuelType.GASOLINE, '서울')
+        self._create_vehicle(self.model_sonata, 2024, Vehicle.FuelType.HYBRID, '서울')
+        self._create_vehicle(self.model_sonata, 2019, Vehicle.FuelType.GASOLINE, '부산')
+        self._create_vehicle(self.model_sonata, 2020, Vehicle.FuelType.GASOLINE, '부산', Auction.Status.PENDING)
+        self._create_vehicle(self.model_k5, 2022, Vehicle.FuelType.DIESEL, '대구')
+
+    def _create_vehicle(self, model, year, fuel_type, region, auction_status=Auction.Status.AUCTION_ACTIVE):
+        vehicle = Vehicle.objects.create(
+            model=model,
+            year=year,
+            first_registration_date=timezone.now().date(),
+            color='화이트',
+            fuel_type=fuel_type,
+            transmission=Vehicle.Transmission.AUTO,
+            mileage=10000,
+            region=region
+        )
+        Auction.objects.create(
+            vehicle=vehicle,
+            status=auction_status,
+            start_time=timezone.now() - timedelta(hours=1),
+            end_time=timezone.now() + timedelta(hours=23)
+        )
+        return vehicle
+
+    def test_no_facets_by_default(self):
+        response = self.client.get('/api/vehicles/')
+
+        self.assertNotIn('facets', response.data)
+
+    def test_facets_for_filtered_result(self):
+        response = self.client.get('/api/vehicles/', {
+            'brand': self.brand_hyundai.id,
+            'facets': 'fuel_type,transmission,region,year',
+            'page_size': 1
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+
+        # 페이지가 아닌 필터 결과 전체(승인대기 제외 3대) 기준
+        facets = response.data['facets']
+        self.assertEqual(facets['fuel_type'], [
+            {'value': 'gasoline', 'label': '가솔린', 'count': 2},
+            {'value': 'hybrid', 'label': '하이브리드', 'count': 1},
+        ])
+        self.assertEqual(facets['transmission'], [
+            {'value': 'auto', 'label': '자동', 'count': 3},
+        ])
+        self.assertEqual(
+            {bucket['value']: bucket['count'] for bucket in facets['region']},
+            {'서울': 2, '부산': 1}
+        )
+        self.assertEqual(facets['year'], [
+            {'value': 2015, 'label': '2015~2019', 'count': 1},
+            {'value': 2020, 'label': '2020~2024', 'count': 2},
+        ])
+
+    def test_facets_single_grouped_query(self):
+        # count + 목록 + 패싯 1회
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/vehicles/', {'facets': 'fuel_type,region'})
+
+        self.assertEqual(set(response.data['facets']), {'fuel_type', 'region'})
+        self.assertEqual(sum(bucket['count'] for bucket in response.data['facets']['region']), 4)
+
+    def test_facets_with_cursor_pagination(self):
+        response = self.client.get('/api/vehicles/', {'pagination': 'cursor', 'facets': 'year'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('facets', response.data)
+
+    def test_invalid_facet(self):
+        response = self.client.get('/api/vehicles/', {'facets': 'fuel_type,color'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
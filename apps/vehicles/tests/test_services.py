@@ -9,10 +9,18 @@ import tempfile
 from PIL import Image
 import io
 
-from apps.vehicles.models import Brand, CarType, Model, Vehicle, VehicleImage
-from apps.vehicles.services import VehicleService, FilterService
+from django.core.management import call_command, CommandError
+
+from apps.vehicles.models import (
+    Brand, CarType, Model, Vehicle, VehicleImage, VehicleListing, ModelVehicleCount
+)
+from apps.vehicles.services import (
+    VehicleService, FilterService, FilterTreeBuilder, VehicleListingService, VehicleCountService
+)
 from apps.vehicles.dto import VehicleCreateDTO
+from apps.vehicles.catalog import get_catalog
 from apps.auctions.models import Auction
+from apps.auctions.services import AuctionService
 
 User = get_user_model()
 
@@ -150,20 +158,21 @@ class TestFilterService(TestCase):
     """필터 서비스 테스트"""
 
     def setUp(self):
-        self.hyundai = Brand.objects.create(name="현대")
-        self.kia = Brand.objects.create(name="기아")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.hyundai = Brand.objects.create(name="현대")
+            self.kia = Brand.objects.create(name="기아")
 
-        # 현대 차종
-        self.hyundai_suv = CarType.objects.create(brand=self.hyundai, name="SUV")
-        self.hyundai_sedan = CarType.objects.create(brand=self.hyundai, name="세단")
+            # 현대 차종
+            self.hyundai_suv = CarType.objects.create(brand=self.hyundai, name="SUV")
+            self.hyundai_sedan = CarType.objects.create(brand=self.hyundai, name="세단")
 
-        # 기아 차종
-        self.kia_suv = CarType.objects.create(brand=self.kia, name="SUV")
+            # 기아 차종
+            self.kia_suv = CarType.objects.create(brand=self.kia, name="SUV")
 
-        # 모델
-        self.palisade = Model.objects.create(car_type=self.hyundai_suv, name="팰리세이드")
-        self.sonata = Model.objects.create(car_type=self.hyundai_sedan, name="소나타")
-        self.sorento = Model.objects.create(car_type=self.kia_suv, name="쏘렌토")
+            # 모델
+            self.palisade = Model.objects.create(car_type=self.hyundai_suv, name="팰리세이드")
+            self.sonata = Model.objects.create(car_type=self.hyundai_sedan, name="소나타")
+            self.sorento = Model.objects.create(car_type=self.kia_suv, name="쏘렌토")
 
         self.service = FilterService()
 
@@ -228,3 +237,241 @@ class TestFilterService(TestCase):
 
         for brand in tree['brands']:
             self.assertEqual(brand['count'], 0)
+
+    def test_filter_tree_matches_orm_traversal(self):
+        Model.objects.create(car_type=self.hyundai_suv, name="싼타페", year_start=2018)
+        Model.objects.create(car_type=self.hyundai_suv, name="투싼", year_start=2015)
+        self._create_vehicle(self.palisade, Auction.Status.AUCTION_ACTIVE)
+        self._create_vehicle(self.palisade, Auction.Status.PENDING)
+        self._create_vehicle(self.sorento, Auction.Status.AUCTION_ENDED)
+
+        def visible_count(models):
+            return Vehicle.objects.filter(model__in=models).exclude(
+                auction__status=Auction.Status.PENDING
+            ).count()
+
+        expected = {'brands': [
+            {
+                'id': brand.id,
+                'name': brand.name,
+                'count': visible_count(Model.objects.filter(car_type__brand=brand)),
+                'car_types': [
+                    {
+                        'id': car_type.id,
+                        'name': car_type.name,
+                        'count': visible_count(car_type.models.all()),
+                        'models': [
+                            {'id': model.id, 'name': model.name, 'count': visible_count([model])}
+                            for model in car_type.models.order_by('id')
+                        ]
+                    }
+                    for car_type in brand.car_types.order_by('id')
+                ]
+            }
+            for brand in Brand.objects.order_by('id')
+        ]}
+
+        get_catalog()
+        with self.assertNumQueries(1):  # 카운트 (분류 데이터는 카탈로그)
+            tree = self.service.get_filter_tree()
+
+        self.assertEqual(tree, expected)
+
+    def test_builder_accepts_any_model_counts(self):
+        tree = FilterTreeBuilder().build({self.sonata.id: 3, self.sorento.id: 2})
+
+        hyundai = next(b for b in tree['brands'] if b['id'] == self.hyundai.id)
+        sedan = next(c for c in hyundai['car_types'] if c['id'] == self.hyundai_sedan.id)
+        self.assertEqual(hyundai['count'], 3)
+        self.assertEqual(sedan['count'], 3)
+        self.assertEqual(sedan['models'], [{'id': self.sonata.id, 'name': "소나타", 'count': 3}])
+
+
+class TestVehicleListingService(TestCase):
+    """차량 목록 비정규화 테이블 동기화 테스트"""
+
+    def setUp(self):
+        self.admin_user = User.objects.create_user(
+            username='admintest_listing',
+            password='admin123',
+            is_staff=True
+        )
+        self.brand = Brand.objects.create(name="현대")
+        self.car_type = CarType.objects.create(brand=self.brand, name="SUV")
+        self.model = Model.objects.create(car_type=self.car_type, name="싼타페")
+
+        self.vehicle_service = VehicleService()
+        self.auction_service = AuctionService()
+
+    def _create_pending_vehicle(self):
+        dto = VehicleCreateDTO(
+            model_id=self.model.id,
+            year=2022,
+            first_registration_date=date(2022, 3, 10),
+            color='검정',
+            fuel_type='diesel',
+            transmission='manual',
+            mileage=20000,
+            region='부산',
+            images=[]
+        )
+        vehicle = self.vehicle_service.create_vehicle(dto)
+        VehicleImage.objects.create(vehicle=vehicle, image='primary.jpg', is_primary=True)
+        VehicleImage.objects.create(vehicle=vehicle, image='other.jpg', is_primary=False)
+        return vehicle
+
+    def test_pending_vehicle_is_not_listed(self):
+        vehicle = self._create_pending_vehicle()
+
+        self.assertFalse(VehicleListing.objects.filter(vehicle=vehicle).exists())
+
+    def test_approve_creates_listing(self):
+        vehicle = self._create_pending_vehicle()
+
+        self.auction_service.approve_auction(vehicle.id, self.admin_user)
+
+        listing = VehicleListing.objects.get(vehicle=vehicle)
+        vehicle.refresh_from_db()
+        self.assertEqual(listing.status, Auction.Status.AUCTION_ACTIVE)
+        self.assertEqual(listing.start_time, vehicle.auction.start_time)
+        self.assertEqual(listing.end_time, vehicle.auction.end_time)
+        self.assertEqual(listing.brand_id, self.brand.id)
+        self.assertEqual(listing.brand_name, "현대")
+        self.assertEqual(listing.car_type_name, "SUV")
+        self.assertEqual(listing.model_name, "싼타페")
+        self.assertEqual(listing.transmission, 'manual')
+        self.assertEqual(listing.thumbnail.name, 'primary.jpg')
+
+    def test_status_transitions_update_listing(self):
+        vehicle = self._create_pending_vehicle()
+        self.auction_service.approve_auction(vehicle.id, self.admin_user)
+        Auction.objects.filter(vehicle=vehicle).update(end_time=timezone.now() - timedelta(minutes=1))
+
+        self.auction_service.check_and_end_expired_auctions()
+        self.assertEqual(
+            VehicleListing.objects.get(vehicle=vehicle).status,
+            Auction.Status.AUCTION_ENDED
+        )
+
+        self.auction_service.complete_transaction(vehicle.id, self.admin_user)
+        self.assertEqual(
+            VehicleListing.objects.get(vehicle=vehicle).status,
+            Auction.Status.TRANSACTION_COMPLETE
+        )
+
+    def test_taxonomy_rename_updates_listing(self):
+        vehicle = self._create_pending_vehicle()
+        self.auction_service.approve_auction(vehicle.id, self.admin_user)
+
+        self.model.name = "더 뉴 싼타페"
+        self.model.save()
+
+        self.assertEqual(VehicleListing.objects.get(vehicle=vehicle).model_name, "더 뉴 싼타페")
+
+    def test_sync_vehicles_removes_hidden_vehicle(self):
+        vehicle = self._create_pending_vehicle()
+        self.auction_service.approve_auction(vehicle.id, self.admin_user)
+
+        Auction.objects.filter(vehicle=vehicle).update(status=Auction.Status.PENDING)
+        VehicleListingService().sync_vehicles([vehicle.id])
+
+        self.assertFalse(VehicleListing.objects.filter(vehicle=vehicle).exists())
+
+
+class TestVehicleCountService(TestCase):
+    """모델별 공개 차량 수 테이블 테스트"""
+
+    def setUp(self):
+        self.admin_user = User.objects.create_user(
+            username='admintest_counts',
+            password='admin123',
+            is_staff=True
+        )
+        self.brand = Brand.objects.create(name="기아")
+        self.car_type = CarType.objects.create(brand=self.brand, name="세단")
+        self.model = Model.objects.create(car_type=self.car_type, name="K5")
+        self.other_model = Model.objects.create(car_type=self.car_type, name="K8")
+
+        self.service = VehicleCountService()
+        self.auction_service = AuctionService()
+
+    def _create_vehicle(self, model, status=Auction.Status.PENDING):
+        vehicle = Vehicle.objects.create(
+            model=model,
+            year=2023,
+            first_registration_date=timezone.now().date() - timedelta(days=30),
+            color='검정',
+            fuel_type=Vehicle.FuelType.GASOLINE,
+            transmission=Vehicle.Transmission.AUTO,
+            mileage=5000,
+            region='서울'
+        )
+        Auction.objects.create(vehicle=vehicle, status=status)
+        return vehicle
+
+    def _count(self, model):
+        return ModelVehicleCount.objects.get(model=model).vehicle_count
+
+    def test_new_model_gets_zero_count_row(self):
+        row = ModelVehicleCount.objects.get(model=self.model)
+
+        self.assertEqual(row.vehicle_count, 0)
+        self.assertEqual(row.car_type_id, self.car_type.id)
+        self.assertEqual(row.brand_id, self.brand.id)
+
+    def test_pending_vehicle_does_not_count(self):
+        self._create_vehicle(self.model)
+
+        self.assertEqual(self._count(self.model), 0)
+
+    def test_approve_increments_and_later_transitions_keep_count(self):
+        vehicle = self._create_vehicle(self.model)
+
+        self.auction_service.approve_auction(vehicle.id, self.admin_user)
+        self.assertEqual(self._count(self.model), 1)
+
+        Auction.objects.filter(vehicle=vehicle).update(end_time=timezone.now() - timedelta(minutes=1))
+        self.auction_service.check_and_end_expired_auctions()
+        self.auction_service.complete_transaction(vehicle.id, self.admin_user)
+        self.assertEqual(self._count(self.model), 1)
+
+    def test_model_change_moves_count(self):
+        vehicle = self._create_vehicle(self.model, Auction.Status.AUCTION_ENDED)
+
+        vehicle.model = self.other_model
+        vehicle.save()
+
+        self.assertEqual(self._count(self.model), 0)
+        self.assertEqual(self._count(self.other_model), 1)
+
+    def test_auction_delete_decrements(self):
+        vehicle = self._create_vehicle(self.model, Auction.Status.AUCTION_ENDED)
+
+        vehicle.auction.delete()
+
+        self.assertEqual(self._count(self.model), 0)
+
+    def test_verify_and_rebuild(self):
+        self._create_vehicle(self.model, Auction.Status.AUCTION_ACTIVE)
+        self._create_vehicle(self.model, Auction.Status.TRANSACTION_COMPLETE)
+        ModelVehicleCount.objects.filter(model=self.model).update(vehicle_count=7)
+
+        mismatches = self.service.verify()
+        self.assertEqual(
+            mismatches,
+            [{'model_id': self.model.id, 'expected': 2, 'stored': 7}]
+        )
+
+        self.service.rebuild()
+        self.assertEqual(self.service.verify(), [])
+        self.assertEqual(self._count(self.model), 2)
+
+    def test_rebuild_command(self):
+        self._create_vehicle(self.model, Auction.Status.AUCTION_ACTIVE)
+        ModelVehicleCount.objects.filter(model=self.model).update(vehicle_count=0)
+
+        with self.assertRaises(CommandError):
+            call_command('rebuild_model_counts', '--verify-only', stdout=io.StringIO())
+
+        call_command('rebuild_model_counts', stdout=io.StringIO())
+        self.assertEqual(self._count(self.model), 1)
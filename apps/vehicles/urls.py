@@ -3,12 +3,26 @@ from apps.vehicles.views import (
     VehicleListView,
     VehicleCreateView,
     VehicleDetailView,
-    VehicleFilterView
+    VehicleFilterView,
+    FilterBrandListView,
+    FilterCarTypeListView,
+    FilterModelListView
 )
 
 urlpatterns = [
     path('', VehicleListView.as_view(), name='vehicle-list'),
     path('create/', VehicleCreateView.as_view(), name='vehicle-create'),
     path('filters/', VehicleFilterView.as_view(), name='vehicle-filters'),
+    path('filters/brands/', FilterBrandListView.as_view(), name='vehicle-filter-brands'),
+    path(
+        'filters/brands/<int:brand_id>/car-types/',
+        FilterCarTypeListView.as_view(),
+        name='vehicle-filter-car-types'
+    ),
+    path(
+        'filters/car-types/<int:car_type_id>/models/',
+        FilterModelListView.as_view(),
+        name='vehicle-filter-models'
+    ),
     path('<int:pk>/', VehicleDetailView.as_view(), name='vehicle-detail')
 ]
\ No newline at end of file
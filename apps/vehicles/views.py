@@ -1,60 +1,114 @@
 from django.core.exceptions import ValidationError
 from rest_framework import status
-from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.exceptions import NotFound, ParseError, PermissionDenied
 from rest_framework.views import APIView
 from rest_framework.generics import RetrieveAPIView, ListAPIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.parsers import MultiPartParser, FormParser
 
-from apps.vehicles.models import Vehicle, Model
+from apps.vehicles.models import Brand, CarType, Vehicle, VehicleListing, Model
 from apps.vehicles.serializers import (
     VehicleCreateSerializer,
     VehicleDetailSerializer,
     VehicleListSerializer,
-    FilterTreeSerializer
+    FilterBrandListSerializer,
+    FilterBrandCarTypesSerializer,
+    FilterCarTypeModelsSerializer
 )
-from apps.vehicles.services import VehicleService, FilterService
-from apps.vehicles.pagination import VehicleListPagination
+from apps.vehicles.services import VehicleService, FilterService, VehicleFacetService
+from apps.vehicles.pagination import VehicleListPagination, VehicleCursorPagination
+from apps.vehicles import bitmap
 from apps.auctions.models import Auction
+from apps.common.responses import PrerenderedJSONResponse
+from apps.accounts.authentication import StatelessJWTAuthentication
 
 class VehicleListView(ListAPIView):
 
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [IsAuthenticated]
     serializer_class = VehicleListSerializer
     pagination_class = VehicleListPagination
+    cursor_pagination_class = VehicleCursorPagination
+    sort_descending = True
 
-    def get_queryset(self):
+    def list(self, request, *args, **kwargs):
+        try:
+            facets = VehicleFacetService().parse_facets(request.query_params.get('facets'))
+        except ValidationError as e:
+            raise ParseError(e.messages[0])
 
-        queryset = Vehicle.objects.exclude(
-            auction__status=Auction.Status.PENDING
-        ).select_related(
-            'model__car_type__brand',
-            'auction'
-        ).prefetch_related(
-            'images'
-        )
+        response = super().list(request, *args, **kwargs)
+
+        # 요청한 경우에만 현재 필터 결과 전체에 대한 패싯 카운트를 함께 반환
+        if facets:
+            response.data['facets'] = VehicleFacetService().count_facets(
+                self.filter_queryset(self.get_queryset()),
+                facets
+            )
+        return response
+
+    @property
+    def paginator(self):
+        """`pagination=cursor` 또는 `cursor` 파라미터가 있으면 커서 페이지네이션 사용"""
+        if not hasattr(self, '_paginator'):
+            query_params = self.request.query_params
+            if query_params.get('pagination') == 'cursor' or 'cursor' in query_params:
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
+    def get_queryset(self):
 
         # 필터 파라미터 처리
         brand_id = self.request.query_params.get('brand', None)
         car_type_id = self.request.query_params.get('car_type', None)
         model_id = self.request.query_params.get('model', None)
 
+        # 정렬 파라미터 처리 (기본값: 경매시작 최신순)
+        ALLOWED_SORTS = {
+            '-auction__start_time': ('-start_time', '-vehicle_id'),
+            'auction__start_time': ('start_time', 'vehicle_id'),
+        }
+        sort_param = self.request.query_params.get('sort', '-auction__start_time')
+        if sort_param in ALLOWED_SORTS:
+            self.sort_descending = sort_param.startswith('-')
+
+        # 비트맵 인덱스 사용 시 필터/카운트는 메모리에서, SQL 은 페이지 행 조회에만 사용
+        # (커서 페이지네이션은 keyset 조건으로 인덱스를 타므로 그대로 SQL)
+        if bitmap.is_enabled() and not isinstance(self.paginator, VehicleCursorPagination):
+            return self._get_bitmap_query(brand_id=brand_id, car_type_id=car_type_id, model_id=model_id)
+
+        # 공개 차량만 저장된 비정규화 테이블에서 조인 없이 조회
+        queryset = VehicleListing.objects.all()
+
         if brand_id:
-            queryset = queryset.filter(model__car_type__brand_id=brand_id)
+            queryset = queryset.filter(brand_id=brand_id)
         if car_type_id:
-            queryset = queryset.filter(model__car_type_id=car_type_id)
+            queryset = queryset.filter(car_type_id=car_type_id)
         if model_id:
             queryset = queryset.filter(model_id=model_id)
 
-        # 정렬 파라미터 처리 (기본값: 경매시작 최신순)
-        ALLOWED_SORTS = ['-auction__start_time', 'auction__start_time']
-        sort_param = self.request.query_params.get('sort', '-auction__start_time')
         if sort_param in ALLOWED_SORTS:
-            queryset = queryset.order_by(sort_param)
+            queryset = queryset.order_by(*ALLOWED_SORTS[sort_param])
 
         return queryset
 
+    def _get_bitmap_query(self, **params):
+        index = bitmap.get_index()
+
+        conditions = {}
+        for field, value in params.items():
+            if not value:
+                continue
+            try:
+                conditions[field] = int(value)
+            except ValueError:
+                return bitmap.BitmapListingQuery(index, bitmap.Bitmap(), self.sort_descending)
+
+        return bitmap.BitmapListingQuery(index, index.filter(**conditions), self.sort_descending)
+
 
 class VehicleCreateView(APIView):
 
@@ -99,12 +153,13 @@ class VehicleCreateView(APIView):
 
 
 class VehicleDetailView(RetrieveAPIView):
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [IsAuthenticated]
     serializer_class = VehicleDetailSerializer
 
     def get_queryset(self):
+        # 브랜드/차종/모델은 시리얼라이저에서 분류 카탈로그로 조회
         return Vehicle.objects.select_related(
-            'model__car_type__brand',
             'auction'
         ).prefetch_related(
             'images'
@@ -129,6 +184,7 @@ class VehicleDetailView(RetrieveAPIView):
 
 
 class VehicleFilterView(APIView):
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     def __init__(self):
@@ -138,11 +194,77 @@ class VehicleFilterView(APIView):
 
     def get(self, request):
 
-        filter_tree = self.filter_service.get_filter_tree()
+        # 캐시에 저장된 렌더링 결과를 그대로 응답
+        content = self.filter_service.get_filter_tree_json()
 
-        serializer = FilterTreeSerializer(filter_tree)
+        return PrerenderedJSONResponse(
+            content,
+            status=status.HTTP_200_OK
+        )
+
+
+class FilterLevelView(APIView):
+    """
+    필터 트리 단계별 조회 공통
+
+    `min_count` 미만인 노드는 제외한다. (기본값 0: 모두 포함)
+    """
+    authentication_classes = [StatelessJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def __init__(self):
+        super().__init__()
+        self.filter_service = FilterService()
+
+    def get_min_count(self, request) -> int:
+        value = request.query_params.get('min_count', 0)
+        try:
+            min_count = int(value)
+        except (TypeError, ValueError):
+            raise ParseError('min_count 는 0 이상의 정수여야 합니다.')
+        if min_count < 0:
+            raise ParseError('min_count 는 0 이상의 정수여야 합니다.')
+        return min_count
+
+
+class FilterBrandListView(FilterLevelView):
+
+    def get(self, request):
+        brands = self.filter_service.get_brands(self.get_min_count(request))
+
+        return Response(
+            FilterBrandListSerializer(brands).data,
+            status=status.HTTP_200_OK
+        )
+
+
+class FilterCarTypeListView(FilterLevelView):
+
+    def get(self, request, brand_id):
+        min_count = self.get_min_count(request)
+
+        try:
+            brand = self.filter_service.get_car_types(brand_id, min_count)
+        except Brand.DoesNotExist:
+            raise NotFound(detail="존재하지 않는 브랜드입니다.")
+
+        return Response(
+            FilterBrandCarTypesSerializer(brand).data,
+            status=status.HTTP_200_OK
+        )
+
+
+class FilterModelListView(FilterLevelView):
+
+    def get(self, request, car_type_id):
+        min_count = self.get_min_count(request)
+
+        try:
+            car_type = self.filter_service.get_models(car_type_id, min_count)
+        except CarType.DoesNotExist:
+            raise NotFound(detail="존재하지 않는 차종입니다.")
 
         return Response(
-            serializer.data,
+            FilterCarTypeModelsSerializer(car_type).data,
             status=status.HTTP_200_OK
-        )
\ No newline at end of file
+        )
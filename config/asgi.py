@@ -1,5 +1,8 @@
 """
 ASGI config for vehicle auction project.
+
+비동기 뷰(경매 상태 구독 AuctionStatusStreamView, 비동기 로그인 AsyncLoginView)는 이 애플리케이션으로 실행한다.
+    uvicorn config.asgi:application --port 8000
 """
 
 import os
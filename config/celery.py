@@ -21,10 +21,21 @@ app.autodiscover_tasks()
 
 # Scheduled tasks (Celery Beat)
 app.conf.beat_schedule = {
-    # 1분마다 경매 종료 체크
+    # 경매 종료는 run_auction_timer 가 종료 시각에 처리하고,
+    # 타이머 중단/Redis 유실로 남은 경매만 10분마다 정리
     'check-expired-auctions': {
         'task': 'apps.auctions.tasks.check_expired_auctions',
-        'schedule': crontab(minute='*/1'),  # 1분마다 실행
+        'schedule': crontab(minute='*/10'),  # 10분마다 실행
+    },
+    # 승인/종료 시 증감으로 유지하는 종료 예정 분포를 매시간 DB 기준으로 보정
+    'rebuild-expiry-forecast': {
+        'task': 'apps.auctions.tasks.rebuild_expiry_forecast',
+        'schedule': crontab(minute=5),
+    },
+    # 로그인 요청에서는 last_login 을 UPDATE 하지 않고 모아 두었다가 1분마다 반영
+    'flush-last-logins': {
+        'task': 'apps.accounts.tasks.flush_last_logins',
+        'schedule': crontab(),
     }
 }
 
@@ -37,7 +37,7 @@ INSTALLED_APPS = [
     # Third party apps
     'rest_framework',
     'rest_framework_simplejwt',
-    #'rest_framework_simplejwt.token_blacklist',  # 토큰 블랙리스트 기능, 로그아웃 구현하지 않아 주석처리
+    #'rest_framework_simplejwt.token_blacklist',  # 토큰 블랙리스트는 Redis 로 대체 (apps.accounts.tokens)
     'django_celery_beat',  # Celery Beat 스케줄러
     # 'corsheaders',
 
@@ -86,6 +86,11 @@ DATABASES = {
 
 # Cache
 # Redis configuration
+REDIS_URL = config('REDIS_URL', default='redis://localhost:6379/1')
+
+# 입찰 상태(현재가/순번/ladder)와 입찰 stream 전용 Redis
+# 캐시와 달리 키가 밀려나면 안 되므로 maxmemory-policy noeviction 인스턴스를 사용 (docker-compose 의 redis-auction)
+AUCTION_REDIS_URL = config('AUCTION_REDIS_URL', default='redis://localhost:6380/0')
 
 # Test 환경에서는 로컬 메모리 캐시 사용
 if 'test' in sys.argv:
@@ -99,7 +104,7 @@ else:
     CACHES = {
         'default': {
             'BACKEND': 'django_redis.cache.RedisCache',
-            'LOCATION': config('REDIS_URL', default='redis://localhost:6379/1'),
+            'LOCATION': REDIS_URL,
             'OPTIONS': {
                 'CLIENT_CLASS': 'django_redis.client.DefaultClient',
             },
@@ -109,6 +114,11 @@ else:
     }
 
 
+# 공개 차량 비트맵 인덱스 (프로세스 내 메모리) 사용 여부
+# 차량 목록 필터/카운트/패싯과 필터 트리 카운트를 비트맵으로 계산
+VEHICLE_BITMAP_INDEX_ENABLED = config('VEHICLE_BITMAP_INDEX_ENABLED', default=False, cast=bool)
+
+
 # Celery Configuration
 
 CELERY_BROKER_URL = config('CELERY_BROKER_URL', default='redis://localhost:6379/0')
@@ -219,7 +229,7 @@ from datetime import timedelta
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.accounts.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -235,6 +245,8 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     'EXCEPTION_HANDLER': 'apps.common.exceptions.custom_exception_handler',
+    # 앞단 프록시 수, 클라이언트 IP 를 X-Forwarded-For 에서 찾을 때 사용 (throttle, 로그인 시도 제한)
+    'NUM_PROXIES': config('NUM_PROXIES', default=None, cast=lambda value: int(value) if value else None),
 }
 
 # Simple JWT settings
@@ -242,8 +254,8 @@ SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=30),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': True,  # Refresh 토큰 갱신 시 새 토큰 발급
-    'BLACKLIST_AFTER_ROTATION': True,  # 이전 Refresh 토큰 블랙리스트 처리
-    'UPDATE_LAST_LOGIN': True,  # 로그인 시 last_login 업데이트
+    'BLACKLIST_AFTER_ROTATION': True,  # 이전 Refresh 토큰 블랙리스트 처리 (RefreshTokenBlacklist, Redis)
+    'UPDATE_LAST_LOGIN': False,  # last_login 은 LastLoginBuffer 로 모아서 반영 (flush_last_logins)
 
     'ALGORITHM': 'HS256',
     'SIGNING_KEY': SECRET_KEY,
@@ -265,4 +277,14 @@ SIMPLE_JWT = {
     'SLIDING_TOKEN_LIFETIME': timedelta(minutes=5),
     'SLIDING_TOKEN_REFRESH_LIFETIME': timedelta(days=1),
 }
+
+# 사용자 행이 필요한 인증 경로(CachedJWTAuthentication)의 사용자 캐시 시간 (0 이면 캐시하지 않음)
+# 조회 API 와 관리자 권한 확인은 StatelessJWTAuthentication 으로 사용자 테이블을 조회하지 않음
+ACCOUNTS_USER_CACHE_SECONDS = config('ACCOUNTS_USER_CACHE_SECONDS', default=60, cast=int)
+
+# 서명 검증을 마친 access 토큰을 프로세스별로 보관할 최대 개수 (0 이면 매 요청 검증)
+ACCOUNTS_TOKEN_CACHE_SIZE = config('ACCOUNTS_TOKEN_CACHE_SIZE', default=10000, cast=int)
+
+# 비동기 로그인(ASGI)에서 비밀번호 해시를 동시에 계산할 스레드 수
+LOGIN_HASH_WORKERS = config('LOGIN_HASH_WORKERS', default=4, cast=int)
 # CORS_ALLOW_CREDENTIALS = True
\ No newline at end of file
@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+"""
+필터 트리 생성 방식별 성능 비교 스크립트
+
+기존 방식(브랜드/차종/모델 각각 차량 조인 후 Count 집계 + ORM 객체 중첩 순회)과
+FilterTreeBuilder(모델별 카운트 1회 + values_list 단일 패스)를 비교한다.
+
+- 분류 데이터가 없으면 엑셀 파일(브랜드,차종,모델.xlsx)에서 먼저 임포트
+- 벤치마크용 차량/경매를 bulk_create 로 생성 (기본 100만 대)
+- 세 방식의 결과(노드와 카운트)가 동일한지 검증 후 소요 시간 출력
+- 종료 시 벤치마크 데이터 삭제 (--keep 지정 시 유지, 이 경우 vehicle_listings 에는 반영되지 않음)
+
+사용법:
+    python scripts/benchmark_filter_tree.py
+    python scripts/benchmark_filter_tree.py --vehicles 100000 --repeat 3
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+import django
+from pathlib import Path
+
+# Django 설정
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+django.setup()
+
+from django.db import connection, transaction
+from django.db.models import Count, Q, Prefetch, Max
+from django.utils import timezone
+from apps.vehicles.models import Brand, CarType, Model, Vehicle
+from apps.vehicles.services import FilterService, FilterTreeBuilder, VehicleCountService
+from apps.auctions.models import Auction
+
+# 벤치마크 데이터 식별용 색상 값
+BENCHMARK_COLOR = '__benchmark__'
+BATCH_SIZE = 10000
+
+STATUS_WEIGHTS = [
+    (Auction.Status.PENDING, 0.1),
+    (Auction.Status.AUCTION_ACTIVE, 0.35),
+    (Auction.Status.AUCTION_ENDED, 0.2),
+    (Auction.Status.TRANSACTION_COMPLETE, 0.35),
+]
+
+
+def legacy_filter_tree():
+    """기존 FilterService.get_filter_tree 구현 (비교 기준)"""
+    models_with_count = Model.objects.annotate(
+        vehicle_count=Count(
+            'vehicle',
+            filter=~Q(vehicle__auction__status=Auction.Status.PENDING)
+        )
+    ).select_related('car_type__brand')
+
+    car_types_with_count = CarType.objects.annotate(
+        vehicle_count=Count(
+            'models__vehicle',
+            filter=~Q(models__vehicle__auction__status=Auction.Status.PENDING)
+        )
+    ).select_related('brand').prefetch_related(
+        Prefetch('models', queryset=models_with_count)
+    )
+
+    brands = Brand.objects.annotate(
+        vehicle_count=Count(
+            'car_types__models__vehicle',
+            filter=~Q(car_types__models__vehicle__auction__status=Auction.Status.PENDING)
+        )
+    ).prefetch_related(
+        Prefetch('car_types', queryset=car_types_with_count)
+    )
+
+    result = {'brands': []}
+    for brand in brands:
+        brand_data = {'id': brand.id, 'name': brand.name, 'count': brand.vehicle_count, 'car_types': []}
+        for car_type in brand.car_types.all():
+            car_type_data = {'id': car_type.id, 'name': car_type.name, 'count': car_type.vehicle_count, 'models': []}
+            for model in car_type.models.all():
+                car_type_data['models'].append(
+                    {'id': model.id, 'name': model.name, 'count': model.vehicle_count}
+                )
+            brand_data['car_types'].append(car_type_data)
+        result['brands'].append(brand_data)
+
+    return result
+
+
+def builder_from_source():
+    """FilterTreeBuilder + 원본 테이블 GROUP BY model_id 1회"""
+    return FilterTreeBuilder().build(VehicleCountService().count_from_source())
+
+
+def builder_from_count_table():
+    """FilterTreeBuilder + model_vehicle_counts (현재 FilterService)"""
+    return FilterService().get_filter_tree()
+
+
+def ensure_taxonomy():
+    if Model.objects.exists():
+        return True
+
+    print("[INFO] 분류 데이터가 없어 엑셀 파일에서 임포트합니다.")
+    from scripts.import_brands import import_brand_data
+    return import_brand_data()
+
+
+def generate_vehicles(count):
+    """벤치마크용 차량/경매 bulk 생성 (시그널을 거치지 않음)"""
+    model_ids = list(Model.objects.values_list('id', flat=True))
+    statuses = [item[0] for item in STATUS_WEIGHTS]
+    weights = [item[1] for item in STATUS_WEIGHTS]
+    today = timezone.now().date()
+
+    created = 0
+    started = time.perf_counter()
+    while created < count:
+        size = min(BATCH_SIZE, count - created)
+        with transaction.atomic():
+            last_id = Vehicle.objects.aggregate(last_id=Max('id'))['last_id'] or 0
+            Vehicle.objects.bulk_create([
+                Vehicle(
+                    model_id=random.choice(model_ids),
+                    year=random.randint(today.year - 15, today.year),
+                    first_registration_date=today,
+                    color=BENCHMARK_COLOR,
+                    fuel_type=random.choice(Vehicle.FuelType.values),
+                    transmission=random.choice(Vehicle.Transmission.values),
+                    mileage=random.randint(0, 200000),
+                    region='서울'
+                )
+                for _ in range(size)
+            ])
+
+            # MySQL 은 bulk_create 시 PK 를 돌려주지 않으므로 방금 생성한 구간을 PK 범위로 다시 조회
+            vehicle_ids = Vehicle.objects.filter(
+                id__gt=last_id,
+                color=BENCHMARK_COLOR
+            ).values_list('id', flat=True)
+            Auction.objects.bulk_create([
+                Auction(vehicle_id=vehicle_id, status=random.choices(statuses, weights)[0])
+                for vehicle_id in vehicle_ids
+            ])
+
+        created += size
+        print(f"  생성 {created:,}/{count:,} ({time.perf_counter() - started:.1f}s)")
+
+
+def cleanup():
+    """벤치마크 데이터 삭제 (시그널 없이 SQL 로 직접 삭제)"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "DELETE FROM auctions WHERE vehicle_id IN (SELECT id FROM vehicles WHERE color = %s)",
+            [BENCHMARK_COLOR]
+        )
+        cursor.execute("DELETE FROM vehicles WHERE color = %s", [BENCHMARK_COLOR])
+
+
+def normalize(tree):
+    """
+    정렬 순서를 제외한 비교용 트리
+
+    기존 방식은 집계 쿼리라 Meta.ordering 이 적용되지 않아 순서가 DB 실행 계획에 따라 달라진다.
+    (MySQL 은 보통 PK 순, SQLite 는 GROUP BY 에 사용한 인덱스 순)
+    """
+    return sorted(
+        (
+            brand['id'], brand['name'], brand['count'],
+            sorted(
+                (
+                    car_type['id'], car_type['name'], car_type['count'],
+                    sorted((model['id'], model['name'], model['count']) for model in car_type['models'])
+                )
+                for car_type in brand['car_types']
+            )
+        )
+        for brand in tree['brands']
+    )
+
+
+def measure(func, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    return result, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='필터 트리 생성 성능 비교')
+    parser.add_argument('--vehicles', type=int, default=1000000, help='생성할 벤치마크 차량 수')
+    parser.add_argument('--repeat', type=int, default=5, help='방식별 반복 측정 횟수')
+    parser.add_argument('--keep', action='store_true', help='벤치마크 데이터를 삭제하지 않음')
+    args = parser.parse_args()
+
+    print("="*50)
+    print("[INFO] 필터 트리 벤치마크")
+    print("="*50)
+
+    if not ensure_taxonomy():
+        sys.exit(1)
+
+    print(f"[INFO] 브랜드 {Brand.objects.count()}개, 차종 {CarType.objects.count()}개, "
+          f"모델 {Model.objects.count()}개")
+    print(f"[INFO] 벤치마크 차량 {args.vehicles:,}대 생성")
+    generate_vehicles(args.vehicles)
+
+    try:
+        # bulk 생성분은 시그널을 거치지 않으므로 카운트 테이블 재생성
+        VehicleCountService().rebuild()
+
+        candidates = [
+            ('기존 (Count 집계 3회 + 중첩 순회)', legacy_filter_tree),
+            ('단일 패스 (원본 GROUP BY 1회)', builder_from_source),
+            ('단일 패스 (model_vehicle_counts)', builder_from_count_table),
+        ]
+
+        results = []
+        for name, func in candidates:
+            tree, timings = measure(func, args.repeat)
+            results.append((name, tree, timings))
+
+        baseline_tree = normalize(results[0][1])
+        baseline_median = statistics.median(results[0][2])
+
+        print("\n" + "="*50)
+        for name, tree, timings in results:
+            median = statistics.median(timings)
+            same = '동일' if normalize(tree) == baseline_tree else '불일치'
+            print(f"{name}")
+            print(f"  - median {median * 1000:.1f}ms, min {min(timings) * 1000:.1f}ms, "
+                  f"x{baseline_median / median:.1f}, 결과 {same}")
+        print("="*50)
+
+        if any(normalize(tree) != baseline_tree for _, tree, _ in results):
+            print("[ERROR] 결과가 기존 방식과 다릅니다.")
+            sys.exit(1)
+
+    finally:
+        if not args.keep:
+            print("[INFO] 벤치마크 데이터 삭제")
+            cleanup()
+            VehicleCountService().rebuild()
+
+
+if __name__ == '__main__':
+    main()